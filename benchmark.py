@@ -0,0 +1,345 @@
+"""Telemetri sıcak yolları için başsız (headless) benchmark takımı.
+
+Kullanım: python benchmark.py [--quick] [--only decode,merge,encode,judge,ui] [--json sonuç.json] [--compare eski.json]
+
+Ölçülenler:
+  decode  parse_telemetry_packet üzerinden kaynak/biçim başına satır/s (ana sistem JSON, görev yükü JSON, ikili çerçeve)
+  merge   iki kaynağın görüntü alanlarında birleştirilmesi ve tablo modeli güncellemesi
+  encode  create_hyi_packet ve HyiEncoder paket/s (eski algoritmayla bayt bayt doğrulanır)
+  judge   1-10 Hz hakem timer'ının aralık sapması (jitter)
+  ui      QML tablosu yüklüyken telemetry_data_changed yenilemesi başına maliyet
+
+Qt, QT_QPA_PLATFORM=offscreen ile ekransız çalışır. --json ile sonuçlar sürümler arası karşılaştırma için
+kaydedilir; --compare önceki bir JSON dosyasıyla oranları yazdırır.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import struct
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+os.environ.setdefault('QT_QUICK_BACKEND', 'software')
+
+from PyQt5.QtCore import QT_VERSION_STR, QTimer
+from PyQt5.QtWidgets import QApplication
+
+import main
+from main import HyiEncoder, SerialManager, FlightSimulator, BINARY_SCHEMAS
+
+SUITES = ('decode', 'merge', 'encode', 'judge', 'ui')
+
+
+def legacy_create_hyi_packet(team_id, packet_counter, values, status):
+    """Eski create_hyi_packet algoritması (17 ayrı struct.pack + dilim ataması + sum checksum)"""
+    packet = bytearray(78)
+    packet[0] = 0xFF
+    packet[1] = 0xFF
+    packet[2] = 0x54
+    packet[3] = 0x52
+    packet[4] = team_id & 0xFF
+    packet[5] = packet_counter & 0xFF
+    offset = 6
+    for value in values:
+        packet[offset:offset + 4] = struct.pack('<f', value)
+        offset += 4
+    packet[74] = status & 0xFF
+    packet[75] = sum(packet[4:75]) % 256
+    packet[76] = 0x0D
+    packet[77] = 0x0A
+    return packet
+
+
+def random_frames(count, seed=111):
+    rng = random.Random(seed)
+    frames = []
+    for i in range(count):
+        values = tuple(rng.uniform(-1e5, 1e5) for _ in range(HyiEncoder.FLOAT_COUNT))
+        frames.append((i, values, rng.randrange(0, 512)))
+    return frames
+
+
+def verify(frames, team_id=42):
+    encoder = HyiEncoder()
+    for counter, values, status in frames:
+        expected = legacy_create_hyi_packet(team_id, counter, values, status)
+        if bytes(encoder.encode(team_id, counter, values, status)) != expected:
+            raise AssertionError(f"Paket {counter} eski çıktıyla eşleşmiyor")
+    batch = encoder.encode_many(team_id, frames)
+    expected = b''.join(legacy_create_hyi_packet(team_id, c, v, s) for c, v, s in frames)
+    if bytes(batch) != expected:
+        raise AssertionError("Toplu kodlama eski çıktıyla eşleşmiyor")
+
+
+def measure(label, func, count, unit='paket/s'):
+    """func() çağrısının süresini ölçer; saniye başına işlem ve işlem başına µs döndürür"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"  {label:<32} {rate:>12,.0f} {unit}  ({elapsed * 1e6 / count:.2f} µs)")
+    return {'per_s': round(rate, 1), 'us_per_op': round(elapsed * 1e6 / count, 3)}
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def synthetic_lines(count, seed=111):
+    """Simülatörle aynı uçuştan ana sistem JSON, görev yükü JSON ve ikili çerçeve satırları üretir"""
+    sim = FlightSimulator(noise=1.0, seed=seed)
+    times = [sim.cycle * i / count for i in range(count)]
+    main_samples = [sim.main_sample(t) for t in times]
+    payload_samples = [sim.payload_sample(t) for t in times]
+    return {
+        'anakart_json': [sim.main_json(s).rstrip(b'\n') for s in main_samples],
+        'gorev_yuku_json': [sim.payload_json(s).rstrip(b'\n') for s in payload_samples],
+        'anakart_binary': [BINARY_SCHEMAS[0x01].encode(s) for s in main_samples],
+        'gorev_yuku_binary': [BINARY_SCHEMAS[0x52].encode(s) for s in payload_samples],
+    }
+
+
+def bench_decode(manager, count):
+    print(f"decode: parse_telemetry_packet ({main.JSON_BACKEND})")
+    results = {}
+    for name, lines in synthetic_lines(count).items():
+        parse = manager.parse_telemetry_packet
+
+        def run():
+            for line in lines:
+                parse(line)
+        results[name] = measure(name, run, count, 'satır/s')
+    return results
+
+
+def bench_merge(manager, count):
+    print("merge: örnek uygulama + alan birleştirme + tablo modeli")
+    lines = synthetic_lines(count)
+    decode = main.decode_telemetry_packet
+    pairs = list(zip([decode(l) for l in lines['anakart_json']], [decode(l) for l in lines['gorev_yuku_json']]))
+    apply = manager.apply_telemetry_sample
+    samples = {}
+
+    def run_fields():
+        for ana, gorev in pairs:
+            apply(ana, emit=False)
+            apply(gorev, emit=False)
+            manager.telemetry_data['fields']['İrtifa']
+
+    def run_model():
+        update = manager.table_model.update_fields
+        for ana, gorev in pairs:
+            apply(ana, emit=False)
+            apply(gorev, emit=False)
+            samples['anakart'], samples['gorev_yuku'] = ana, gorev
+            update(manager.telemetry_data['fields'], samples)
+
+    return {
+        'fields': measure('alan birleştirme', run_fields, count, 'çift/s'),
+        'table_model': measure('alan + tablo modeli', run_model, count, 'çift/s'),
+    }
+
+
+def bench_encode(manager, count):
+    print("encode: HYİ hakem paketi")
+    frames = random_frames(count)
+    verify(frames[:5000])
+    print(f"  ✅ {min(count, 5000)} paket eski create_hyi_packet çıktısıyla bayt bayt aynı")
+    encoder = HyiEncoder()
+
+    def run_legacy():
+        for counter, values, status in frames:
+            legacy_create_hyi_packet(42, counter, values, status)
+
+    def run_create():
+        create = manager.create_hyi_packet
+        for counter, values, status in frames:
+            create(counter, *values, status)
+
+    def run_encoder():
+        encode = encoder.encode
+        for counter, values, status in frames:
+            encode(42, counter, values, status)
+
+    def run_batch():
+        encoder.encode_many(42, frames)
+
+    return {
+        'legacy': measure('eski create_hyi_packet', run_legacy, count),
+        'create_hyi_packet': measure('SerialManager.create_hyi_packet', run_create, count),
+        'encode': measure('HyiEncoder.encode', run_encoder, count),
+        'encode_many': measure('HyiEncoder.encode_many', run_batch, count),
+    }
+
+
+def bench_judge(app, manager, seconds):
+    """Hakem portunu sim://judge yakalayıcısına bağlar ve her hızda yazma aralıklarının sapmasını ölçer"""
+    print("judge: hakem timer sapması (sim://judge)")
+    manager.team_id = 1
+    if not manager.connect_judge('sim://judge', 115200):
+        raise RuntimeError('sim://judge bağlanamadı')
+    port = manager.judge_port
+    stamps = []
+    original_write = port.write
+
+    def timed_write(data):
+        stamps.append(time.perf_counter())
+        return original_write(data)
+    port.write = timed_write
+
+    results = {}
+    for hz in range(1, 11):
+        manager.set_judge_send_frequency(hz)
+        stamps.clear()
+        # En az 5 aralık toplanır (1 Hz'de 5 s)
+        duration = max(seconds, 5.5 / hz)
+        QTimer.singleShot(int(duration * 1000), app.quit)
+        app.exec_()
+        nominal = 1000.0 / hz
+        gaps = [(b - a) * 1000.0 for a, b in zip(stamps, stamps[1:])]
+        if not gaps:
+            continue
+        errors = [abs(g - nominal) for g in gaps]
+        results[f'{hz}hz'] = {
+            'frames': len(stamps),
+            'mean_interval_ms': round(statistics.fmean(gaps), 3),
+            'jitter_p50_ms': round(percentile(errors, 0.5), 3),
+            'jitter_p99_ms': round(percentile(errors, 0.99), 3),
+            'jitter_max_ms': round(max(errors), 3),
+        }
+        r = results[f'{hz}hz']
+        print(f"  {hz:>2} Hz  ortalama {r['mean_interval_ms']:8.2f} ms  sapma p50 {r['jitter_p50_ms']:6.2f}"
+              f"  p99 {r['jitter_p99_ms']:6.2f}  max {r['jitter_max_ms']:6.2f} ms")
+    manager.disconnect_judge()
+    return results
+
+
+TABLE_QML = """
+import QtQuick 2.15
+import QtQuick.Controls 1.4
+import QtQuick.Window 2.15
+Window {
+    width: 640; height: 600; visible: true
+    TableView {
+        anchors.fill: parent
+        model: telemetryTableModel
+        TableViewColumn { title: "Alan"; role: "field"; width: 200 }
+        TableViewColumn { title: "Değer"; role: "value"; width: 150 }
+    }
+}
+"""
+
+
+def bench_ui(app, manager, count):
+    """QML tablosu yüklüyken bir yenileme (_refresh_ui + olay işleme) maliyetini ölçer"""
+    from PyQt5.QtQml import QQmlApplicationEngine
+    print("ui: telemetry_data_changed yenilemesi başına maliyet")
+    engine = QQmlApplicationEngine()
+    engine.rootContext().setContextProperty('serialManager', manager)
+    engine.rootContext().setContextProperty('telemetryTableModel', manager.table_model)
+    engine.loadData(main.QML_CODE.encode())
+    qml = 'QML_CODE'
+    if not engine.rootObjects():
+        # QtWebEngine yoksa aynı modele bağlı yalın tablo kullanılır
+        engine.loadData(TABLE_QML.encode())
+        qml = 'tablo'
+    app.processEvents()
+    lines = synthetic_lines(count)
+    decode = main.decode_telemetry_packet
+    pairs = list(zip([decode(l) for l in lines['anakart_json']], [decode(l) for l in lines['gorev_yuku_json']]))
+    apply = manager.apply_telemetry_sample
+
+    def run():
+        for ana, gorev in pairs:
+            apply(ana, emit=False)
+            apply(gorev, emit=False)
+            manager._refresh_ui()
+            app.processEvents()
+
+    result = measure(f'yenileme ({qml})', run, count, 'yenileme/s')
+    result['qml'] = qml
+    del engine
+    return result
+
+
+def compare(results, baseline_path):
+    """Ortak sayısal metrikler için yeni/eski oranlarını yazdırır"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    print(f"\nKarşılaştırma ({baseline_path}):")
+    for suite, entries in results.items():
+        for name, metrics in entries.items() if suite != 'ui' else (('refresh', entries),):
+            old = baseline.get(suite, {})
+            old = old if suite == 'ui' else old.get(name, {})
+            for key, value in metrics.items():
+                if isinstance(value, (int, float)) and isinstance(old.get(key), (int, float)) and old[key]:
+                    label = f"{suite}.{name}.{key}"
+                    print(f"  {label:<40} {old[key]:>12,.3f} → {value:>12,.3f}  (x{value / old[key]:.2f})")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description='Telemetri benchmark takımı')
+    parser.add_argument('--quick', action='store_true', help='kısa çalıştırma (duman testi)')
+    parser.add_argument('--only', default=','.join(SUITES), help='virgülle ayrılmış takımlar')
+    parser.add_argument('--count', type=int, help='decode/merge/encode işlem sayısı')
+    parser.add_argument('--judge-seconds', type=float, help='her hakem hızında ölçüm süresi')
+    parser.add_argument('--json', dest='json_path', help='sonuçların yazılacağı JSON dosyası')
+    parser.add_argument('--compare', help='karşılaştırılacak önceki JSON sonuç dosyası')
+    return parser.parse_args(argv)
+
+
+def main_cli(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    suites = [s.strip() for s in args.only.split(',') if s.strip()]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        raise SystemExit(f"Bilinmeyen takım: {', '.join(sorted(unknown))}")
+    count = args.count or (2000 if args.quick else 50000)
+    judge_seconds = args.judge_seconds or (1.0 if args.quick else 3.0)
+
+    # Benchmark kayıt dosyası üretmez
+    app = QApplication([sys.argv[0]])
+    manager = SerialManager(main.parse_command_line(['--no-record']))
+    manager.ui_clock.stop()
+
+    results = {}
+    for suite in suites:
+        if suite == 'decode':
+            results[suite] = bench_decode(manager, count)
+        elif suite == 'merge':
+            results[suite] = bench_merge(manager, count)
+        elif suite == 'encode':
+            results[suite] = bench_encode(manager, count)
+        elif suite == 'judge':
+            results[suite] = bench_judge(app, manager, judge_seconds)
+        elif suite == 'ui':
+            results[suite] = bench_ui(app, manager, max(200, count // 20))
+    manager.shutdown()
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'qt': QT_VERSION_STR,
+            'json_backend': main.JSON_BACKEND,
+            'count': count,
+        },
+        'results': results,
+    }
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\nSonuçlar yazıldı: {args.json_path}")
+    if args.compare:
+        compare(results, args.compare)
+    return report
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -1,25 +1,775 @@
 import sys
+import argparse
 import struct
 import time
 import os
-from PyQt5.QtCore import QObject, QUrl, pyqtSignal, pyqtSlot, QTimer, pyqtProperty, Qt
+import json
+import logging
+import logging.handlers
+import queue
+import atexit
+import binascii
+import operator
+import threading
+import weakref
+import zlib
+import bisect
+import urllib.parse
+import random
+import math
+import collections
+import hashlib
+import array
+import sqlite3
+import tempfile
+import http.server
+import urllib.request
+
+# Başlangıç süresi ölçümü Qt modüllerinin yüklenmesini de kapsar
+_PROCESS_T0 = time.perf_counter()
+
+from PyQt5.QtCore import QObject, QUrl, QByteArray, QThreadPool, QRunnable, QFileSystemWatcher, pyqtSignal, pyqtSlot, QTimer, pyqtProperty, Qt, QThread, QMetaObject, Q_RETURN_ARG, Q_ARG, QAbstractTableModel, QModelIndex, QStandardPaths, QCoreApplication, QPointF
 from PyQt5.QtWidgets import QApplication, QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QLineEdit, QPushButton, QWidget, QMessageBox
-from PyQt5.QtGui import QPixmap, QFont, QKeyEvent, QIntValidator, QIcon
-from PyQt5.QtQml import QQmlApplicationEngine
+from PyQt5.QtGui import QPixmap, QFont, QKeyEvent, QIntValidator, QIcon, QPainter, QPen, QColor, QPolygonF
+from PyQt5.QtQml import QQmlApplicationEngine, qmlRegisterType
+from PyQt5.QtQuick import QQuickPaintedItem
 from PyQt5.QtSerialPort import QSerialPortInfo, QSerialPort
-from PyQt5.QtWebEngineWidgets import QWebEngineView
 
-# Harita HTML dosyası oluştur
-# (Leaflet ile iki marker ve çizgi)
-def create_map_html():
-    html_content = """
+# Günlük kategorileri: her biri ayrı seviyesi olan 'telemetri.<kategori>' logger'ı
+LOG_CATEGORIES = ('ingest', 'judge', 'ports', 'ui')
+log_ingest = logging.getLogger('telemetri.ingest')  # Port okuma ve paket çözme
+log_judge = logging.getLogger('telemetri.judge')  # Hakem paketleri
+log_ports = logging.getLogger('telemetri.ports')  # Port tarama, bağlantı
+log_ui = logging.getLogger('telemetri.ui')  # Uygulama ve arayüz
+
+class RateLimitFilter(logging.Filter):
+    """Aynı şablonla tekrarlanan uyarı/hataları aralık başına bir kez geçirir, bastırılanları sayar"""
+
+    def __init__(self, interval=5.0, min_level=logging.WARNING):
+        super().__init__()
+        self.interval = interval
+        self.min_level = min_level
+        self.suppressed = 0
+        self._last = {}  # (logger, şablon) -> [son geçiş zamanı, bastırılan sayısı]
+
+    def filter(self, record):
+        if record.levelno < self.min_level:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        entry = self._last.get(key)
+        if entry is not None and now - entry[0] < self.interval:
+            entry[1] += 1
+            self.suppressed += 1
+            return False
+        if entry is not None and entry[1]:
+            record.msg = f"{record.msg} ({entry[1]} tekrar bastırıldı)"
+        self._last[key] = [now, 0]
+        return True
+
+class LogCounters(logging.Handler):
+    """Kategori ve seviye bazında günlük kaydı sayar (sessiz uçuş modunda da çalışır)"""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.counts = {}
+
+    def handle(self, record):
+        # Kilit ve biçimlendirme gerekmez, yalnızca sayaç artırılır
+        key = f"{record.name.rsplit('.', 1)[-1]}.{record.levelname}"
+        self.counts[key] = self.counts.get(key, 0) + 1
+        return True
+
+    def emit(self, record):
+        pass
+
+class TelemetryLogging:
+    """Kuyruk tabanlı, arka plan thread'inde yazan, kategori seviyeli günlük sistemi"""
+    FORMAT = '%(asctime)s [PYTHON] [%(name)s] %(levelname)s: %(message)s'
+    DEFAULT_LEVEL = logging.INFO
+
+    def __init__(self):
+        self.root = logging.getLogger('telemetri')
+        self.counters = LogCounters()
+        self.rate_limiter = None
+        self.queue_handler = None
+        self.listener = None
+        self.quiet = False
+        self._levels = {category: self.DEFAULT_LEVEL for category in LOG_CATEGORIES}
+
+    def start(self, levels=None, quiet=False, rate_limit_interval=5.0, stream=None):
+        if self.listener is not None:
+            return
+        log_queue = queue.SimpleQueue()
+        self.queue_handler = logging.handlers.QueueHandler(log_queue)
+        self.rate_limiter = RateLimitFilter(rate_limit_interval)
+        self.queue_handler.addFilter(self.rate_limiter)
+        console = logging.StreamHandler(stream or sys.stdout)
+        console.setFormatter(logging.Formatter(self.FORMAT, '%H:%M:%S'))
+        # Konsola yazma yalnızca dinleyici thread'inde yapılır
+        self.listener = logging.handlers.QueueListener(log_queue, console)
+        self.listener.start()
+        atexit.register(self.stop)
+
+        self.root.setLevel(logging.DEBUG)
+        self.root.propagate = False
+        self.root.addHandler(self.counters)
+        self.root.addHandler(self.queue_handler)
+        for category, level in (levels or {}).items():
+            self.set_level(category, level)
+        self._apply_levels()
+        self.set_quiet(quiet)
+
+    def stop(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+    def set_level(self, category, level):
+        """Kategori seviyesini ayarlar (ör. 'ingest', 'DEBUG'); geçersizse False döner"""
+        if category not in LOG_CATEGORIES:
+            return False
+        if isinstance(level, str):
+            level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            return False
+        self._levels[category] = level
+        self._apply_levels()
+        return True
+
+    def set_quiet(self, quiet):
+        """Sessiz uçuş modu: konsola hiçbir şey yazılmaz, yalnızca uyarı/hata sayaçları tutulur"""
+        self.quiet = bool(quiet)
+        if self.queue_handler is not None:
+            self.queue_handler.setLevel(logging.CRITICAL + 1 if self.quiet else logging.NOTSET)
+        self._apply_levels()
+
+    def _apply_levels(self):
+        for category in LOG_CATEGORIES:
+            level = self._levels[category]
+            if self.quiet:
+                # Ayrıntılı kayıtlar hiç oluşturulmaz
+                level = max(level, logging.WARNING)
+            logging.getLogger(f'telemetri.{category}').setLevel(level)
+
+    def snapshot(self):
+        counts = dict(self.counters.counts)
+        counts['suppressed'] = self.rate_limiter.suppressed if self.rate_limiter else 0
+        counts['quiet'] = self.quiet
+        return counts
+
+telemetry_logging = TelemetryLogging()
+
+class StartupProfile:
+    """Başlangıç aşamalarının süresini ölçer: her mark() bir önceki işaretten geçen süreyi kaydeder"""
+
+    def __init__(self, t0):
+        self.t0 = t0
+        self._last = t0
+        self.phases = []  # (aşama, ms)
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, round((now - self._last) * 1000.0, 1)))
+        self._last = now
+
+    def total_ms(self):
+        return round((self._last - self.t0) * 1000.0, 1)
+
+    def report(self):
+        return {'phases': dict(self.phases), 'total_ms': self.total_ms()}
+
+    def summary(self):
+        return ', '.join(f'{phase} {ms:.0f} ms' for phase, ms in self.phases) + f' (toplam {self.total_ms():.0f} ms)'
+
+startup_profile = StartupProfile(_PROCESS_T0)
+startup_profile.mark('imports')
+
+# Harita döşemeleri: çevrimdışı MBTiles deposu, önceden indirme ve yerel döşeme sunucusu
+TILE_URL_TEMPLATE = 'https://tile.openstreetmap.org/{z}/{x}/{y}.png'
+LEAFLET_CDN = 'https://unpkg.com/leaflet@1.7.1/dist/'
+LEAFLET_FILES = ('leaflet.js', 'leaflet.css', 'images/marker-icon.png', 'images/marker-icon-2x.png',
+                 'images/marker-shadow.png', 'images/layers.png', 'images/layers-2x.png')
+TILE_USER_AGENT = '111-RoketTelemetri/1.0 (ground station tile prefetch)'
+# OSM döşeme kullanım politikası toplu indirmeyi yasaklar: varsayılan sunucudan az bağlantı, küçük kutu
+OSM_TILE_HOST = 'tile.openstreetmap.org'
+OSM_PREFETCH_WORKERS = 2
+OSM_PREFETCH_MAX_TILES = 2000
+
+def is_osm_tile_url(template):
+    host = urllib.parse.urlsplit(template).hostname or ''
+    return host == OSM_TILE_HOST or host.endswith('.' + OSM_TILE_HOST)
+
+def lat_lng_to_tile(lat, lng, zoom):
+    """Web Mercator (XYZ) döşeme koordinatı"""
+    lat = max(-85.0511, min(85.0511, lat))
+    n = 1 << zoom
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+def tiles_in_bbox(min_lat, min_lng, max_lat, max_lng, zoom):
+    """Sınır kutusunu kaplayan (x, y) döşemeleri"""
+    x0, y0 = lat_lng_to_tile(max_lat, min_lng, zoom)
+    x1, y1 = lat_lng_to_tile(min_lat, max_lng, zoom)
+    for x in range(x0, x1 + 1):
+        for y in range(y0, y1 + 1):
+            yield x, y
+
+def fetch_url(url, timeout=10.0):
+    request = urllib.request.Request(url, headers={'User-Agent': TILE_USER_AGENT})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+class TileStore:
+    """MBTiles (SQLite) döşeme deposu; satırlar MBTiles gereği TMS düzeninde (y ters) tutulur"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        # Sunucu thread'leri de okur; erişim kilitle sıralanır
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER,
+                                              tile_data BLOB);
+            CREATE UNIQUE INDEX IF NOT EXISTS tile_index ON tiles (zoom_level, tile_column, tile_row);
+        ''')
+
+    def get(self, z, x, y):
+        with self._lock:
+            row = self._db.execute('SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?',
+                                   (z, x, (1 << z) - 1 - y)).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, tiles):
+        """[(z, x, y, veri), ...] tek işlemde yazılır"""
+        with self._lock, self._db:
+            self._db.executemany('INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?)',
+                                 [(z, x, (1 << z) - 1 - y, data) for z, x, y, data in tiles])
+
+    def put(self, z, x, y, data):
+        self.put_many([(z, x, y, data)])
+
+    def missing(self, z, tiles):
+        """Verilen (x, y) döşemelerinden depoda olmayanlar"""
+        with self._lock:
+            present = set(self._db.execute('SELECT tile_column, tile_row FROM tiles WHERE zoom_level=?', (z,)))
+        flip = (1 << z) - 1
+        return [(x, y) for x, y in tiles if (x, flip - y) not in present]
+
+    def set_metadata(self, values):
+        with self._lock, self._db:
+            self._db.executemany('INSERT OR REPLACE INTO metadata VALUES (?, ?)',
+                                 [(name, str(value)) for name, value in values.items()])
+
+    def count(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM tiles').fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+class TileCache:
+    """Depo önünde LRU bellek önbelleği; çevrimiçiyken eksik döşemeler indirilip depoya eklenir.
+
+    İndirilemeyen döşeme retry_after saniye yeniden istenmez. Art arda FAIL_LIMIT indirme hatasından sonra
+    sunucuya üstel artan süre (BACKOFF_MIN_S'den BACKOFF_MAX_S'ye) hiç gidilmez; bağlantısız sahada her
+    eksik döşeme sunucu thread'ini zaman aşımı kadar bekletmez.
+    """
+    FAIL_LIMIT = 3
+    BACKOFF_MIN_S = 5.0
+    BACKOFF_MAX_S = 300.0
+
+    def __init__(self, store, max_tiles=1024, upstream=TILE_URL_TEMPLATE, offline=False, retry_after=60.0):
+        self.store = store
+        self.max_tiles = max_tiles
+        self.upstream = upstream
+        self.offline = offline
+        self.retry_after = retry_after
+        self._lru = collections.OrderedDict()
+        self._failed = collections.OrderedDict()  # (z, x, y) -> yeniden denenebileceği an (monotonic)
+        self._consecutive_failures = 0
+        self._backoff_s = 0.0
+        self._upstream_blocked_until = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.store_hits = 0
+        self.fetched = 0
+        self.fetch_errors = 0
+        self.misses = 0
+
+    def _may_fetch(self, key, now):
+        with self._lock:
+            if now < self._upstream_blocked_until:
+                return False
+            retry_at = self._failed.get(key)
+            if retry_at is not None and now < retry_at:
+                return False
+            self._failed.pop(key, None)
+            return True
+
+    def _fetch_failed(self, key, now):
+        with self._lock:
+            self.fetch_errors += 1
+            self._failed[key] = now + self.retry_after
+            self._failed.move_to_end(key)
+            if len(self._failed) > self.max_tiles:
+                self._failed.popitem(last=False)
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.FAIL_LIMIT:
+                self._backoff_s = min(max(self._backoff_s * 2, self.BACKOFF_MIN_S), self.BACKOFF_MAX_S)
+                self._upstream_blocked_until = now + self._backoff_s
+                self._consecutive_failures = 0
+                log_ui.warning('⚠️ Döşeme sunucusuna ulaşılamıyor, %.0f sn denenmeyecek', self._backoff_s)
+
+    def _fetch_succeeded(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            self._backoff_s = 0.0
+
+    def get(self, z, x, y):
+        key = (z, x, y)
+        with self._lock:
+            data = self._lru.get(key)
+            if data is not None:
+                self._lru.move_to_end(key)
+                self.hits += 1
+                return data
+        data = self.store.get(z, x, y) if self.store is not None else None
+        if data is not None:
+            self.store_hits += 1
+        elif not self.offline and self.upstream and self._may_fetch(key, time.monotonic()):
+            try:
+                data = fetch_url(self.upstream.format(z=z, x=x, y=y))
+            except Exception:
+                self._fetch_failed(key, time.monotonic())
+            else:
+                self._fetch_succeeded()
+                self.fetched += 1
+                if self.store is not None:
+                    self.store.put(z, x, y, data)
+        if data is None:
+            self.misses += 1
+            return None
+        with self._lock:
+            self._lru[key] = data
+            if len(self._lru) > self.max_tiles:
+                self._lru.popitem(last=False)
+        return data
+
+    def stats(self):
+        return {'memory_tiles': len(self._lru), 'hits': self.hits, 'store_hits': self.store_hits,
+                'fetched': self.fetched, 'fetch_errors': self.fetch_errors, 'misses': self.misses,
+                'offline': self.offline, 'upstream_backoff_s': self._backoff_s}
+
+def prefetch_tiles(store, bbox, zooms, template=TILE_URL_TEMPLATE, workers=4, max_tiles=50000, progress=None):
+    """Sınır kutusundaki eksik döşemeleri paralel indirip depoya yazar; (indirilen, atlanan, hatalı) döndürür.
+
+    Şablon openstreetmap.org'u gösteriyorsa bağlantı sayısı ve döşeme sınırı OSM politikasına göre düşürülür.
+    """
+    osm = is_osm_tile_url(template)
+    if osm:
+        workers = min(workers, OSM_PREFETCH_WORKERS)
+        max_tiles = min(max_tiles, OSM_PREFETCH_MAX_TILES)
+    jobs = []
+    for zoom in zooms:
+        tiles = list(tiles_in_bbox(*bbox, zoom))
+        jobs.extend((zoom, x, y) for x, y in store.missing(zoom, tiles))
+    total = sum(len(list(tiles_in_bbox(*bbox, zoom))) for zoom in zooms)
+    if len(jobs) > max_tiles:
+        hint = "; daha fazlası için --tile-url ile kendi döşeme sunucunuzu verin" if osm else ""
+        raise ValueError(f"{len(jobs)} döşeme çok fazla (sınır {max_tiles}); kutuyu veya zoom aralığını küçültün{hint}")
+    pending = queue.SimpleQueue()
+    for job in jobs:
+        pending.put(job)
+    results = queue.SimpleQueue()
+
+    def worker():
+        while True:
+            try:
+                z, x, y = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                results.put((z, x, y, fetch_url(template.format(z=z, x=x, y=y))))
+            except Exception:
+                results.put((z, x, y, None))
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(min(workers, len(jobs)))]
+    for thread in threads:
+        thread.start()
+    # SQLite yazımı tek thread'de, partiler halinde
+    downloaded = failed = 0
+    batch = []
+    for done in range(1, len(jobs) + 1):
+        z, x, y, data = results.get()
+        if data is None:
+            failed += 1
+        else:
+            batch.append((z, x, y, data))
+            downloaded += 1
+        if len(batch) >= 100 or done == len(jobs):
+            store.put_many(batch)
+            batch.clear()
+        if progress:
+            progress(done, len(jobs))
+    store.set_metadata({'name': 'roket-telemetri', 'format': 'png', 'minzoom': min(zooms), 'maxzoom': max(zooms),
+                        'bounds': f'{bbox[1]},{bbox[0]},{bbox[3]},{bbox[2]}'})
+    return downloaded, total - len(jobs), failed
+
+def prefetch_leaflet(assets_dir):
+    """Leaflet dosyalarını yerel sunucunun dağıtacağı klasöre indirir"""
+    for name in LEAFLET_FILES:
+        path = os.path.join(assets_dir, 'leaflet', name)
+        if os.path.exists(path):
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = fetch_url(LEAFLET_CDN + name)
+        with open(path, 'wb') as f:
+            f.write(data)
+
+class _TileRequestHandler(http.server.BaseHTTPRequestHandler):
+    """/tiles/z/x/y.png, /leaflet/<dosya> ve /map.html isteklerini TileServer'a yönlendirir"""
+    CONTENT_TYPES = {'.js': 'application/javascript', '.css': 'text/css', '.png': 'image/png',
+                     '.html': 'text/html; charset=utf-8'}
+
+    def do_GET(self):
+        path = urllib.parse.urlsplit(self.path).path
+        data, cache = self.server.tile_server.resolve(path)
+        if data is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', self.CONTENT_TYPES.get(os.path.splitext(path)[1], 'application/octet-stream'))
+        self.send_header('Content-Length', str(len(data)))
+        if cache:
+            self.send_header('Cache-Control', 'max-age=86400')
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+class TileServer:
+    """Yalnızca 127.0.0.1'de dinleyen, döşemeleri, yerel Leaflet dosyalarını ve harita sayfasını veren sunucu"""
+
+    def __init__(self, cache, assets_dir='map_assets', port=0):
+        self.cache = cache
+        self.assets_dir = assets_dir
+        self._port = port
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self._httpd.server_address[1]}' if self._httpd else ''
+
+    def has_local_leaflet(self):
+        return os.path.exists(os.path.join(self.assets_dir, 'leaflet', 'leaflet.js'))
+
+    def start(self):
+        if self._httpd is not None:
+            return
+        self._httpd = http.server.ThreadingHTTPServer(('127.0.0.1', self._port), _TileRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.tile_server = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='tile-server', daemon=True)
+        self._thread.start()
+        log_ui.info('🗺️ Yerel döşeme sunucusu: %s', self.url)
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def resolve(self, path):
+        """İstek yoluna karşılık gelen (veri, önbelleklenebilir) ikilisi; yoksa veri None"""
+        parts = path.strip('/').split('/')
+        if parts[0] == 'tiles' and len(parts) == 4 and parts[3].endswith('.png'):
+            try:
+                z, x, y = int(parts[1]), int(parts[2]), int(parts[3][:-4])
+            except ValueError:
+                return None, False
+            return self.cache.get(z, x, y), True
+        if parts[0] == 'leaflet':
+            # Normalleştirilmiş yol Leaflet dizininin içinde kalmalı ('..', ters bölü, mutlak yol, bağlantı)
+            root = os.path.realpath(os.path.join(self.assets_dir, 'leaflet'))
+            target = os.path.realpath(os.path.join(self.assets_dir, *parts))
+            try:
+                inside = os.path.commonpath([root, target]) == root and target != root
+            except ValueError:
+                inside = False  # Farklı sürücü (Windows)
+            if not inside:
+                return None, False
+            try:
+                with open(target, 'rb') as f:
+                    return f.read(), True
+            except OSError:
+                return None, False
+        if path == '/map.html':
+            leaflet_base = '/leaflet/' if self.has_local_leaflet() else LEAFLET_CDN
+            return map_html(leaflet_base, '/tiles/{z}/{x}/{y}.png').encode('utf-8'), False
+        return None, False
+
+    def stats(self):
+        stats = self.cache.stats()
+        stats.update(url=self.url, local_leaflet=self.has_local_leaflet())
+        return stats
+
+# NumPy isteğe bağlıdır; varsa iz ve geçmiş sütunları kopyasız dizi olarak da okunabilir
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+class _TrackSimplifier:
+    """Tek zoom seviyesi için artımlı sadeleştirme (Zhao-Saalfeld kılıf uydurma).
+
+    Çapa noktasından çıkan ve o ana kadarki tüm noktalardan tolerans içinde geçebilecek yönler bir açı
+    aralığı olarak tutulur; her yeni nokta aralığı daraltır. Nokta aralığın dışına düşünce önceki nokta
+    köşe olarak sabitlenir ve yeni çapa olur. Nokta başına maliyet sabittir, uçuş süresine bağlı değildir.
+    """
+
+    def __init__(self, track, tolerance_m):
+        self.track = track
+        self.tolerance_m = tolerance_m
+        self.vertices = []  # Sabitlenmiş köşeler [(enlem, boylam), ...]
+        self.cursor = 0  # İşlenen ham nokta sayısı
+        self._anchor = -1
+        self._sector = None  # (alt, üst) yön sınırı, radyan
+
+    def catch_up(self):
+        lats, lngs = self.track.lat, self.track.lng
+        for i in range(self.cursor, len(lats)):
+            if self._anchor < 0:
+                self._set_anchor(i)
+            elif not self._narrow(i):
+                self._set_anchor(i - 1)
+                self._narrow(i)
+        self.cursor = len(lats)
+
+    def _set_anchor(self, i):
+        lat0 = self.track.lat[i]
+        self.vertices.append((lat0, self.track.lng[i]))
+        self._anchor = i
+        self._sector = None
+        # Yerel eşdikdörtgen izdüşüm katsayıları (derece -> metre)
+        self._kx = 111320.0 * math.cos(math.radians(lat0))
+        self._ky = 110540.0
+
+    def _narrow(self, i):
+        """i noktası mevcut yön aralığına sığıyorsa aralığı daraltıp True döner"""
+        anchor = self._anchor
+        x = (self.track.lng[i] - self.track.lng[anchor]) * self._kx
+        y = (self.track.lat[i] - self.track.lat[anchor]) * self._ky
+        distance = math.hypot(x, y)
+        if distance <= self.tolerance_m:
+            return True  # Çapaya tolerans kadar yakın noktalar yönü kısıtlamaz
+        theta = math.atan2(y, x)
+        half = math.asin(self.tolerance_m / distance)
+        if self._sector is None:
+            self._sector = (theta - half, theta + half)
+            return True
+        low, high = self._sector
+        center = (low + high) / 2.0
+        theta = center + (theta - center + math.pi) % (2.0 * math.pi) - math.pi
+        if theta < low or theta > high:
+            return False
+        self._sector = (max(low, theta - half), min(high, theta + half))
+        return True
+
+    def tail(self):
+        """Henüz sabitlenmemiş son nokta (çizginin ucu)"""
+        if self.cursor and self.cursor - 1 != self._anchor:
+            return (self.track.lat[self.cursor - 1], self.track.lng[self.cursor - 1])
+        return None
+
+class TrackStore:
+    """Bir aracın yer izi: enlem/boylam/irtifa/zaman sütunları yalnızca eklenir, zoom seviyesi başına
+    artımlı sadeleştirilmiş köşeler tutulur. Seviyeler ilk istendiklerinde hesaplanmaya başlar."""
+    ZOOM_LEVELS = (8, 10, 12, 14, 16, 18)
+
+    def __init__(self, tolerance_px=1.5):
+        self.tolerance_px = tolerance_px
+        self.lat = array.array('d')
+        self.lng = array.array('d')
+        self.alt = array.array('d')
+        self.t = array.array('d')
+        self._levels = {}
+
+    def __len__(self):
+        return len(self.lat)
+
+    def append(self, lat, lng, alt, t):
+        if lat == 0.0 and lng == 0.0:
+            return  # GPS fix yok
+        self.lat.append(lat)
+        self.lng.append(lng)
+        self.alt.append(alt)
+        self.t.append(t)
+
+    @classmethod
+    def level_for(cls, zoom):
+        """Harita zoom'una karşılık gelen (altındaki en yakın) sadeleştirme seviyesi"""
+        return max([level for level in cls.ZOOM_LEVELS if level <= zoom] or [cls.ZOOM_LEVELS[0]])
+
+    def _simplifier(self, level):
+        simplifier = self._levels.get(level)
+        if simplifier is None:
+            lat0 = self.lat[0] if self.lat else 0.0
+            # Web Mercator'da bir pikselin metre karşılığı
+            meters_per_px = 156543.03 * math.cos(math.radians(lat0)) / (1 << level)
+            simplifier = self._levels[level] = _TrackSimplifier(self, self.tolerance_px * meters_per_px)
+        return simplifier
+
+    def vertices(self, zoom, start=0):
+        """Seviyenin start'tan itibaren sabitlenmiş köşeleri ve çizginin ucu: ([(enlem, boylam)], uç veya None)"""
+        if not self.lat:
+            return [], None
+        simplifier = self._simplifier(self.level_for(zoom))
+        simplifier.catch_up()
+        return simplifier.vertices[start:], simplifier.tail()
+
+    def as_numpy(self):
+        """Sütunların NumPy kopyaları (NumPy yoksa None); büyüyen dizilere kalıcı görünüm tutulamaz"""
+        if numpy is None:
+            return None
+        return {name: numpy.array(getattr(self, name), dtype=numpy.float64) for name in ('lat', 'lng', 'alt', 't')}
+
+    def stats(self):
+        return {'points': len(self.lat),
+                'vertices': {level: len(s.vertices) for level, s in sorted(self._levels.items())}}
+
+class MapBridge(QObject):
+    """Gömülü harita sayfasına QWebChannel ile konum ve iz iter.
+
+    Konumlar geldikçe yalnızca kaynak başına son değer saklanır; sayfa bağlıyken sabit hızda, değişen
+    kaynaklar tek mesajda gönderilir ve sayfa marker'ları yeniden yüklemeden taşır. İzlerden yalnızca
+    sayfanın zoom seviyesindeki yeni sadeleştirilmiş köşeler gönderilir.
+    """
+    markersMoved = pyqtSignal('QVariantMap')  # kaynak -> [enlem, boylam, irtifa]
+    trackExtended = pyqtSignal('QVariantMap')  # kaynak -> {'reset', 'vertices': [[enlem, boylam]], 'tail'}
+
+    def __init__(self, rate_hz=5, tracks=None, parent=None):
+        super().__init__(parent)
+        self.tracks = tracks or {}
+        self._zoom = 13
+        self._sent = {}  # kaynak -> sayfaya gönderilmiş köşe sayısı
+        self._seen = {}  # kaynak -> son gönderimdeki ham nokta sayısı
+        self._pending = {}
+        self._last = {}
+        self._pages = 0
+        self.updates = 0
+        self.pushes = 0
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._flush)
+        self.set_rate(rate_hz)
+
+    def set_rate(self, rate_hz):
+        self.rate_hz = max(1, min(30, int(rate_hz)))
+        self._timer.setInterval(int(1000 / self.rate_hz))
+
+    def update(self, kaynak, lat, lng, alt):
+        position = [float(lat), float(lng), float(alt)]
+        self._pending[kaynak] = position
+        self._last[kaynak] = position
+        self.updates += 1
+
+    def _flush(self):
+        if self._pending:
+            self.markersMoved.emit(self._pending)
+            self._pending = {}
+            self.pushes += 1
+        extended = {}
+        for kaynak, track in self.tracks.items():
+            reset = kaynak not in self._sent
+            if not reset and self._seen.get(kaynak) == len(track):
+                continue
+            vertices, tail = track.vertices(self._zoom, self._sent.get(kaynak, 0))
+            self._sent[kaynak] = self._sent.get(kaynak, 0) + len(vertices)
+            self._seen[kaynak] = len(track)
+            extended[kaynak] = {'reset': reset, 'vertices': [list(v) for v in vertices],
+                                'tail': list(tail) if tail else None}
+        if extended:
+            self.trackExtended.emit(extended)
+
+    @pyqtSlot(int)
+    def set_zoom(self, zoom):
+        """Sayfanın zoom'u değişti; seviye değiştiyse izler bir sonraki gönderimde baştan yollanır"""
+        if TrackStore.level_for(zoom) != TrackStore.level_for(self._zoom):
+            self._sent.clear()
+        self._zoom = zoom
+
+    @pyqtSlot()
+    def ready(self):
+        """Sayfa kanala bağlandı; bilinen son konumlar ve izler hemen gönderilir"""
+        self._pages += 1
+        self._pending = dict(self._last)
+        self._sent.clear()
+        self._flush()
+        self._timer.start()
+
+    @pyqtSlot()
+    def detach(self):
+        """Harita penceresi kapandı; sayfa kalmadıysa gönderim durur"""
+        self._pages = max(0, self._pages - 1)
+        if not self._pages:
+            self._timer.stop()
+
+    def stats(self):
+        return {'rate_hz': self.rate_hz, 'pages': self._pages, 'updates': self.updates, 'pushes': self.pushes}
+
+MAP_VIEW_QML = '''
+import QtQuick 2.15
+import QtQuick.Window 2.15
+import QtWebEngine 1.8
+import QtWebChannel 1.0
+
+// Canlı harita penceresi: ana arayüzden Loader ile yalnızca açıldığında yüklenir
+Window {
+    id: mapWindow
+    width: 900
+    height: 650
+    visible: true
+    title: "Canlı Harita"
+
+    signal closed()
+
+    WebChannel {
+        id: mapChannel
+    }
+
+    WebEngineView {
+        anchors.fill: parent
+        webChannel: mapChannel
+        // Dosyadan açılan sayfa döşemeleri yerel sunucudan (http) alır
+        settings.localContentCanAccessRemoteUrls: true
+        url: serialManager.map_file_url
+    }
+
+    Component.onCompleted: mapChannel.registerObjects({"bridge": mapBridge})
+    onClosing: {
+        mapBridge.detach();
+        closed();
+    }
+}
+'''
+
+# Harita HTML sayfası (Leaflet ile iki marker ve çizgi)
+# ?lat=&lng=&zoom= verilirse harita o noktaya ortalanır ve işaretlenir; gömülü görünümde konumlar
+# QWebChannel üzerinden MapBridge'den gelir (qrc betiği yalnızca Qt WebEngine içinde yüklenir)
+MAP_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
     <title>Roket Konumları</title>
     <meta charset=\"utf-8\">
-    <link rel=\"stylesheet\" href=\"https://unpkg.com/leaflet@1.7.1/dist/leaflet.css\" />
-    <script src=\"https://unpkg.com/leaflet@1.7.1/dist/leaflet.js\"></script>
+    <link rel=\"stylesheet\" href=\"@LEAFLET@leaflet.css\" />
+    <script src=\"@LEAFLET@leaflet.js\"></script>
+    <script src=\"qrc:///qtwebchannel/qwebchannel.js\"></script>
     <style>
         body { margin: 0; padding: 0; }
         #map { width: 100vw; height: 100vh; }
@@ -29,7 +779,8 @@ def create_map_html():
     <div id=\"map\"></div>
     <script>
         var map = L.map('map').setView([39.9417, 32.86485], 13);
-        L.tileLayer('https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png', {
+        L.tileLayer('@TILES@', {
+            maxZoom: 19,
             attribution: '© OpenStreetMap contributors'
         }).addTo(map);
         // Ana Sistem marker
@@ -38,16 +789,77 @@ def create_map_html():
         // Görev Yükü marker
         var gorevYuku = L.marker([39.9500, 32.8700]).addTo(map);
         gorevYuku.bindPopup('<b>Görev Yükü</b><br>39.9500°N, 32.8700°E');
-        // Tüm markerları göster
-        var group = new L.featureGroup([anaSistem, gorevYuku]);
-        map.fitBounds(group.getBounds().pad(0.3));
+        var params = new URLSearchParams(window.location.search);
+        if (params.has('lat') && params.has('lng')) {
+            var point = [parseFloat(params.get('lat')), parseFloat(params.get('lng'))];
+            L.marker(point).addTo(map);
+            map.setView(point, parseInt(params.get('zoom') || '15'));
+        } else {
+            // Tüm markerları göster
+            var group = new L.featureGroup([anaSistem, gorevYuku]);
+            map.fitBounds(group.getBounds().pad(0.3));
+        }
+        if (typeof QWebChannel !== 'undefined' && typeof qt !== 'undefined') {
+            new QWebChannel(qt.webChannelTransport, function (channel) {
+                var bridge = channel.objects.bridge;
+                var markers = {anakart: anaSistem, gorev_yuku: gorevYuku};
+                var names = {anakart: 'Ana Sistem', gorev_yuku: 'Görev Yükü'};
+                var fitted = false;
+                var lines = {anakart: L.polyline([], {color: '#e53935', weight: 3}).addTo(map),
+                             gorev_yuku: L.polyline([], {color: '#1e88e5', weight: 3}).addTo(map)};
+                var committed = {anakart: [], gorev_yuku: []};
+                // Değişen kaynaklar tek mesajda gelir; sayfa yenilenmeden marker'lar taşınır
+                bridge.markersMoved.connect(function (positions) {
+                    for (var kaynak in positions) {
+                        var marker = markers[kaynak];
+                        if (!marker) continue;
+                        var p = positions[kaynak];
+                        marker.setLatLng([p[0], p[1]]);
+                        marker.setPopupContent('<b>' + names[kaynak] + '</b><br>' + p[0].toFixed(6) + '°N, ' +
+                                               p[1].toFixed(6) + '°E<br>' + p[2].toFixed(1) + ' m');
+                    }
+                    if (!fitted) {
+                        fitted = true;
+                        map.fitBounds(new L.featureGroup([anaSistem, gorevYuku]).getBounds().pad(0.3));
+                    }
+                });
+                // İzlerin yalnızca yeni sadeleştirilmiş köşeleri gelir; uç nokta her seferinde yenilenir
+                bridge.trackExtended.connect(function (tracks) {
+                    for (var kaynak in tracks) {
+                        if (!lines[kaynak]) continue;
+                        var d = tracks[kaynak];
+                        if (d.reset) committed[kaynak] = [];
+                        var points = committed[kaynak];
+                        for (var i = 0; i < d.vertices.length; ++i)
+                            points.push(L.latLng(d.vertices[i][0], d.vertices[i][1]));
+                        lines[kaynak].setLatLngs(d.tail ? points.concat([L.latLng(d.tail[0], d.tail[1])]) : points);
+                    }
+                });
+                map.on('zoomend', function () { bridge.set_zoom(map.getZoom()); });
+                bridge.set_zoom(map.getZoom());
+                bridge.ready();
+            });
+        }
     </script>
 </body>
 </html>
 """
-    with open("map.html", "w", encoding="utf-8") as f:
-        f.write(html_content)
-    return os.path.abspath("map.html")
+
+def map_html(leaflet_base=LEAFLET_CDN, tile_url=TILE_URL_TEMPLATE):
+    return MAP_HTML_TEMPLATE.replace('@LEAFLET@', leaflet_base).replace('@TILES@', tile_url)
+
+def create_map_html(leaflet_base=LEAFLET_CDN, tile_url=TILE_URL_TEMPLATE):
+    """Sayfayı kullanıcı önbellek dizinine (yoksa geçici dizine) yazar; çalışma dizinine dosya bırakmaz.
+
+    Sayfa bu çalışmanın döşeme sunucusu adresini içerdiği için kalıcı değildir, her açılışta yeniden yazılır.
+    """
+    cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation) or tempfile.gettempdir()
+    path = os.path.join(cache_dir, 'map', 'map.html')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(map_html(leaflet_base, tile_url))
+    os.replace(path + '.tmp', path)
+    return path
 
 QML_CODE = '''
 import QtQuick 2.15
@@ -55,7 +867,7 @@ import QtQuick.Controls 1.4
 import QtQuick.Controls 2.15 as QQC2
 import QtQuick.Layouts 1.15
 import QtQuick.Window 2.15
-import QtWebEngine 1.8
+import Telemetri 1.0
 
 ApplicationWindow {
     visible: true
@@ -81,6 +893,40 @@ ApplicationWindow {
     property real anaSistemLon: 32.8597
     property real gorevYukuLat: 39.9500
     property real gorevYukuLon: 32.8700
+
+    // Canlı harita penceresi (QtWebEngine) yalnızca ilk açıldığında yüklenir, kapanınca bırakılır
+    Loader {
+        id: mapViewLoader
+        onLoaded: item.closed.connect(function() { Qt.callLater(function() { mapViewLoader.source = ""; }); })
+    }
+
+    // Port listeleri: keşif sonuçları geldikçe üç modele de eklenir/çıkarılır
+    function portModels() {
+        return [telemetryPortModel, telemetry2PortModel, judgePortModel];
+    }
+    // "Otomatik" seçimi 0 (otomatik hız tespiti) olarak gönderilir
+    function baudValue(text) {
+        return text === "Otomatik" ? 0 : parseInt(text);
+    }
+
+    function addPort(model, port) {
+        for (var i = model.count - 1; i >= 0; --i) {
+            var path = model.get(i).path;
+            if (path === port.path)
+                return;
+            if (path === "")
+                model.remove(i);  // "Port yok" / "Port taranmadı" yer tutucusu
+        }
+        model.append({name: port.name, path: port.path});
+    }
+    function removePort(model, portPath) {
+        for (var i = model.count - 1; i >= 0; --i) {
+            if (model.get(i).path === portPath)
+                model.remove(i);
+        }
+        if (model.count === 0)
+            model.append({name: "Port yok", path: ""});
+    }
     
 
 
@@ -296,18 +1142,30 @@ ApplicationWindow {
                         Layout.fillWidth: true
                         height: 25
                         onClicked: {
-                            var mapUrl = "https://www.openstreetmap.org/?mlat=" + anaSistemLat + "&mlon=" + anaSistemLon + "&zoom=13&layers=M";
-                            Qt.openUrlExternally(mapUrl);
+                            // Yerel döşeme sunucusundaki harita (sunucu yoksa openstreetmap.org)
+                            Qt.openUrlExternally(serialManager.map_view_url(anaSistemLat, anaSistemLon));
                         }
                     }
                     
+                    Button {
+                        text: "🗺️ Canlı Harita"
+                        Layout.fillWidth: true
+                        height: 25
+                        onClicked: {
+                            if (mapViewLoader.status === Loader.Ready)
+                                mapViewLoader.item.raise();
+                            else
+                                mapViewLoader.source = serialManager.map_view_qml();
+                        }
+                    }
+
                     Button {
                         text: "📍 Görev Yükü"
                         Layout.fillWidth: true
                         height: 25
                         onClicked: {
-                            var mapUrl = "https://www.openstreetmap.org/?mlat=" + gorevYukuLat + "&mlon=" + gorevYukuLon + "&zoom=13&layers=M";
-                            Qt.openUrlExternally(mapUrl);
+                            // Yerel döşeme sunucusundaki harita (sunucu yoksa openstreetmap.org)
+                            Qt.openUrlExternally(serialManager.map_view_url(gorevYukuLat, gorevYukuLon));
                         }
                     }
                 }
@@ -353,8 +1211,10 @@ ApplicationWindow {
                     ComboBox {
                         id: telemetryBaudCombo
                         Layout.fillWidth: true
-                        model: ["9600", "19200", "38400", "57600", "115200"]
-                        currentIndex: 1
+                        // Listede olmayan özel hızlar (USB-CDC) elle yazılabilir
+                        editable: true
+                        model: ["Otomatik", "9600", "19200", "38400", "57600", "115200", "230400", "460800", "921600"]
+                        currentIndex: 2
                     }
                 }
                 
@@ -367,18 +1227,9 @@ ApplicationWindow {
                     height: 25
                     onClicked: {
                         if (serialManager) {
+                            // Tarama arka planda yapılır; sonuçlar onPortAdded/onPortScanFinished ile gelir
                             console.log("[QML] Telemetri portları taranıyor...");
-                            var ports = serialManager.scan_ports();
-                            telemetryPortModel.clear();
-                            if (ports.length === 0) {
-                                telemetryPortModel.append({name: "Port yok", path: ""});
-                                console.log("[QML] Telemetri portu bulunamadı");
-                            } else {
-                                for (var i = 0; i < ports.length; ++i) {
-                                    telemetryPortModel.append(ports[i]);
-                                    console.log("[QML] Telemetri portu eklendi:", ports[i].name);
-                                }
-                            }
+                            serialManager.scan_ports_async(false);
                         }
                     }
                 }
@@ -417,10 +1268,11 @@ ApplicationWindow {
                         onClicked: {
                             if (serialManager && telemetryPortModel.count > 0 && telemetryCombo.currentIndex >= 0) {
                                 var portPath = telemetryPortModel.get(telemetryCombo.currentIndex).path;
-                                var baud = parseInt(telemetryBaudCombo.currentText);
+                                var baud = baudValue(telemetryBaudCombo.editText);
                                 var success = serialManager.connect_telemetry(portPath, baud);
                                 if (success) {
-                                    telemetryStatusText.text = "Telemetri: ✅ Bağlı (" + portPath + ")";
+                                    telemetryStatusText.text = baud === 0 ? "Telemetri: 🔎 Baud aranıyor (" + portPath + ")"
+                                                                    : "Telemetri: ✅ Bağlı (" + portPath + ")";
                                 }
                             }
                         }
@@ -481,8 +1333,10 @@ ApplicationWindow {
                     ComboBox {
                         id: telemetry2BaudCombo
                         Layout.fillWidth: true
-                        model: ["9600", "19200", "38400", "57600", "115200"]
-                        currentIndex: 1
+                        // Listede olmayan özel hızlar (USB-CDC) elle yazılabilir
+                        editable: true
+                        model: ["Otomatik", "9600", "19200", "38400", "57600", "115200", "230400", "460800", "921600"]
+                        currentIndex: 2
                     }
                 }
                 
@@ -495,18 +1349,9 @@ ApplicationWindow {
                     height: 25
                     onClicked: {
                         if (serialManager) {
+                            // Tarama arka planda yapılır; sonuçlar onPortAdded/onPortScanFinished ile gelir
                             console.log("[QML] Telemetri2 portları taranıyor...");
-                            var ports = serialManager.scan_ports();
-                            telemetry2PortModel.clear();
-                            if (ports.length === 0) {
-                                telemetry2PortModel.append({name: "Port yok", path: ""});
-                                console.log("[QML] Telemetri2 portu bulunamadı");
-                            } else {
-                                for (var i = 0; i < ports.length; ++i) {
-                                    telemetry2PortModel.append(ports[i]);
-                                    console.log("[QML] Telemetri2 portu eklendi:", ports[i].name);
-                                }
-                            }
+                            serialManager.scan_ports_async(false);
                         }
                     }
                 }
@@ -545,10 +1390,11 @@ ApplicationWindow {
                         onClicked: {
                             if (serialManager && telemetry2PortModel.count > 0 && telemetry2Combo.currentIndex >= 0) {
                                 var portPath = telemetry2PortModel.get(telemetry2Combo.currentIndex).path;
-                                var baud = parseInt(telemetry2BaudCombo.currentText);
+                                var baud = baudValue(telemetry2BaudCombo.editText);
                                 var success = serialManager.connect_telemetry2(portPath, baud);
                                 if (success) {
-                                    telemetry2StatusText.text = "Telemetri2: ✅ Bağlı (" + portPath + ")";
+                                    telemetry2StatusText.text = baud === 0 ? "Telemetri2: 🔎 Baud aranıyor (" + portPath + ")"
+                                                                    : "Telemetri2: ✅ Bağlı (" + portPath + ")";
                                 }
                             }
                         }
@@ -609,7 +1455,9 @@ ApplicationWindow {
                     ComboBox {
                         id: judgeBaudCombo
                         Layout.fillWidth: true
-                        model: ["9600", "19200", "38400", "57600", "115200"]
+                        // Hakem portu yalnızca gönderir, hız otomatik tespit edilemez
+                        editable: true
+                        model: ["9600", "19200", "38400", "57600", "115200", "230400", "460800", "921600"]
                         currentIndex: 1
                     }
                 }
@@ -623,18 +1471,9 @@ ApplicationWindow {
                     height: 25
                     onClicked: {
                         if (serialManager) {
+                            // Tarama arka planda yapılır; sonuçlar onPortAdded/onPortScanFinished ile gelir
                             console.log("[QML] Hakem portları taranıyor...");
-                            var ports = serialManager.scan_ports();
-                            judgePortModel.clear();
-                            if (ports.length === 0) {
-                                judgePortModel.append({name: "Port yok", path: ""});
-                                console.log("[QML] Hakem portu bulunamadı");
-                            } else {
-                                for (var i = 0; i < ports.length; ++i) {
-                                    judgePortModel.append(ports[i]);
-                                    console.log("[QML] Hakem portu eklendi:", ports[i].name);
-                                }
-                            }
+                            serialManager.scan_ports_async(false);
                         }
                     }
                 }
@@ -677,7 +1516,7 @@ ApplicationWindow {
                             }
                             if (serialManager && judgePortModel.count > 0 && judgeCombo.currentIndex >= 0) {
                                 var portPath = judgePortModel.get(judgeCombo.currentIndex).path;
-                                var baud = parseInt(judgeBaudCombo.currentText);
+                                var baud = baudValue(judgeBaudCombo.editText);
                                 var success = serialManager.connect_judge(portPath, baud);
                                 if (success) {
                                     judgeStatusText.text = "Hakem: ✅ Bağlı (" + portPath + ")";
@@ -729,42 +1568,75 @@ ApplicationWindow {
                     Layout.alignment: Qt.AlignHCenter
                 }
                 
-                TableView {
-                    id: telemetryTable
+                RowLayout {
                     Layout.fillWidth: true
                     Layout.fillHeight: true
-                    model: ListModel {
-                        id: telemetryModel
-                        ListElement { field: "Takım ID"; value: "-" }
-                        ListElement { field: "Paket Sayacı"; value: "-" }
-                        ListElement { field: "Durum"; value: "-" }
-                        ListElement { field: "Açı"; value: "-" }
-                        ListElement { field: "İrtifa"; value: "-" }
-                        ListElement { field: "Roket GPS İrtifa"; value: "-" }
-                        ListElement { field: "Roket Enlem"; value: "-" }
-                        ListElement { field: "Roket Boylam"; value: "-" }
-                        ListElement { field: "Görev Yükü GPS İrtifa"; value: "-" }
-                        ListElement { field: "Görev Yükü Enlem"; value: "-" }
-                        ListElement { field: "Görev Yükü Boylam"; value: "-" }
-                        ListElement { field: "Jiroskop X"; value: "-" }
-                        ListElement { field: "Jiroskop Y"; value: "-" }
-                        ListElement { field: "Jiroskop Z"; value: "-" }
-                        ListElement { field: "Ana Sistem İvme X"; value: "-" }
-                        ListElement { field: "Ana Sistem İvme Y"; value: "-" }
-                        ListElement { field: "Ana Sistem İvme Z"; value: "-" }
-                                        ListElement { field: "RMS Internal"; value: "-" }
-                ListElement { field: "RMS External"; value: "-" }
-                    }
+                    spacing: 8
+
+                    TableView {
+                        id: telemetryTable
+                        Layout.preferredWidth: 460
+                        Layout.fillHeight: true
+                        // Python tarafındaki model yalnızca değişen satırları bildirir
+                        model: telemetryTableModel
                     
-                    TableViewColumn {
-                        title: "Alan"
-                        role: "field"
-                        width: 200
+                        TableViewColumn {
+                            title: "Alan"
+                            role: "field"
+                            width: 200
+                        }
+                        TableViewColumn {
+                            title: "Değer"
+                            role: "value"
+                            width: 150
+                        }
+                        TableViewColumn {
+                            title: "Min"
+                            role: "min"
+                            width: 100
+                            visible: telemetryTableModel ? telemetryTableModel.extraColumns : false
+                        }
+                        TableViewColumn {
+                            title: "Max"
+                            role: "max"
+                            width: 100
+                            visible: telemetryTableModel ? telemetryTableModel.extraColumns : false
+                        }
+                        TableViewColumn {
+                            title: "Hız (Hz)"
+                            role: "rate"
+                            width: 80
+                            visible: telemetryTableModel ? telemetryTableModel.extraColumns : false
+                        }
                     }
-                    TableViewColumn {
-                        title: "Değer"
-                        role: "value"
-                        width: 150
+
+                    // Canlı grafikler: telemetri geçmişinden piksel başına min/max özetle çizilir
+                    ColumnLayout {
+                        Layout.fillWidth: true
+                        Layout.fillHeight: true
+                        spacing: 4
+
+                        TelemetryPlot {
+                            Layout.fillWidth: true
+                            Layout.fillHeight: true
+                            manager: serialManager
+                            title: "İrtifa (m)"
+                            channels: "altitude,gps_altitude"
+                        }
+                        TelemetryPlot {
+                            Layout.fillWidth: true
+                            Layout.fillHeight: true
+                            manager: serialManager
+                            title: "İvme X/Y/Z"
+                            channels: "acc_x,acc_y,acc_z"
+                        }
+                        TelemetryPlot {
+                            Layout.fillWidth: true
+                            Layout.fillHeight: true
+                            manager: serialManager
+                            title: "Jiroskop X/Y/Z"
+                            channels: "gyro_x,gyro_y,gyro_z"
+                        }
                     }
                 }
             }
@@ -802,50 +1674,17 @@ ApplicationWindow {
                 }
             }
         }
-        function onTelemetry_data_changed() {
-            if (serialManager && serialManager.telemetry_data_property) {
-                var data = serialManager.telemetry_data_property;
-                if (data.fields) {
-                    for (var i = 0; i < telemetryModel.count; ++i) {
-                        var fieldName = telemetryModel.get(i).field;
-                        var value = data.fields[fieldName];
-                        if (value !== undefined && value !== null) {
-                            telemetryModel.setProperty(i, "value", value);
-                        }
-                    }
-                    
-                    // Harita koordinatlarını güncelle
-                    updateMapCoordinates(data.fields);
-                }
-            }
-        }
-        
-        function updateMapCoordinates(fields) {
+        function onMainPositionChanged(lat, lon) {
             // Ana sistem koordinatları
-            var rocketLat = fields["Roket Enlem"];
-            var rocketLon = fields["Roket Boylam"];
-            if (rocketLat && rocketLon) {
-                var lat = parseFloat(rocketLat.replace("°", ""));
-                var lon = parseFloat(rocketLon.replace("°", ""));
-                if (!isNaN(lat) && !isNaN(lon)) {
-                    anaSistemLat = lat;
-                    anaSistemLon = lon;
-                    anaSistemKoordinat.text = "Ana Sistem: " + lat.toFixed(6) + "°N, " + lon.toFixed(6) + "°E";
-                }
-            }
-            
+            anaSistemLat = lat;
+            anaSistemLon = lon;
+            anaSistemKoordinat.text = "Ana Sistem: " + lat.toFixed(6) + "°N, " + lon.toFixed(6) + "°E";
+        }
+        function onPayloadPositionChanged(lat, lon) {
             // Görev yükü koordinatları
-            var payloadLat = fields["Görev Yükü Enlem"];
-            var payloadLon = fields["Görev Yükü Boylam"];
-            if (payloadLat && payloadLon) {
-                var lat = parseFloat(payloadLat.replace("°", ""));
-                var lon = parseFloat(payloadLon.replace("°", ""));
-                if (!isNaN(lat) && !isNaN(lon)) {
-                    gorevYukuLat = lat;
-                    gorevYukuLon = lon;
-                    gorevYukuKoordinat.text = "Görev Yükü: " + lat.toFixed(6) + "°N, " + lon.toFixed(6) + "°E";
-                }
-            }
+            gorevYukuLat = lat;
+            gorevYukuLon = lon;
+            gorevYukuKoordinat.text = "Görev Yükü: " + lat.toFixed(6) + "°N, " + lon.toFixed(6) + "°E";
         }
         function onPortsChanged(ports) {
             // Telemetri port modelini güncelle
@@ -880,12 +1719,45 @@ ApplicationWindow {
             
             console.log("[QML] Port listeleri güncellendi");
         }
+        function onPortAdded(port) {
+            var models = portModels();
+            for (var i = 0; i < models.length; ++i)
+                addPort(models[i], port);
+            console.log("[QML] Port eklendi:", port.name);
+        }
+        function onPortRemoved(portPath) {
+            var models = portModels();
+            for (var i = 0; i < models.length; ++i)
+                removePort(models[i], portPath);
+            console.log("[QML] Port kaldırıldı:", portPath);
+        }
+        function onBaudDetected(portKey, baud) {
+            var combo = portKey === "telemetry" ? telemetryBaudCombo : telemetry2BaudCombo;
+            var statusText = portKey === "telemetry" ? telemetryStatusText : telemetry2StatusText;
+            if (baud > 0) {
+                var index = combo.find(String(baud));
+                if (index >= 0)
+                    combo.currentIndex = index;
+            } else {
+                statusText.text = (portKey === "telemetry" ? "Telemetri" : "Telemetri2") + ": ❌ Baud bulunamadı";
+            }
+            console.log("[QML] Baud tespiti:", portKey, baud);
+        }
+        function onPortScanFinished(ports) {
+            var models = portModels();
+            for (var i = 0; i < models.length; ++i) {
+                if (ports.length === 0) {
+                    models[i].clear();
+                    models[i].append({name: "Port yok", path: ""});
+                }
+            }
+            console.log("[QML] Port taraması bitti:", ports.length, "port");
+        }
     }
     
     Component.onCompleted: {
         // Başlangıçta bağlantı durumunu kontrol et
         if (serialManager) {
-            mapHtmlPath = serialManager.map_html_path || "";
             if (serialManager.telemetryConnected) {
                 telemetryStatusText.text = "Telemetri: ✅ Bağlı (" + (serialManager.telemetryPortName || "") + ")";
             }
@@ -916,141 +1788,2909 @@ ApplicationWindow {
 }
 '''
 
-class SerialManager(QObject):
-    # Signals
-    telemetry_data_changed = pyqtSignal()
-    telemetry_ports_changed = pyqtSignal()
-    telemetryConnectedChanged = pyqtSignal()
-    telemetry2ConnectedChanged = pyqtSignal()
-    judgeConnectedChanged = pyqtSignal()
-    telemetry_status_changed = pyqtSignal()
-    telemetry2_status_changed = pyqtSignal()
-    judge_status_changed = pyqtSignal()
-    portsChanged = pyqtSignal(list)  # QML için portsChanged sinyali
-    
-    def __init__(self):
-        super().__init__()
-        self.telemetry_port = None  # Ana sistem
-        self.telemetry2_port = None  # Görev yükü
-        self.judge_port = None  # Hakem
-        self._telemetry_connected = False
-        self._telemetry2_connected = False
-        self._judge_connected = False
-        self._telemetry_port_name = ""
-        self._telemetry2_port_name = ""
-        self._judge_port_name = ""
-        self.team_id = 1
-        self.telemetry_data = {'fields': {}}
-        self.angle = 0.0
-        self.map_html_path = ""
-        self.packet_counter = 0
-        
-        # Veri birleştirme sistemi için değişkenler
-        self.ana_sistem_data = {}  # Ana sistem verilerini sakla
-        self.gorev_yuku_data = {}  # Görev yükü verilerini sakla
-        self.judge_timer = None  # Hakem gönderme timer'ı
-        self.judge_send_interval = 200  # 200ms = 5Hz (saniyede 5 kere)
-        
+class LineFramer:
+    """Seri porttan gelen ham baytları satırlara böler, yarım kalan satırı bir sonraki okumaya taşır"""
+    mode = 'line'
 
-        
-        # Harita dosyasını oluştur
-        self.map_html_path = create_map_html()
-        
-        # Hakem gönderme timer'ını başlat
-        self._start_judge_timer()
-    
-    def _start_judge_timer(self):
-        """Hakem gönderme timer'ını başlatır"""
-        if self.judge_timer is None:
-            self.judge_timer = QTimer()
-            self.judge_timer.timeout.connect(self._send_combined_data_to_judge)
-            self.judge_timer.start(self.judge_send_interval)
-            print(f"[PYTHON] ✅ Hakem gönderme timer başlatıldı ({self.judge_send_interval}ms = {1000//self.judge_send_interval}Hz)")
-    
-    @pyqtSlot(int)
-    def set_judge_send_frequency(self, frequency_hz):
-        """Hakem gönderme frekansını ayarlar (Hz cinsinden)"""
-        if frequency_hz < 1 or frequency_hz > 10:  # 1-10 Hz arası sınırla
-            print(f"[PYTHON] ❌ Geçersiz frekans: {frequency_hz}Hz (1-10 Hz arası olmalı)")
-            return
-        
-        self.judge_send_interval = 1000 // frequency_hz  # Hz'i ms'e çevir
-        if self.judge_timer and self.judge_timer.isActive():
-            self.judge_timer.setInterval(self.judge_send_interval)
-            print(f"[PYTHON] ✅ Hakem gönderme frekansı güncellendi: {frequency_hz}Hz ({self.judge_send_interval}ms)")
-        else:
-            print(f"[PYTHON] ⚠️ Timer aktif değil, frekans ayarlandı: {frequency_hz}Hz")
-    
-    @pyqtSlot(result=int)
-    def get_judge_send_frequency(self):
-        """Mevcut hakem gönderme frekansını döndürür (Hz cinsinden)"""
-        return 1000 // self.judge_send_interval
-    
-    def _send_combined_data_to_judge(self):
-        """Birleştirilmiş verileri hakeme gönderir"""
-        try:
-            if not self.judge_port or not self.judge_port.isOpen():
-                return
-                
-            # Paket sayacını artır
-            self.packet_counter = (self.packet_counter + 1) % 256
-            
-            # Ana sistem verilerini al (varsayılan değerler)
-            ana_altitude = self.ana_sistem_data.get('altitude', 0.0)
-            ana_gps_altitude = self.ana_sistem_data.get('gps_altitude', 0.0)
-            ana_latitude = self.ana_sistem_data.get('latitude', 0.0)
-            ana_longitude = self.ana_sistem_data.get('longitude', 0.0)
-            ana_gyro_x = self.ana_sistem_data.get('gyro_x', 0.0)
-            ana_gyro_y = self.ana_sistem_data.get('gyro_y', 0.0)
-            ana_gyro_z = self.ana_sistem_data.get('gyro_z', 0.0)
-            ana_acc_x = self.ana_sistem_data.get('acc_x', 0.0)
-            ana_acc_y = self.ana_sistem_data.get('acc_y', 0.0)
-            ana_acc_z = self.ana_sistem_data.get('acc_z', 0.0)
-            ana_angle = self.ana_sistem_data.get('angle', 0.0)
-            ana_status = self.ana_sistem_data.get('status', 0)
+    def __init__(self, max_line_length=4096):
+        self.max_line_length = max_line_length
+        self._buffer = bytearray()
+        # Port bazlı sayaçlar
+        self.lines_framed = 0
+        self.bytes_dropped = 0
+        self.queue_depth = 0  # Taşınan (henüz satır olmamış) bayt sayısı
+        self.max_queue_depth = 0  # Tek okumada boşaltılan en büyük birikme
+        self.reads = 0
+
+    def feed(self, data):
+        """Yeni baytları ekler ve tamamlanmış tüm satırları (veya çerçeveleri) döndürür"""
+        self.reads += 1
+        if len(data) > self.max_queue_depth:
+            self.max_queue_depth = len(data)
+        self._buffer += data
+        items = self._extract(data)
+        self.lines_framed += len(items)
+        # Çerçeve tamamlanmadan büyüyen tampon bozuk veridir, atılır
+        if len(self._buffer) > self.max_line_length:
+            self.bytes_dropped += len(self._buffer)
+            self._buffer.clear()
+        self.queue_depth = len(self._buffer)
+        return items
+
+    def _extract(self, data):
+        lines = []
+        if b'\n' in data:
+            parts = self._buffer.split(b'\n')
+            # Son parça yarım satırdır, bir sonraki okumaya taşınır
+            self._buffer = bytearray(parts.pop())
+            for part in parts:
+                part = part.strip()
+                if part:
+                    lines.append(bytes(part))
+        return lines
+
+    def decode_failed(self, count=1):
+        """Çıkan öğenin çözülemediğini bildirir; sabit biçimli çerçeveleyicide etkisizdir"""
+
+    def reset(self):
+        """Taşınan yarım satırı temizler (sayaçlar korunur)"""
+        self._buffer.clear()
+        self.queue_depth = 0
+
+    def stats(self):
+        return {
+            'mode': self.mode,
+            'lines_framed': self.lines_framed,
+            'bytes_dropped': self.bytes_dropped,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'reads': self.reads
+        }
+
+# İkili telemetri çerçevesi: AA 55 | tip | uzunluk | yük (little-endian) | CRC16-CCITT (LE)
+BINARY_SYNC = b'\xaa\x55'
+BINARY_HEADER_SIZE = 4
+BINARY_CRC_SIZE = 2
+
+def binary_frame_crc(frame, length):
+    """Tip, uzunluk ve yük baytları üzerinden CRC-16/CCITT-FALSE (C ile hesaplanır)"""
+    return binascii.crc_hqx(memoryview(frame)[2:BINARY_HEADER_SIZE + length], 0xFFFF)
+
+class BinaryFramer(LineFramer):
+    """Senkron baytları, uzunluk ve CRC ile çerçevelenmiş ikili paketleri ayırır"""
+    mode = 'binary'
+
+    def __init__(self, max_line_length=4096):
+        super().__init__(max_line_length)
+        self.crc_errors = 0
+
+    def _extract(self, data):
+        buffer = self._buffer
+        size = len(buffer)
+        frames = []
+        pos = 0
+        while True:
+            start = buffer.find(BINARY_SYNC, pos)
+            if start < 0:
+                # Sondaki tek 0xAA bir sonraki senkronun başı olabilir
+                keep = 1 if size > pos and buffer[-1] == 0xAA else 0
+                self.bytes_dropped += size - pos - keep
+                pos = size - keep
+                break
+            self.bytes_dropped += start - pos
+            pos = start
+            if size - start < BINARY_HEADER_SIZE:
+                break
+            length = buffer[start + 3]
+            end = start + BINARY_HEADER_SIZE + length + BINARY_CRC_SIZE
+            if size < end:
+                break
+            crc = buffer[end - 2] | (buffer[end - 1] << 8)
+            if binary_frame_crc(buffer[start:end], length) == crc:
+                frames.append(bytes(buffer[start:end]))
+                pos = end
+            else:
+                # Hatalı senkron/CRC: bir bayt ilerleyip yeniden senkronize ol
+                self.crc_errors += 1
+                self.bytes_dropped += 1
+                pos = start + 1
+        if pos:
+            del buffer[:pos]
+        return frames
+
+    def stats(self):
+        stats = super().stats()
+        stats['crc_errors'] = self.crc_errors
+        return stats
+
+class AutoFramer(BinaryFramer):
+    """Port akışının JSON satırı mı ikili çerçeve mi olduğunu veriden tespit eder.
+
+    Tespit sırasında yalnızca CRC'si doğru çerçeveler ve JSON nesnesi olarak çözülen satırlar teslim edilir;
+    bir biçim confirm_count kez doğrulanınca o moda geçilir. İkili yükteki tek bir 0x0A satır modunu seçtirmez.
+    Seçilen modda ardışık redetect_after hata (CRC hatası, JSON olmayan satır veya çözme hatası) görülürse
+    tespite geri dönülür.
+    """
+
+    def __init__(self, max_line_length=4096, confirm_count=3, redetect_after=16):
+        super().__init__(max_line_length)
+        self.confirm_count = confirm_count
+        self.redetect_after = redetect_after
+        self.mode = 'auto'
+        self.redetections = 0
+        self._confirmed = {'binary': 0, 'line': 0}
+        self._failures = 0
+
+    @staticmethod
+    def _is_json_line(line):
+        if line[:1] != b'{':
+            return False
+        try:
+            return isinstance(_json_loads(line), dict)
+        except Exception:
+            return False
+
+    def _extract(self, data):
+        if self.mode == 'binary':
+            crc_errors = self.crc_errors
+            frames = BinaryFramer._extract(self, data)
+            self._track(len(frames), self.crc_errors - crc_errors)
+            return frames
+        if self.mode == 'line':
+            lines = LineFramer._extract(self, data)
+            bad = sum(1 for line in lines if line[:1] != b'{')
+            self._track(len(lines) - bad, bad)
+            return lines
+        return self._detect()
+
+    def _detect(self):
+        buffer = self._buffer
+        # İkili deneme tamponun kopyası üzerinde yapılır; sayaçlar tespit sırasında etkilenmez
+        crc_errors, bytes_dropped = self.crc_errors, self.bytes_dropped
+        self._buffer = probe = bytearray(buffer)
+        frames = BinaryFramer._extract(self, probe)
+        consumed = len(buffer) - len(probe)  # İkili denemenin tükettiği bayt sayısı
+        self.crc_errors, self.bytes_dropped = crc_errors, bytes_dropped
+        self._buffer = buffer
+        if frames:
+            del buffer[:consumed]
+            return self._confirm('binary', frames)
+        # Satır denemesi: yalnızca JSON nesnesi olarak çözülen satırlar sayılır
+        line_end = buffer.rfind(b'\n') + 1
+        lines = [bytes(part.strip()) for part in buffer[:line_end].split(b'\n')]
+        lines = [line for line in lines if self._is_json_line(line)]
+        if lines:
+            del buffer[:line_end]
+            return self._confirm('line', lines)
+        # Her iki biçimde de artık tamamlanamayacak önek atılır
+        drop = min(consumed, line_end)
+        if drop:
+            self.bytes_dropped += drop
+            del buffer[:drop]
+        return []
+
+    def _confirm(self, mode, items):
+        other = 'line' if mode == 'binary' else 'binary'
+        self._confirmed[other] = 0
+        self._confirmed[mode] += len(items)
+        if self._confirmed[mode] >= self.confirm_count:
+            self.mode = mode
+            self._failures = 0
+            log_ingest.info('Telemetri biçimi tespit edildi: %s', 'ikili çerçeve' if mode == 'binary' else 'JSON satır')
+        return items
+
+    def _track(self, good, bad):
+        if good:
+            self._failures = 0
+        if bad:
+            self.decode_failed(bad)
+
+    def decode_failed(self, count=1):
+        """Seçili modda çözülemeyen öğeleri bildirir; süreklilik tespitin yeniden başlamasına yol açar"""
+        if self.mode == 'auto':
+            return
+        self._failures += count
+        if self._failures >= self.redetect_after:
+            log_ingest.warning('Telemetri biçimi (%s) art arda %d hata verdi, yeniden tespit ediliyor',
+                               self.mode, self._failures)
+            self.redetections += 1
+            self._restart_detection()
+
+    def _restart_detection(self):
+        self.mode = 'auto'
+        self._failures = 0
+        self._confirmed = {'binary': 0, 'line': 0}
+
+    def reset(self):
+        super().reset()
+        self._restart_detection()
+
+    def stats(self):
+        stats = super().stats()
+        stats['redetections'] = self.redetections
+        return stats
+
+# En hızlı JSON çözücü: orjson > ujson > standart json (hepsi doğrudan bayt kabul eder)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    JSON_BACKEND = 'orjson'
+except ImportError:
+    try:
+        import ujson
+        _json_loads = ujson.loads
+        JSON_BACKEND = 'ujson'
+    except ImportError:
+        _json_loads = json.loads
+        JSON_BACKEND = 'json'
+
+def _fmt(value, spec):
+    """Değeri biçimler; sayı olmayan değer (ör. 'ovf') arayüz thread'ini düşürmek yerine olduğu gibi yazılır"""
+    try:
+        return format(value, spec)
+    except (TypeError, ValueError):
+        return str(value)
+
+class TelemetrySample:
+    """Tek telemetri örneği: alanlar __slots__ ile tutulur, received_at monotonik alış zamanıdır.
+
+    Görüntü metinleri yalnızca ilk istendiğinde üretilir ve örnekle birlikte saklanır.
+    """
+    __slots__ = ('received_at', '_display')
+    _fields = ()
+    kaynak = ''
+
+    @classmethod
+    def _make(cls, values, received_at=None):
+        return cls(*values, received_at=received_at)
+
+    def astuple(self):
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def display_fields(self):
+        """Tablo alan adı -> biçimlendirilmiş değer (ilk çağrıda hesaplanır)"""
+        display = self._display
+        if display is None:
+            display = self._display = self._format()
+        return display
+
+    def _format(self):
+        raise NotImplementedError
+
+    def __repr__(self):
+        values = ', '.join(f'{name}={getattr(self, name)!r}' for name in self._fields)
+        return f'{type(self).__name__}({values})'
+
+class MainSystemSample(TelemetrySample):
+    """Ana sistem (anakart) telemetri örneği"""
+    __slots__ = ('altitude', 'gps_altitude', 'latitude', 'longitude', 'gyro_x', 'gyro_y', 'gyro_z',
+                 'angle', 'acc_x', 'acc_y', 'acc_z', 'status')
+    _fields = __slots__
+    kaynak = 'anakart'
+
+    def __init__(self, altitude, gps_altitude, latitude, longitude, gyro_x, gyro_y, gyro_z,
+                 angle, acc_x, acc_y, acc_z, status, received_at=None):
+        self.altitude = altitude
+        self.gps_altitude = gps_altitude
+        self.latitude = latitude
+        self.longitude = longitude
+        self.gyro_x = gyro_x
+        self.gyro_y = gyro_y
+        self.gyro_z = gyro_z
+        self.angle = angle
+        self.acc_x = acc_x
+        self.acc_y = acc_y
+        self.acc_z = acc_z
+        self.status = status
+        self.received_at = time.monotonic() if received_at is None else received_at
+        self._display = None
+
+    def _format(self):
+        return {
+            'Durum': str(self.status),
+            'Açı': f"{_fmt(self.angle, '.1f')}°",
+            'İrtifa': f"{_fmt(self.altitude, '.1f')} m",
+            'Roket GPS İrtifa': f"{_fmt(self.gps_altitude, '.1f')} m",
+            'Roket Enlem': f"{_fmt(self.latitude, '.6f')}°",
+            'Roket Boylam': f"{_fmt(self.longitude, '.6f')}°",
+            'Jiroskop X': _fmt(self.gyro_x, '.2f'),
+            'Jiroskop Y': _fmt(self.gyro_y, '.2f'),
+            'Jiroskop Z': _fmt(self.gyro_z, '.2f'),
+            'Ana Sistem İvme X': _fmt(self.acc_x, '.2f'),
+            'Ana Sistem İvme Y': _fmt(self.acc_y, '.2f'),
+            'Ana Sistem İvme Z': _fmt(self.acc_z, '.2f')
+        }
+
+class PayloadSample(TelemetrySample):
+    """Görev yükü telemetri örneği"""
+    __slots__ = ('altitude', 'gps_altitude', 'latitude', 'longitude', 'rms_internal', 'rms_external', 'status')
+    _fields = __slots__
+    kaynak = 'gorev_yuku'
+
+    def __init__(self, altitude, gps_altitude, latitude, longitude, rms_internal, rms_external, status,
+                 received_at=None):
+        self.altitude = altitude
+        self.gps_altitude = gps_altitude
+        self.latitude = latitude
+        self.longitude = longitude
+        self.rms_internal = rms_internal  # Sayı veya 'ovf'
+        self.rms_external = rms_external
+        self.status = status
+        self.received_at = time.monotonic() if received_at is None else received_at
+        self._display = None
+
+    def _format(self):
+        return {
+            'Durum': str(self.status),
+            'Görev Yükü GPS İrtifa': f"{_fmt(self.gps_altitude, '.1f')} m",  # Görev yükü GPS irtifa (alt)
+            'Görev Yükü Enlem': f"{_fmt(self.latitude, '.6f')}°",  # Görev yükü enlem (lat)
+            'Görev Yükü Boylam': f"{_fmt(self.longitude, '.6f')}°",  # Görev yükü boylam (lng)
+            'RMS Internal': str(self.rms_internal),
+            'RMS External': _fmt(self.rms_external, '.2f')
+        }
+
+class RingColumns:
+    """Sabit kapasiteli sütunlu halka tampon: kanal başına önceden ayrılmış bir array('d') ve zaman sütunu 't'.
+
+    Ekleme O(1)'dir ve bellek ayırmaz; dolunca en eski örneğin üzerine yazılır. Pencere görünümleri kopyasız
+    memoryview dilimleridir (sarma noktasında iki parça); diziler hiç büyümediği için görünümler güvenle tutulabilir.
+    Sayıya çevrilemeyen değerler (ör. 'ovf') NaN olarak saklanır.
+    """
+
+    def __init__(self, fields, capacity):
+        self.fields = ('t',) + tuple(fields)
+        self.capacity = capacity
+        self.columns = {name: array.array('d', bytes(8 * capacity)) for name in self.fields}
+        self._columns = [self.columns[name] for name in self.fields]
+        self.head = 0  # Bir sonraki yazma konumu
+        self.count = 0
+        self.total = 0  # Son clear()'dan beri eklenen örnek sayısı (artımlı okuyucular için)
+        self.generation = 0  # clear() sayısı: değişirse artımlı okuyucular baştan okur
+
+    def __len__(self):
+        return self.count
+
+    def append(self, t, values):
+        head = self.head
+        columns = self._columns
+        columns[0][head] = t
+        try:
+            for column, value in zip(columns[1:], values):
+                column[head] = value
+        except TypeError:
+            for column, value in zip(columns[1:], values):
+                try:
+                    column[head] = value
+                except TypeError:
+                    column[head] = math.nan
+        self.head = head + 1 if head + 1 < self.capacity else 0
+        if self.count < self.capacity:
+            self.count += 1
+        self.total += 1
+
+    def _segments(self, last):
+        """Son last örneğin (başlangıç, bitiş) aralıkları, eskiden yeniye"""
+        last = self.count if last is None else max(0, min(last, self.count))
+        start = self.head - last
+        if start >= 0:
+            return [(start, self.head)] if last else []
+        return [(start + self.capacity, self.capacity), (0, self.head)] if self.head else [(start + self.capacity, self.capacity)]
+
+    def views(self, name, last=None):
+        """Kanalın son last örneğinin kopyasız görünümleri (1 veya 2 memoryview, eskiden yeniye)"""
+        data = memoryview(self.columns[name])
+        return [data[start:end] for start, end in self._segments(last)]
+
+    def numpy_views(self, name, last=None):
+        """views() ile aynı, NumPy dizisi olarak (NumPy yoksa None)"""
+        if numpy is None:
+            return None
+        return [numpy.frombuffer(view, dtype=numpy.float64) for view in self.views(name, last)]
+
+    def values(self, name, last=None):
+        """Son last örneğin listesi (kopya; QML ve dışa aktarım için)"""
+        result = []
+        for view in self.views(name, last):
+            result.extend(view)
+        return result
+
+    def count_since(self, t):
+        """Zamanı t veya sonrası olan örnek sayısı (zaman sütunu artan olduğundan ikili arama)"""
+        times = self.columns['t']
+        low, high = 0, self.count  # Mantıksal sıra: 0 en eski örnek
+        oldest = self.head - self.count
+        while low < high:
+            mid = (low + high) // 2
+            if times[(oldest + mid) % self.capacity] < t:
+                low = mid + 1
+            else:
+                high = mid
+        return self.count - low
+
+    def latest(self, name):
+        if not self.count:
+            return None
+        return self.columns[name][self.head - 1]
+
+    def oldest_time(self):
+        if not self.count:
+            return None
+        return self.columns['t'][(self.head - self.count) % self.capacity]
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        self.total = 0
+        self.generation += 1
+
+    def nbytes(self):
+        return 8 * self.capacity * len(self.fields)
+
+class TelemetryHistory:
+    """Kaynak başına RingColumns: ana sistem ve görev yükü örneklerinin tüm kanalları"""
+
+    def __init__(self, capacity=65536):
+        self.capacity = capacity
+        self.sources = {
+            'anakart': RingColumns(MainSystemSample._fields, capacity),
+            'gorev_yuku': RingColumns(PayloadSample._fields, capacity)
+        }
+
+    def __getitem__(self, kaynak):
+        return self.sources[kaynak]
+
+    def append(self, sample):
+        self.sources[sample.kaynak].append(sample.received_at, sample.astuple())
+
+    def rate(self, kaynak, window_s, now=None):
+        """Kaynağın son window_s saniyedeki alış hızı (Hz); hiç örnek yoksa None"""
+        ring = self.sources[kaynak]
+        oldest = ring.oldest_time()
+        if oldest is None:
+            return None
+        now = time.monotonic() if now is None else now
+        # Kayıt pencereden kısaysa (ilk saniyeler) yalnızca kapsanan süreye bölünür
+        span = min(window_s, now - oldest)
+        return ring.count_since(now - window_s) / span if span > 0 else None
+
+    def stats(self):
+        return {kaynak: {'count': ring.count, 'total': ring.total, 'capacity': ring.capacity, 'bytes': ring.nbytes()}
+                for kaynak, ring in self.sources.items()}
+
+# Veri gelmemiş kaynaklar için hakem paketinde kullanılan sıfır örnekler
+EMPTY_MAIN_SYSTEM_SAMPLE = MainSystemSample(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, received_at=0.0)
+EMPTY_PAYLOAD_SAMPLE = PayloadSample(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, received_at=0.0)
+
+# Ana sistem verisi gelmeden görev yükü geldiğinde tabloda gösterilen değerler
+MAIN_SYSTEM_PLACEHOLDER_FIELDS = {
+    'Roket GPS İrtifa': "0.0 m",
+    'Roket Enlem': "0.000000°",
+    'Roket Boylam': "0.000000°",
+    'Jiroskop X': "0.00",
+    'Jiroskop Y': "0.00",
+    'Jiroskop Z': "0.00",
+    'Ana Sistem İvme X': "0.00",
+    'Ana Sistem İvme Y': "0.00",
+    'Ana Sistem İvme Z': "0.00"
+}
+
+class FreshnessMerger:
+    """Hakem paketi için kaynak bazında tazelik farkındalıklı birleştirme.
+
+    Her kaynağın (son örnek, önceki örnek) çifti değişmez bir demet olarak tek atamayla değiştirilir;
+    hakem thread'i demeti tek okumada alır, kilit veya kopya gerekmez. update() alım yolunda (işçi thread'i
+    veya doğrudan okuma) çağrılır; GUI olay döngüsünün gecikmesi hakem paketine yansımaz. Örnek stale_after
+    saniyeden eskiyse politika uygulanır:
+      hold         son değeri gönder
+      dead_reckon  son iki örnekten hız hesaplayıp konumu/irtifayı en fazla max_extrapolation s ileri taşı
+      flag         eski kaynağın tüm alanlarını (durum dahil) sıfır gönder, yani kaynaktan hiç veri gelmemiş
+                   gibi, ve uyar
+    HYİ paketinde tazelik alanı yoktur; eski kaynak içeren paketler uçuş kaydına RECORD_JUDGE_STALE türüyle yazılır.
+    """
+    POLICIES = ('hold', 'dead_reckon', 'flag')
+    EMPTY = {'anakart': EMPTY_MAIN_SYSTEM_SAMPLE, 'gorev_yuku': EMPTY_PAYLOAD_SAMPLE}
+    POSITION_FIELDS = ('altitude', 'gps_altitude', 'latitude', 'longitude')
+
+    def __init__(self, policy='hold', stale_after=1.0, max_extrapolation=3.0):
+        if policy not in self.POLICIES:
+            raise ValueError(f'Bilinmeyen eski veri politikası: {policy}')
+        self.policy = policy
+        self.stale_after = stale_after
+        self.max_extrapolation = max_extrapolation
+        self._samples = {kaynak: (None, None) for kaynak in self.EMPTY}
+        self._stale = {kaynak: False for kaynak in self.EMPTY}
+        self.stale_frames = {kaynak: 0 for kaynak in self.EMPTY}
+        self.out_of_order = 0  # Son örnekten eski olduğu için atılan örnekler
+
+    def update(self, sample):
+        """Yeni örneği kaynağının son örneği yapar (alıcı thread).
+
+        Aynı kaynağı iki thread besleyebilir (ör. iki port aynı şemada); son örnekten eski örnek atılır (eşit
+        zaman damgası kabul edilir), böylece demetteki önceki örnek sonrakinden yeni olamaz ve ölü hesap hızı
+        bozulmaz. Eşzamanlı iki yazımda en yeni örnek bir sonraki örneğe kadar kaybolabilir, sıralama bozulmaz.
+        """
+        kaynak = sample.kaynak
+        latest = self._samples[kaynak][0]
+        if latest is not None and sample.received_at < latest.received_at:
+            self.out_of_order += 1
+            return
+        self._samples[kaynak] = (sample, latest)
+
+    def latest(self, kaynak):
+        return self._samples[kaynak][0]
+
+    def is_stale(self, kaynak):
+        """Son resolve() çağrısında kaynak eski miydi (hakem thread'i)"""
+        return self._stale[kaynak]
+
+    def age(self, kaynak, now=None):
+        """Son örneğin yaşı (s); hiç örnek yoksa None"""
+        sample = self._samples[kaynak][0]
+        if sample is None:
+            return None
+        return (time.monotonic() if now is None else now) - sample.received_at
+
+    def resolve(self, kaynak, now):
+        """Hakem paketine girecek örneği politikaya göre döndürür (gönderici thread)"""
+        sample, previous = self._samples[kaynak]
+        if sample is None:
+            # Hiç veri gelmemiş kaynak da eskidir: sıfır değerler gönderilir ve paket eski olarak işaretlenir
+            if not self._stale[kaynak]:
+                self._stale[kaynak] = True
+                log_judge.warning('⚠️ %s verisi henüz gelmedi, hakem paketinde sıfır gönderiliyor', kaynak)
+            self.stale_frames[kaynak] += 1
+            return self.EMPTY[kaynak]
+        age = now - sample.received_at
+        stale = age > self.stale_after
+        if stale != self._stale[kaynak]:
+            self._stale[kaynak] = stale
+            if stale:
+                log_judge.warning('⚠️ %s verisi %.1f s\'dir gelmiyor (politika: %s)', kaynak, age, self.policy)
+            else:
+                log_judge.info('%s verisi yeniden güncel', kaynak)
+        if not stale:
+            return sample
+        self.stale_frames[kaynak] += 1
+        if self.policy == 'flag':
+            return self.EMPTY[kaynak]
+        if self.policy == 'dead_reckon' and previous is not None:
+            return self._extrapolate(sample, previous, min(age, self.max_extrapolation))
+        return sample
+
+    def _extrapolate(self, sample, previous, horizon):
+        dt = sample.received_at - previous.received_at
+        if dt <= 0:
+            return sample
+        values = dict(zip(sample._fields, sample.astuple()))
+        for name in self.POSITION_FIELDS:
+            current, before = values[name], getattr(previous, name)
+            if isinstance(current, (int, float)) and isinstance(before, (int, float)):
+                values[name] = current + (current - before) / dt * horizon
+        return type(sample)._make([values[name] for name in sample._fields], sample.received_at)
+
+    def snapshot(self, now=None):
+        now = time.monotonic() if now is None else now
+        result = {}
+        for kaynak in self.EMPTY:
+            age = self.age(kaynak, now)
+            result[kaynak] = {
+                'age_s': round(age, 3) if age is not None else -1.0,
+                'stale': age is None or age > self.stale_after,
+                'stale_frames': self.stale_frames[kaynak]
+            }
+        result['out_of_order'] = self.out_of_order
+        result['policy'] = self.policy
+        result['stale_after_s'] = self.stale_after
+        return result
+
+class BinarySchema:
+    """İkili çerçeve yükünün tablo tanımı: (kayıt alanı, struct biçimi) sırası, takma adlar ve varsayılanlar"""
+
+    def __init__(self, msg_type, record_type, fields, aliases=None, defaults=None):
+        self.msg_type = msg_type
+        self.record_type = record_type
+        self.fields = tuple(fields)
+        self.struct = struct.Struct('<' + ''.join(fmt for _, fmt in self.fields))
+        names = [name for name, _ in self.fields]
+        aliases = aliases or {}
+        defaults = defaults or {}
+        # Kayıt alanlarının, çözülmüş değerler + sabitler demetindeki sırası
+        extra = []
+        order = []
+        for field in record_type._fields:
+            if field in names:
+                order.append(names.index(field))
+            elif field in aliases:
+                order.append(names.index(aliases[field]))
+            else:
+                order.append(len(names) + len(extra))
+                extra.append(defaults.get(field, 0.0))
+        self._extra = tuple(extra)
+        self._getter = operator.itemgetter(*order)
+        self._source = tuple(names)
+
+    def decode(self, payload):
+        return self.record_type._make(self._getter(self.struct.unpack(payload) + self._extra))
+
+    def encode(self, record):
+        """Kaydı tam ikili çerçeveye (senkron, tip, uzunluk, yük, CRC) kodlar"""
+        values = []
+        for (name, fmt) in self.fields:
+            value = getattr(record, name)
+            if fmt in 'fd' and not isinstance(value, (int, float)):
+                value = float('nan')  # ör. 'ovf'
+            values.append(value)
+        frame = bytearray(BINARY_SYNC)
+        frame.append(self.msg_type)
+        frame.append(self.struct.size)
+        frame += self.struct.pack(*values)
+        crc = binary_frame_crc(frame, self.struct.size)
+        frame += struct.pack('<H', crc)
+        return bytes(frame)
+
+# İkili çerçeve tipleri (görev yükü tipi JSON'daki header 82 ile aynıdır)
+BINARY_SCHEMAS = {
+    0x01: BinarySchema(0x01, MainSystemSample, (
+        ('altitude', 'f'), ('gps_altitude', 'f'), ('latitude', 'f'), ('longitude', 'f'),
+        ('gyro_x', 'f'), ('gyro_y', 'f'), ('gyro_z', 'f'), ('angle', 'f'),
+        ('acc_x', 'f'), ('acc_y', 'f'), ('acc_z', 'f'), ('status', 'B'))),
+    0x52: BinarySchema(0x52, PayloadSample, (
+        ('altitude', 'f'), ('latitude', 'f'), ('longitude', 'f'),
+        ('rms_internal', 'f'), ('rms_external', 'f'), ('status', 'B')),
+        aliases={'gps_altitude': 'altitude'})
+}
+
+def decode_binary_frame(frame):
+    """Framer'ın CRC'sini doğruladığı ikili çerçeveyi tip tablosuna göre kayda çözer"""
+    schema = BINARY_SCHEMAS.get(frame[2])
+    if schema is None:
+        raise ValueError(f"Bilinmeyen ikili çerçeve tipi: 0x{frame[2]:02X}")
+    length = frame[3]
+    if length != schema.struct.size:
+        raise ValueError(f"İkili çerçeve uzunluğu hatalı: {length} (beklenen {schema.struct.size})")
+    return schema.decode(frame[BINARY_HEADER_SIZE:BINARY_HEADER_SIZE + length])
+
+class TelemetryDecoder:
+    """Bir porta bağlanan şema çözücüsünün temeli; kaynak bazında çözme maliyetini ölçer"""
+    schema = ''
+    record_type = None  # Kabul edilen kayıt türü (None: hepsi)
+
+    def __init__(self):
+        self.errors = 0
+        self.stats = {}  # kaynak -> [adet, toplam_ns]
+
+    def decode(self, raw):
+        """Ham satırı veya ikili çerçeveyi kayda çözer; hatada ValueError/TypeError yükselir"""
+        start = time.perf_counter_ns()
+        try:
+            if raw[:2] == BINARY_SYNC:
+                # İkili çerçeveler tiplerini kendileri taşır; tip portun şemasına uymalı
+                record = decode_binary_frame(raw)
+                if self.record_type is not None and type(record) is not self.record_type:
+                    raise ValueError(f"İkili çerçeve tipi 0x{raw[2]:02X} ({record.kaynak}) "
+                                     f"'{self.schema}' şemalı portta kabul edilmez")
+                record = validate_record(record)
+            else:
+                record = self.from_dict(_json_loads(raw))
+        except Exception:
+            self.errors += 1
+            raise
+        entry = self.stats.get(record.kaynak)
+        if entry is None:
+            entry = self.stats[record.kaynak] = [0, 0]
+        entry[0] += 1
+        entry[1] += time.perf_counter_ns() - start
+        return record
+
+    def from_dict(self, data):
+        raise NotImplementedError
+
+    def snapshot(self):
+        sources = {}
+        for kaynak, (count, total_ns) in self.stats.items():
+            sources[kaynak] = {
+                'count': count,
+                'mean_us': round(total_ns / count / 1000.0, 3) if count else 0.0
+            }
+        return {'schema': self.schema, 'backend': JSON_BACKEND, 'errors': self.errors, 'sources': sources}
+
+def _number(value):
+    """JSON değerini sonlu float'a çevirir; metin, null veya NaN/inf kaydı geçersiz kılar"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Sayısal olmayan telemetri değeri: {value!r}") from None
+    if not math.isfinite(number):
+        raise ValueError(f"Sonlu olmayan telemetri değeri: {value!r}")
+    return number
+
+def _status(value):
+    """Durum alanı HYİ paketinde tek bayttır: 0..255 aralığında tam sayı olmalıdır"""
+    number = _number(value)
+    status = int(number)
+    if status != number or not 0 <= status <= 255:
+        raise ValueError(f"Geçersiz durum değeri: {value!r}")
+    return status
+
+def _rms(value):
+    """RMS alanı sayı veya taşma işareti 'ovf' olabilir (ikili çerçevede 'ovf' NaN olarak taşınır)"""
+    if value == 'ovf' or (value.__class__ is float and value != value):
+        return 'ovf'
+    return _number(value)
+
+# Kayıt alanı -> dönüştürücü; listede olmayan alanlar float'a çevrilir
+FIELD_COERCERS = {'status': _status, 'rms_internal': _rms}
+
+def validate_record(record):
+    """Kaydın her alanını JSON yolundaki dönüştürücülerden geçirir (ikili çerçevelerde NaN/inf ve durum denetimi)"""
+    try:
+        # Hızlı yol: toplam sonluysa tüm alanlar sonludur (ikili durum baytı zaten 0..255)
+        if math.isfinite(sum(record.astuple())) and 0 <= record.status <= 255:
+            return record
+    except TypeError:
+        pass
+    return record._make([FIELD_COERCERS.get(name, _number)(value)
+                         for name, value in zip(record._fields, record.astuple())], record.received_at)
+
+class MainBoardDecoder(TelemetryDecoder):
+    """Ana sistem şeması: {"alt", "gpsAlt", "lat", "lng", "eulX..Z", "pitch", "accX..Z", "state"}
+
+    Yalnızca gpsAlt (varsayılan: alt) ve state (varsayılan: 1) isteğe bağlıdır; diğer anahtarlardan biri
+    eksikse paket başka bir kaynağa aittir ve ValueError ile reddedilir (sıfırlarla doldurulmaz).
+    """
+    schema = 'anakart'
+    record_type = MainSystemSample
+    _required = operator.itemgetter('alt', 'lat', 'lng', 'eulX', 'eulY', 'eulZ', 'pitch', 'accX', 'accY', 'accZ')
+
+    def from_dict(self, data):
+        try:
+            # Hızlı yol: zorunlu alanlar tek C çağrısıyla alınır
+            irtifa, enlem, boylam, *rest = self._required(data)
+        except KeyError as e:
+            raise ValueError(f"Ana sistem paketinde eksik alan: {e}") from None
+        # Ham JSON tipleri birleştiriciye, geçmişe ve HYİ kodlayıcısına ulaşmadan sayıya çevrilir
+        irtifa = _number(irtifa)
+        return MainSystemSample._make([irtifa, _number(data.get('gpsAlt', irtifa)), _number(enlem), _number(boylam)]
+                                      + [_number(v) for v in rest] + [_status(data.get('state', 1))])
+
+class PayloadDecoder(TelemetryDecoder):
+    """Görev yükü şeması: {"header":82,"lat","lng","alt","rms_internal","rms_external"}; yalnızca durum isteğe bağlıdır"""
+    schema = 'gorev_yuku'
+    record_type = PayloadSample
+    _fields = operator.itemgetter('alt', 'lat', 'lng', 'rms_internal', 'rms_external')
+
+    def from_dict(self, data):
+        try:
+            irtifa, enlem, boylam, rms_internal, rms_external = self._fields(data)
+        except KeyError as e:
+            raise ValueError(f"Görev yükü paketinde eksik alan: {e}") from None
+        irtifa = _number(irtifa)
+        # GPS irtifa - 'alt' alanı (aynı)
+        return PayloadSample(irtifa, irtifa, _number(enlem), _number(boylam), _rms(rms_internal),
+                             _number(rms_external), _status(data.get('durum', 1)))
+
+class CustomSchemaDecoder(TelemetryDecoder):
+    """Kullanıcı tanımlı şema: kayıt alanı -> JSON anahtarı eşlemesi ve varsayılan değerler"""
+
+    def __init__(self, schema, record_type, key_map, defaults=None):
+        super().__init__()
+        self.schema = schema
+        self.record_type = record_type
+        self._items = tuple((key_map.get(field, field), (defaults or {}).get(field, 0.0),
+                             FIELD_COERCERS.get(field, _number))
+                            for field in record_type._fields)
+
+    def from_dict(self, data):
+        get = data.get
+        return self.record_type._make([coerce(get(key, default)) for key, default, coerce in self._items])
+
+class AutoDecoder(TelemetryDecoder):
+    """Şema bağlanmamış portlar için eski anahtar yoklamalı kaynak tespiti"""
+    schema = 'auto'
+
+    def __init__(self):
+        super().__init__()
+        self._main = MainBoardDecoder()
+        self._payload = PayloadDecoder()
+
+    def from_dict(self, data):
+        # Ana sistem formatı kontrolü (alt, accX, accY, accZ alanları varsa)
+        if data.get('header') == 82 and 'rms_internal' in data and 'rms_external' in data:
+            return self._payload.from_dict(data)
+        if 'alt' in data or 'accX' in data or 'accY' in data or 'accZ' in data:
+            return self._main.from_dict(data)
+        return self._payload.from_dict(data)
+
+# Port şemaları: ad -> çözücü fabrikası (register_telemetry_schema ile genişletilir)
+TELEMETRY_SCHEMAS = {
+    'auto': AutoDecoder,
+    'anakart': MainBoardDecoder,
+    'gorev_yuku': PayloadDecoder
+}
+
+def register_telemetry_schema(name, factory):
+    """Özel bir şemayı kaydeder; factory çağrıldığında TelemetryDecoder döndürmelidir"""
+    TELEMETRY_SCHEMAS[name] = factory
+
+def create_telemetry_decoder(schema):
+    factory = TELEMETRY_SCHEMAS.get(schema)
+    if factory is None:
+        raise ValueError(f"Bilinmeyen telemetri şeması: {schema}")
+    return factory()
+
+_auto_decoder = AutoDecoder()
+
+def decode_telemetry_packet(packet_data):
+    """JSON telemetri satırını (str veya bayt) kaynak tespitiyle kayda çözer; her thread'de çağrılabilir"""
+    return _auto_decoder.decode(packet_data)
+
+# Seçilebilir hızlar; USB-CDC bağlantıları için aralıktaki özel hızlar da kabul edilir
+STANDARD_BAUD_RATES = (9600, 19200, 38400, 57600, 115200, 230400, 460800, 921600)
+MIN_BAUD_RATE = 300
+MAX_BAUD_RATE = 4000000
+AUTO_BAUD = 0  # Bağlantı slotlarında otomatik hız tespiti
+
+def is_valid_baud_rate(baud_rate):
+    return MIN_BAUD_RATE <= baud_rate <= MAX_BAUD_RATE
+
+def read_buffer_size(baud_rate, window_s=0.25):
+    """Olay döngüsü window_s kadar gecikse de taşmayacak okuma tamponu (8N1: 10 bit/bayt, en az 1 KB)"""
+    size = 1024
+    while size < baud_rate / 10 * window_s:
+        size *= 2
+    return size
+
+def configure_serial_port(port, baud_rate):
+    """Telemetri ve hakem portları için ortak seri port ayarları"""
+    port.setBaudRate(baud_rate)
+    port.setDataBits(QSerialPort.Data8)
+    port.setParity(QSerialPort.NoParity)
+    port.setStopBits(QSerialPort.OneStop)
+    port.setFlowControl(QSerialPort.NoFlowControl)
+    port.setReadBufferSize(read_buffer_size(baud_rate))
+
+class HyiEncoder:
+    """HYİ 78 byte'lık hakem paketini önceden derlenmiş tek bir struct düzeniyle, yeniden kullanılan tampona yazar.
+
+    encode() her çağrıda aynı tamponu döndürür; değer bir sonraki encode() çağrısına kadar geçerlidir.
+    """
+    FRAME_SIZE = 78
+    HEADER = b'\xff\xff\x54\x52'
+    FOOTER = b'\x0d\x0a'
+    FLOAT_COUNT = 17
+    # Byte 4-74: Takım ID, Paket Sayacı, 17 adet FLOAT32, Durum
+    BODY = struct.Struct('<BB17fB')
+    BODY_OFFSET = 4
+    CHECKSUM_OFFSET = 75
+    _FLOATS_START = 6
+    _FLOATS_END = 74
+
+    def __init__(self):
+        self._buffer = self._new_frames(1)
+        self._view = memoryview(self._buffer)
+        self._batch_buffer = bytearray()
+
+    @classmethod
+    def _new_frames(cls, count):
+        """Sabit başlık/kuyruk değerleri yazılmış count adet boş çerçeve"""
+        frame = bytearray(cls.FRAME_SIZE)
+        frame[0:4] = cls.HEADER
+        frame[76:78] = cls.FOOTER
+        return frame * count
+
+    def _pack_at(self, buffer, view, offset, team_id, packet_counter, values, status):
+        team_id &= 0xFF
+        packet_counter &= 0xFF
+        status &= 0xFF
+        self.BODY.pack_into(buffer, offset + self.BODY_OFFSET, team_id, packet_counter, *values, status)
+        # Checksum: sabit tamsayı alanları + yalnızca float baytlarının toplamı
+        checksum = team_id + packet_counter + status + sum(view[offset + self._FLOATS_START:offset + self._FLOATS_END])
+        buffer[offset + self.CHECKSUM_OFFSET] = checksum & 0xFF
+
+    def encode(self, team_id, packet_counter, values, status):
+        """values: create_hyi_packet sırasıyla 17 float (irtifa ... açı)"""
+        self._pack_at(self._buffer, self._view, 0, team_id, packet_counter, values, status)
+        return self._buffer
+
+    def encode_many(self, team_id, frames):
+        """frames: (paket_sayacı, 17 float, durum) üçlüleri; tüm paketleri tek bitişik tampona yazar"""
+        frames = list(frames)
+        needed = len(frames) * self.FRAME_SIZE
+        if len(self._batch_buffer) < needed:
+            self._batch_buffer = self._new_frames(len(frames))
+        buffer = self._batch_buffer
+        view = memoryview(buffer)
+        offset = 0
+        for packet_counter, values, status in frames:
+            self._pack_at(buffer, view, offset, team_id, packet_counter, values, status)
+            offset += self.FRAME_SIZE
+        return view[:needed]
+
+# Uçuş kaydedici kayıt türleri ve port kimlikleri
+RECORD_INBOUND = 1  # Telemetri portundan gelen ham satır/çerçeve
+RECORD_JUDGE = 2  # Hakem portuna gönderilen HYİ paketi
+RECORD_JUDGE_STALE = 3  # En az bir kaynağı eski veriden (politikaya göre) doldurulmuş HYİ paketi
+RECORDER_PORT_IDS = {'telemetry': 0, 'telemetry2': 1, 'judge': 2}
+
+class FlightRecorder:
+    """Ham telemetri satırlarını ve hakem paketlerini yalnızca-ekleme, bölümlü, CRC'li dosyalara yazan kaydedici.
+
+    record() yalnızca kuyruğa ekler; dosyaya yazma ve periyodik fsync arka plan thread'inde yapılır.
+    Kuyruk max_queue kayıtla sınırlıdır: disk yetişemezse yeni kayıtlar atılır ve dropped sayacı artar.
+    Dosya başlığı: MAGIC + duvar saati (ns) + monotonic saat (ns). Kayıt başlığı: işaret, tür, port,
+    monotonic zaman (ns), uzunluk ve başlık+veri üzerinden CRC32. Elektrik kesintisinde yalnızca
+    son yarım kayıt kaybolur; read_segment ilk bozuk kayıtta durur.
+    """
+    MAGIC = b'TFREC\x01'
+    FILE_HEADER = struct.Struct('<6sqq')
+    RECORD_MARK = 0xF17E
+    RECORD_HEADER = struct.Struct('<HBBqI')  # işaret, tür, port, monotonic ns, uzunluk
+    CRC = struct.Struct('<I')
+    SUFFIX = '.frec'
+
+    def __init__(self, directory='flight_logs', segment_size=64 * 1024 * 1024, fsync_interval=1.0, max_batch=512,
+                 max_queue=65536):
+        self.directory = directory
+        self.segment_size = segment_size
+        self.fsync_interval = fsync_interval
+        self.max_batch = max_batch
+        self.records = 0
+        self.bytes_written = 0
+        self.fsyncs = 0
+        self.segments = 0
+        self.write_errors = 0
+        self.max_queue_depth = 0
+        self.dropped = 0
+        self._queue = queue.Queue(max_queue)
+        self._thread = None
+        self._file = None
+        self._segment_path = None
+        self._segment_bytes = 0
+        self._session = None
+        self._atexit_registered = False
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._session = time.strftime('%Y%m%d_%H%M%S')
+        self._open_segment()
+        self._thread = threading.Thread(target=self._run, name='flight-recorder', daemon=True)
+        self._thread.start()
+        if not self._atexit_registered:
+            # Yalnızca bir kez: stop() tekrar çağrılabilir, başlat/durdur döngüleri kayıt biriktirmez
+            atexit.register(self.stop)
+            self._atexit_registered = True
+        log_ingest.info('Uçuş kaydı başlatıldı: %s', self._segment_path)
+
+    def stop(self):
+        """Kuyruktaki tüm kayıtları yazar, fsync yapar ve dosyayı kapatır"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._close_segment()
+
+    def record(self, record_type, port_key, payload):
+        """Kaydı kuyruğa ekler (GUI ve işçi thread'lerinden çağrılabilir, engellemez)"""
+        if self._thread is not None:
+            try:
+                self._queue.put_nowait((record_type, RECORDER_PORT_IDS[port_key], time.monotonic_ns(), bytes(payload)))
+            except queue.Full:
+                self.dropped += 1
+
+    def _open_segment(self):
+        self.segments += 1
+        self._segment_path = os.path.join(self.directory, f'flight_{self._session}_{self.segments:04d}{self.SUFFIX}')
+        self._file = open(self._segment_path, 'ab', buffering=256 * 1024)
+        self._file.write(self.FILE_HEADER.pack(self.MAGIC, time.time_ns(), time.monotonic_ns()))
+        self._segment_bytes = self.FILE_HEADER.size
+
+    def _close_segment(self):
+        if self._file is not None:
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    def _sync(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.fsyncs += 1
+
+    def _encode(self, record_type, port_id, timestamp_ns, payload):
+        header = self.RECORD_HEADER.pack(self.RECORD_MARK, record_type, port_id, timestamp_ns, len(payload))
+        crc = zlib.crc32(payload, zlib.crc32(header))
+        return header + self.CRC.pack(crc) + payload
+
+    def _run(self):
+        get = self._queue.get
+        encode = self._encode
+        next_sync = time.monotonic() + self.fsync_interval
+        while True:
+            try:
+                item = get(timeout=self.fsync_interval)
+            except queue.Empty:
+                item = ()
+            batch = []
+            stopping = item is None
+            if item:
+                batch.append(encode(*item))
+                # Birikmiş kayıtları tek yazmada topla
+                while len(batch) < self.max_batch:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(encode(*item))
+                depth = self._queue.qsize()
+                if depth > self.max_queue_depth:
+                    self.max_queue_depth = depth
+            try:
+                if batch:
+                    data = b''.join(batch)
+                    self._file.write(data)
+                    self.records += len(batch)
+                    self.bytes_written += len(data)
+                    self._segment_bytes += len(data)
+                    if self._segment_bytes >= self.segment_size:
+                        self._close_segment()
+                        self._open_segment()
+                now = time.monotonic()
+                if now >= next_sync:
+                    self._sync()
+                    next_sync = now + self.fsync_interval
+            except OSError as e:
+                self.write_errors += 1
+                log_ingest.error('Uçuş kaydı yazma hatası: %s', e)
+            if stopping:
+                return
+
+    def stats(self):
+        return {
+            'running': self.running,
+            'path': self._segment_path or '',
+            'records': self.records,
+            'bytes': self.bytes_written,
+            'segments': self.segments,
+            'fsyncs': self.fsyncs,
+            'queue_depth': self._queue.qsize(),
+            'max_queue_depth': self.max_queue_depth,
+            'dropped': self.dropped,
+            'write_errors': self.write_errors
+        }
+
+    @classmethod
+    def read_segment(cls, path):
+        """Bölüm dosyasındaki geçerli kayıtları (tür, port, monotonic ns, veri) olarak döndürür; ilk bozuk kayıtta durur"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:len(cls.MAGIC)] != cls.MAGIC:
+            raise ValueError(f'Uçuş kaydı dosyası değil: {path}')
+        view = memoryview(data)
+        offset = cls.FILE_HEADER.size
+        header_size = cls.RECORD_HEADER.size + cls.CRC.size
+        while offset + header_size <= len(data):
+            mark, record_type, port_id, timestamp_ns, length = cls.RECORD_HEADER.unpack_from(data, offset)
+            end = offset + header_size + length
+            if mark != cls.RECORD_MARK or end > len(data):
+                break
+            (crc,) = cls.CRC.unpack_from(data, offset + cls.RECORD_HEADER.size)
+            payload = view[offset + header_size:end]
+            if zlib.crc32(payload, zlib.crc32(view[offset:offset + cls.RECORD_HEADER.size])) != crc:
+                break
+            yield record_type, port_id, timestamp_ns, bytes(payload)
+            offset = end
+        if offset < len(data):
+            log_ingest.warning('Uçuş kaydı %s: %s bayttan sonrası bozuk/yarım, kurtarma burada durdu', path, offset)
+
+    @classmethod
+    def read_session(cls, directory, session=None):
+        """Bir oturumun tüm bölümlerini sırayla okur; oturum verilmezse en sonuncusu kullanılır"""
+        names = sorted(n for n in os.listdir(directory) if n.startswith('flight_') and n.endswith(cls.SUFFIX))
+        if session is None and names:
+            session = names[-1][len('flight_'):-len(cls.SUFFIX)].rsplit('_', 1)[0]
+        for name in names:
+            if name.startswith(f'flight_{session}_'):
+                yield from cls.read_segment(os.path.join(directory, name))
+
+class ReplaySerialPort(QObject):
+    """Kaydedilmiş bir oturumu (.frec bölümü/dizini veya düz satır günlüğü) QSerialPort gibi sunan sanal port.
+
+    Adres biçimi: replay://<yol>?port=telemetry&speed=1|4|max&rate=10&loop=0
+    speed=1 gerçek zamanlı, speed=N hızlandırılmış, speed=max olay döngüsünün izin verdiği en yüksek hızdır.
+    Zaman damgası olmayan düz günlükler rate (Hz) ile zamanlanır.
+    """
+    readyRead = pyqtSignal()
+    finished = pyqtSignal()
+    TICK_MS = 10
+    MAX_SPEED_CHUNK = 256  # max modda olay döngüsüne dönmeden önce verilen kayıt sayısı
+
+    def __init__(self, url, parent=None):
+        super().__init__(parent)
+        parsed = urllib.parse.urlsplit(url)
+        query = dict(urllib.parse.parse_qsl(parsed.query))
+        self.url = url
+        self.path = urllib.parse.unquote(parsed.netloc + parsed.path)
+        self.port_key = query.get('port', 'telemetry')
+        self.rate = float(query.get('rate', 10))
+        self.loop = query.get('loop', '0') == '1'
+        self.max_speed = False
+        self.speed = 1.0
+        self.paused = False
+        self.records_sent = 0
+        self.bytes_sent = 0
+        self.bytes_written = 0
+        self._times = []
+        self._payloads = []
+        self._index = 0
+        self._buffer = bytearray()
+        self._open = False
+        self._anchor_wall = 0.0
+        self._anchor_offset = 0.0
+        self._started_at = None
+        self._finished_at = None
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+        self.set_speed(query.get('speed', '1'))
+
+    # QSerialPort uyumlu arayüz
+    def portName(self):
+        return self.url
+
+    def open(self, mode=None):
+        try:
+            self._load()
+        except (OSError, ValueError) as e:
+            log_ports.error('❌ Replay kaynağı okunamadı (%s): %s', self.path, e)
+            return False
+        self._open = True
+        self._index = 0
+        self._started_at = time.monotonic()
+        self._finished_at = None
+        self._set_anchor(0.0)
+        self._timer.start(0 if self.max_speed else self.TICK_MS)
+        log_ports.info('Replay başladı: %s (%s kayıt, hız: %s)', self.path, len(self._times),
+                       'max' if self.max_speed else f'{self.speed:g}x')
+        return True
+
+    def isOpen(self):
+        return self._open
+
+    def close(self):
+        self._timer.stop()
+        self._open = False
+
+    def error(self):
+        return QSerialPort.NoError
+
+    def errorString(self):
+        return ''
+
+    def bytesAvailable(self):
+        return len(self._buffer)
+
+    def readAll(self):
+        data, self._buffer = QByteArray(bytes(self._buffer)), bytearray()
+        return data
+
+    def write(self, data):
+        self.bytes_written += len(data)
+        return len(data)
+
+    def flush(self):
+        return True
+
+    # Replay kontrolleri
+    @pyqtSlot(str)
+    def set_speed(self, speed):
+        """Hızı ayarlar: '1' gerçek zamanlı, '4' dört kat, 'max' en yüksek hız"""
+        position = self.position() if self._times else 0.0
+        if str(speed).lower() == 'max':
+            self.max_speed = True
+        else:
+            self.max_speed = False
+            self.speed = max(0.01, float(speed))
+        if self._open:
+            self._set_anchor(position)
+            self._timer.setInterval(0 if self.max_speed else self.TICK_MS)
+
+    @pyqtSlot()
+    def pause(self):
+        if not self.paused:
+            self._anchor_offset = self.position()
+            self.paused = True
+
+    @pyqtSlot()
+    def resume(self):
+        if self.paused:
+            self.paused = False
+            self._set_anchor(self._anchor_offset)
+
+    @pyqtSlot(float)
+    def seek(self, seconds):
+        """Oturum başından itibaren verilen saniyeye atlar"""
+        self._index = bisect.bisect_left(self._times, seconds)
+        self._buffer.clear()
+        self._set_anchor(seconds)
+        if self._open and not self._timer.isActive():
+            self._finished_at = None
+            self._timer.start()
+
+    def position(self):
+        """Oturum içindeki mevcut konum (s)"""
+        if self.max_speed:
+            return self._times[self._index - 1] if self._index else 0.0
+        if self.paused:
+            return self._anchor_offset
+        return self._anchor_offset + (time.monotonic() - self._anchor_wall) * self.speed
+
+    def duration(self):
+        return self._times[-1] if self._times else 0.0
+
+    def stats(self):
+        elapsed = ((self._finished_at or time.monotonic()) - self._started_at) if self._started_at else 0.0
+        return {
+            'source': self.path,
+            'speed': 'max' if self.max_speed else self.speed,
+            'paused': self.paused,
+            'position_s': round(min(self.position(), self.duration()), 3),
+            'duration_s': round(self.duration(), 3),
+            'records': len(self._times),
+            'records_sent': self.records_sent,
+            'bytes_sent': self.bytes_sent,
+            'elapsed_s': round(elapsed, 3),
+            'records_per_s': round(self.records_sent / elapsed, 1) if elapsed > 0 else 0.0,
+            'finished': self._finished_at is not None
+        }
+
+    def _set_anchor(self, position):
+        self._anchor_offset = position
+        self._anchor_wall = time.monotonic()
+
+    def _load(self):
+        """Kaynağı (oturum saniyesi, satır) listelerine yükler"""
+        if os.path.isdir(self.path):
+            records = FlightRecorder.read_session(self.path)
+        elif self.path.endswith(FlightRecorder.SUFFIX):
+            records = FlightRecorder.read_segment(self.path)
+        else:
+            records = None
+        times, payloads = [], []
+        if records is not None:
+            port_id = RECORDER_PORT_IDS[self.port_key]
+            first = None
+            for record_type, record_port, timestamp_ns, payload in records:
+                if record_type != RECORD_INBOUND or record_port != port_id:
+                    continue
+                if first is None:
+                    first = timestamp_ns
+                times.append((timestamp_ns - first) / 1e9)
+                # Çerçeveleyici satır sonlarını kaldırır; binary çerçeveler olduğu gibi verilir
+                payloads.append(payload if payload[:2] == BINARY_SYNC else payload + b'\n')
+        else:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        times.append(len(times) / self.rate)
+                        payloads.append(line + b'\n')
+        self._times, self._payloads = times, payloads
+
+    def _tick(self):
+        if self.paused:
+            return
+        start = self._index
+        if self.max_speed:
+            end = min(len(self._times), start + self.MAX_SPEED_CHUNK)
+        else:
+            end = bisect.bisect_right(self._times, self.position(), start)
+        if end > start:
+            chunk = b''.join(self._payloads[start:end])
+            self._buffer += chunk
+            self._index = end
+            self.records_sent += end - start
+            self.bytes_sent += len(chunk)
+            self.readyRead.emit()
+        if self._index >= len(self._times):
+            if self.loop and self._times:
+                self.seek(0.0)
+                return
+            self._timer.stop()
+            self._finished_at = time.monotonic()
+            stats = self.stats()
+            log_ports.info('Replay bitti: %s kayıt, %.1f s, %s kayıt/s', stats['records_sent'],
+                           stats['elapsed_s'], stats['records_per_s'])
+            self.finished.emit()
+
+class FlightSimulator:
+    """Fiziksel olarak tutarlı sentetik uçuş profili üretir (rampa, itki, süzülme, sürüklenme paraşütü, ana paraşüt, iniş).
+
+    Yörünge uçuş zamanının kapalı biçimli bir fonksiyonudur; aynı anda açılan ana sistem ve görev yükü
+    simülatörleri ortak başlangıç zamanını (epoch) paylaştığı için aynı uçuşu görür.
+    Görev yükü tepe noktasında ayrılır ve kendi paraşütüyle iner.
+    """
+    G = 9.81
+    PAD_TIME = 2.0  # s, rampada bekleme
+    BURN_TIME = 3.0  # s
+    THRUST_ACC = 60.0  # m/s², net itki ivmesi
+    DRAG_DECEL = 2.0  # m/s², süzülmede sürtünme
+    DROGUE_SPEED = 25.0  # m/s
+    MAIN_SPEED = 7.0  # m/s
+    MAIN_ALTITUDE = 500.0  # m
+    PAYLOAD_SPEED = 9.0  # m/s
+    WIND_EAST = 5.0  # m/s
+    WIND_NORTH = 2.0  # m/s
+    LANDED_TIME = 5.0  # s, iniş sonrası yeni uçuşa kadar bekleme
+    ORIGIN = (39.9417, 32.86485)  # Harita başlangıç merkezi
+
+    epoch = None
+
+    def __init__(self, noise=1.0, corrupt=0.0, seed=None):
+        self.noise = noise
+        self.corrupt = corrupt
+        self.rng = random.Random(seed)
+        if FlightSimulator.epoch is None:
+            FlightSimulator.epoch = time.monotonic()
+        burn_speed = self.THRUST_ACC * self.BURN_TIME
+        self.burnout_alt = 0.5 * self.THRUST_ACC * self.BURN_TIME ** 2
+        coast_decel = self.G + self.DRAG_DECEL
+        self.t_burnout = self.PAD_TIME + self.BURN_TIME
+        self.t_apogee = self.t_burnout + burn_speed / coast_decel
+        self.apogee = self.burnout_alt + burn_speed ** 2 / (2 * coast_decel)
+        self.t_main = self.t_apogee + (self.apogee - self.MAIN_ALTITUDE) / self.DROGUE_SPEED
+        self.t_landed = self.t_main + self.MAIN_ALTITUDE / self.MAIN_SPEED
+        self.t_payload_landed = self.t_apogee + self.apogee / self.PAYLOAD_SPEED
+        self.cycle = max(self.t_landed, self.t_payload_landed) + self.LANDED_TIME
+
+    def flight_time(self, now=None):
+        return ((now if now is not None else time.monotonic()) - FlightSimulator.epoch) % self.cycle
+
+    def rocket(self, t):
+        """Uçuş zamanında (irtifa, dikey hız, dikey ivme, durum)"""
+        if t < self.PAD_TIME:
+            return 0.0, 0.0, 0.0, 1
+        if t < self.t_burnout:
+            dt = t - self.PAD_TIME
+            return 0.5 * self.THRUST_ACC * dt * dt, self.THRUST_ACC * dt, self.THRUST_ACC, 2
+        decel = self.G + self.DRAG_DECEL
+        if t < self.t_apogee:
+            dt = t - self.t_burnout
+            v0 = self.THRUST_ACC * self.BURN_TIME
+            return self.burnout_alt + v0 * dt - 0.5 * decel * dt * dt, v0 - decel * dt, -decel, 3
+        if t < self.t_main:
+            return self.apogee - self.DROGUE_SPEED * (t - self.t_apogee), -self.DROGUE_SPEED, 0.0, 4
+        if t < self.t_landed:
+            return self.MAIN_ALTITUDE - self.MAIN_SPEED * (t - self.t_main), -self.MAIN_SPEED, 0.0, 5
+        return 0.0, 0.0, 0.0, 6
+
+    def payload(self, t):
+        """Görev yükü (irtifa, durum); ayrılmadan önce roketle aynıdır"""
+        if t < self.t_apogee:
+            altitude, _, _, _ = self.rocket(t)
+            return altitude, 1
+        if t < self.t_payload_landed:
+            return self.apogee - self.PAYLOAD_SPEED * (t - self.t_apogee), 2
+        return 0.0, 3
+
+    def position(self, t, t_land):
+        """Rüzgâr sürüklenmesiyle enlem/boylam"""
+        airborne = max(0.0, min(t, t_land) - self.PAD_TIME)
+        lat0, lng0 = self.ORIGIN
+        lat = lat0 + self.WIND_NORTH * airborne / 111320.0
+        lng = lng0 + self.WIND_EAST * airborne / (111320.0 * math.cos(math.radians(lat0)))
+        return lat, lng
+
+    def _n(self, sigma):
+        return self.rng.gauss(0.0, sigma * self.noise) if self.noise else 0.0
+
+    def main_sample(self, t):
+        altitude, speed, acc, state = self.rocket(t)
+        lat, lng = self.position(t, self.t_landed)
+        n = self._n
+        # Yükselişte dikey, tepe noktasından sonra paraşüt altında salınım
+        pitch = 88.0 - 4.0 * max(0.0, min(1.0, (t - self.t_burnout) / max(1e-6, self.t_apogee - self.t_burnout)))
+        if state >= 4:
+            pitch = 15.0 * math.sin(t * 1.3)
+        proper_acc = acc + self.G if state in (2, 3) else self.G
+        return MainSystemSample(
+            round(altitude + n(0.5), 2), round(altitude + n(3.0), 2),
+            round(lat + n(2e-6), 6), round(lng + n(2e-6), 6),
+            round(n(0.02) + (0.5 if state == 2 else 0.0), 3), round(n(0.02), 3), round(n(0.02), 3),
+            round(pitch + n(0.5), 2),
+            round(n(0.1), 3), round(n(0.1), 3), round(proper_acc + n(0.3), 3),
+            state)
+
+    def payload_sample(self, t):
+        altitude, state = self.payload(t)
+        lat, lng = self.position(t, self.t_payload_landed)
+        n = self._n
+        return PayloadSample(
+            round(altitude + n(0.5), 2), round(altitude + n(0.5), 2),
+            round(lat + n(2e-6), 6), round(lng + n(2e-6), 6),
+            round(abs(1.2 + n(0.05)), 4), round(abs(0.8 + n(0.05)), 4), state)
+
+    def main_json(self, sample):
+        return json.dumps({
+            'alt': sample.altitude, 'gpsAlt': sample.gps_altitude, 'lat': sample.latitude, 'lng': sample.longitude,
+            'eulX': sample.gyro_x, 'eulY': sample.gyro_y, 'eulZ': sample.gyro_z, 'pitch': sample.angle,
+            'accX': sample.acc_x, 'accY': sample.acc_y, 'accZ': sample.acc_z, 'state': sample.status
+        }, separators=(',', ':')).encode() + b'\n'
+
+    def payload_json(self, sample):
+        return json.dumps({
+            'header': 82, 'alt': sample.altitude, 'lat': sample.latitude, 'lng': sample.longitude,
+            'rms_internal': sample.rms_internal, 'rms_external': sample.rms_external, 'durum': sample.status
+        }, separators=(',', ':')).encode() + b'\n'
+
+    def maybe_corrupt(self, data):
+        """corrupt oranında satırı bozar: kesme, bayt değiştirme veya satır sonunu silme"""
+        if not self.corrupt or self.rng.random() >= self.corrupt:
+            return data, False
+        kind = self.rng.randrange(3)
+        if kind == 0:
+            return data[:len(data) // 2], True
+        if kind == 1:
+            data = bytearray(data)
+            data[self.rng.randrange(len(data) - 1)] ^= 0x5A
+            return bytes(data), True
+        return data.rstrip(b'\n'), True
+
+class SimulatedSerialPort(QObject):
+    """Donanım olmadan yük testi için süreç içi sanal port (QSerialPort arayüzü).
+
+    sim://anakart ve sim://gorev_yuku adresleri FlightSimulator verisini rate Hz'de üretir;
+    sim://judge hakem portuna yazılan HYİ paketlerini yakalar ve doğrular.
+    Parametreler: rate=10, noise=1, corrupt=0, format=json|binary, seed
+    """
+    readyRead = pyqtSignal()
+    MAX_CATCH_UP = 1000  # tik başına en fazla üretilecek örnek
+
+    def __init__(self, url, parent=None):
+        super().__init__(parent)
+        parsed = urllib.parse.urlsplit(url)
+        query = dict(urllib.parse.parse_qsl(parsed.query))
+        self.url = url
+        self.role = parsed.netloc or parsed.path.strip('/')
+        if self.role not in ('anakart', 'gorev_yuku', 'judge'):
+            raise ValueError(f'Bilinmeyen simülatör portu: {self.role}')
+        self.rate = float(query.get('rate', 10))
+        self.binary = query.get('format', 'json') == 'binary'
+        seed = query.get('seed')
+        self.simulator = FlightSimulator(float(query.get('noise', 1.0)), float(query.get('corrupt', 0.0)),
+                                         int(seed) if seed is not None else None)
+        self.samples_sent = 0
+        self.skipped = 0
+        self.corrupted_sent = 0
+        self.bytes_sent = 0
+        self.frames_captured = 0
+        self.invalid_frames = 0
+        self.bytes_written = 0
+        self.captured = collections.deque(maxlen=1000)  # Son hakem paketleri
+        self._write_buffer = bytearray()
+        self._buffer = bytearray()
+        self._open = False
+        self._started_at = None
+        self._next = 0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    def portName(self):
+        return self.url
+
+    def open(self, mode=None):
+        self._open = True
+        self._started_at = time.monotonic()
+        self._next = 0
+        if self.role != 'judge':
+            self._timer.start(max(1, min(10, int(1000 / self.rate))))
+        return True
+
+    def isOpen(self):
+        return self._open
+
+    def close(self):
+        self._timer.stop()
+        self._open = False
+
+    def error(self):
+        return QSerialPort.NoError
+
+    def errorString(self):
+        return ''
+
+    def bytesAvailable(self):
+        return len(self._buffer)
+
+    def readAll(self):
+        data, self._buffer = QByteArray(bytes(self._buffer)), bytearray()
+        return data
+
+    def flush(self):
+        return True
+
+    def write(self, data):
+        """Hakem çıktısını yakalar; 78 baytlık HYİ paketlerinin başlık, sonlandırıcı ve checksum'ını doğrular"""
+        self.bytes_written += len(data)
+        if self.role != 'judge':
+            return len(data)
+        buffer = self._write_buffer
+        buffer += data
+        size = HyiEncoder.FRAME_SIZE
+        while len(buffer) >= size:
+            start = buffer.find(HyiEncoder.HEADER)
+            if start < 0:
+                self.invalid_frames += 1
+                buffer.clear()
+                break
+            if start:
+                self.invalid_frames += 1
+                del buffer[:start]
+                continue
+            if len(buffer) < size:
+                break
+            frame = bytes(buffer[:size])
+            del buffer[:size]
+            if frame[-2:] == b'\r\n' and sum(frame[4:75]) & 0xFF == frame[75]:
+                self.frames_captured += 1
+                self.captured.append(frame)
+            else:
+                self.invalid_frames += 1
+        return len(data)
+
+    def _tick(self):
+        due = int((time.monotonic() - self._started_at) * self.rate) - self._next
+        if due <= 0:
+            return
+        sim = self.simulator
+        chunks = []
+        count = min(due, self.MAX_CATCH_UP)
+        for k in range(self._next, self._next + count):
+            t = sim.flight_time(self._started_at + k / self.rate)
+            if self.role == 'anakart':
+                sample = sim.main_sample(t)
+                data = BINARY_SCHEMAS[0x01].encode(sample) if self.binary else sim.main_json(sample)
+            else:
+                sample = sim.payload_sample(t)
+                data = BINARY_SCHEMAS[0x52].encode(sample) if self.binary else sim.payload_json(sample)
+            data, corrupted = sim.maybe_corrupt(data)
+            self.corrupted_sent += corrupted
+            chunks.append(data)
+        # Yetişilemeyen örnekler atlanır; üretim gerçek zamana bağlı kalır
+        self._next += due
+        self.samples_sent += count
+        self.skipped += due - count
+        chunk = b''.join(chunks)
+        self._buffer += chunk
+        self.bytes_sent += len(chunk)
+        self.readyRead.emit()
+
+    def stats(self):
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        stats = {'role': self.role, 'elapsed_s': round(elapsed, 3)}
+        if self.role == 'judge':
+            stats.update(frames_captured=self.frames_captured, invalid_frames=self.invalid_frames,
+                         bytes_written=self.bytes_written,
+                         frames_per_s=round(self.frames_captured / elapsed, 2) if elapsed > 0 else 0.0)
+        else:
+            stats.update(rate_hz=self.rate, format='binary' if self.binary else 'json',
+                         samples_sent=self.samples_sent, skipped=self.skipped, corrupted_sent=self.corrupted_sent,
+                         bytes_sent=self.bytes_sent,
+                         samples_per_s=round(self.samples_sent / elapsed, 1) if elapsed > 0 else 0.0)
+        return stats
+
+# Sanal port şemaları: 'şema://...' adresleri QSerialPort yerine bu sınıflarla açılır
+PORT_SCHEMES = {
+    'replay': ReplaySerialPort,
+    'sim': SimulatedSerialPort
+}
+
+def register_port_scheme(name, factory):
+    """Yeni sanal port şeması kaydeder; factory(url) QSerialPort arayüzünü taklit eden bir nesne döndürmelidir"""
+    PORT_SCHEMES[name] = factory
+
+def open_serial_port(port_name, baud_rate):
+    """Port adına göre gerçek QSerialPort veya sanal port (replay://, ...) oluşturur; port henüz açılmamıştır"""
+    scheme, sep, _ = port_name.partition('://')
+    if sep and scheme in PORT_SCHEMES:
+        return PORT_SCHEMES[scheme](port_name)
+    port = QSerialPort(port_name)
+    configure_serial_port(port, baud_rate)
+    return port
+
+class JudgeScheduler(QObject):
+    """Hakem paketlerini kendi thread'inde, monotonic son tarihlere göre kaymasız gönderir.
+
+    Son tarihler başlangıçtan itibaren k * periyot olarak hesaplanır; gecikme bir sonraki aralığa taşınmaz.
+    Timer (Qt::PreciseTimer) son tarihten biraz önce uyanır, kalan süre time.sleep ile (GIL bırakılarak) beklenir.
+    Kaçırılan son tarihler gönderilmez, sayılır. Gerçek gönderim zamanları jitter istatistikleri için saklanır.
+    """
+    WAKE_EARLY_S = 0.002  # Son tarihten önce uyanma payı
+    port_error = pyqtSignal(str, int)  # port anahtarı, QSerialPort hata kodu
+
+    def __init__(self, send, frequency_hz=5, history=1000):
+        super().__init__()
+        self._send = send  # Paketi yazar, gönderildiyse True döner (bu thread'de çağrılır)
+        self.period = 1.0 / frequency_hz
+        self.port = None
+        self.frames = 0
+        self.missed = 0
+        self._timer = None
+        self._next = None
+        self._stamps = collections.deque(maxlen=history)
+
+    @pyqtSlot(str, int, result=bool)
+    def open_port(self, port_name, baud_rate):
+        """Hakem portunu zamanlayıcı thread'inde oluşturup açar (port nesnesi bu thread'e ait olur)"""
+        self.close_port()
+        self.port = open_serial_port(port_name, baud_rate)
+        self._stamps.clear()
+        if hasattr(self.port, 'errorOccurred'):
+            self.port.errorOccurred.connect(lambda error: self.port_error.emit('judge', int(error)))
+        return self.port.open(QSerialPort.ReadWrite)
+
+    @pyqtSlot()
+    def close_port(self):
+        if self.port is not None and self.port.isOpen():
+            self.port.close()
+
+    @pyqtSlot()
+    def start(self):
+        if self._timer is None:
+            self._timer = QTimer()
+            self._timer.setTimerType(Qt.PreciseTimer)
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self._on_timer)
+        self._next = time.monotonic() + self.period
+        self._arm()
+
+    @pyqtSlot()
+    def stop(self):
+        if self._timer is not None:
+            self._timer.stop()
+        self.close_port()
+
+    @pyqtSlot(float)
+    def set_frequency(self, frequency_hz):
+        """Yeni periyot bir sonraki gönderimden itibaren geçerli olur"""
+        self.period = 1.0 / frequency_hz
+        self._stamps.clear()
+        if self._timer is not None and self._timer.isActive():
+            self._next = time.monotonic() + self.period
+            self._arm()
+
+    def _arm(self):
+        delay = self._next - self.WAKE_EARLY_S - time.monotonic()
+        self._timer.start(max(0, int(delay * 1000)))
+
+    def _on_timer(self):
+        deadline = self._next
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            # Meşgul bekleme GIL'i tutup GUI ve işçi thread'lerini aç bırakırdı
+            time.sleep(remaining)
+        now = time.monotonic()
+        if self._send():
+            self.frames += 1
+            self._stamps.append(now)
+        # Sonraki son tarih sabit ızgaradan alınır; geç kalınan adımlar atlanır
+        self._next = deadline + self.period
+        if now >= self._next:
+            skipped = int((now - self._next) / self.period) + 1
+            self.missed += skipped
+            self._next += skipped * self.period
+        self._arm()
+
+    def stats(self):
+        """Gönderimler arası aralık (ms) ve nominal periyottan sapma yüzdelikleri"""
+        stamps = list(self._stamps)
+        gaps = sorted((b - a) * 1000.0 for a, b in zip(stamps, stamps[1:]))
+        nominal = self.period * 1000.0
+        errors = sorted(abs(g - nominal) for g in gaps)
+
+        def pick(values, fraction):
+            return round(values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))], 3) if values else 0.0
+
+        return {
+            'frequency_hz': round(1.0 / self.period, 3),
+            'frames': self.frames,
+            'missed': self.missed,
+            'gap_p50_ms': pick(gaps, 0.5),
+            'gap_p99_ms': pick(gaps, 0.99),
+            'gap_min_ms': pick(gaps, 0.0),
+            'gap_max_ms': pick(gaps, 1.0),
+            'jitter_p50_ms': pick(errors, 0.5),
+            'jitter_p99_ms': pick(errors, 0.99),
+            'samples': len(gaps)
+        }
+
+class IngestWorker(QObject):
+    """Bir telemetri portunu kendi QThread'inde okur, çözer ve örnekleri gruplar halinde GUI'ye iletir"""
+    samples_ready = pyqtSignal(str, list)  # port anahtarı, [kayıt, ...]
+    port_error = pyqtSignal(str, int)  # port anahtarı, QSerialPort hata kodu
+
+    def __init__(self, port_key, port_name, baud_rate, framer, decoder, batch_interval_ms=20, max_batch=64, recorder=None,
+                 freshness=None):
+        super().__init__()
+        self.port_key = port_key
+        self.recorder = recorder
+        self.freshness = freshness
+        self.port_name = port_name
+        self.baud_rate = baud_rate
+        self.framer = framer
+        self.decoder = decoder
+        self.batch_interval_ms = batch_interval_ms
+        self.max_batch = max_batch
+        self.port = None
+        self._flush_timer = None
+        self._pending = []
+
+    @pyqtSlot(result=bool)
+    def open_port(self):
+        """Portu işçi thread'inde oluşturup açar (port nesnesi bu thread'e ait olur)"""
+        self.port = open_serial_port(self.port_name, self.baud_rate)
+        if not self.port.open(QSerialPort.ReadWrite):
+            log_ports.error('❌ İşçi portu açılamadı: %s Hata kodu: %s', self.port_name, self.port.error())
+            self.port = None
+            return False
+        self.port.readyRead.connect(self._on_ready_read)
+        if hasattr(self.port, 'errorOccurred'):
+            self.port.errorOccurred.connect(lambda error: self.port_error.emit(self.port_key, int(error)))
+        self._flush_timer = QTimer()
+        self._flush_timer.timeout.connect(self._flush)
+        self._flush_timer.start(self.batch_interval_ms)
+        return True
+
+    @pyqtSlot()
+    def close_port(self):
+        if self._flush_timer is not None:
+            self._flush_timer.stop()
+            self._flush_timer = None
+        if self.port is not None:
+            if self.port.isOpen():
+                self._on_ready_read()
+                self.port.close()
+            self.port = None
+        self._flush()
+
+    def _on_ready_read(self):
+        data = self.port.readAll().data()
+        if not data:
+            return
+        decode = self.decoder.decode
+        recorder = self.recorder
+        freshness = self.freshness
+        for line in self.framer.feed(data):
+            if recorder is not None:
+                recorder.record(RECORD_INBOUND, self.port_key, line)
+            try:
+                sample = decode(line)
+            except Exception as e:
+                self.framer.decode_failed()
+                log_ingest.warning('Telemetri çözme hatası (%s): %s', self.port_key, e)
+                continue
+            # Hakem birleştiricisi GUI'deki grup teslimini beklemeden burada güncellenir
+            if freshness is not None:
+                freshness.update(sample)
+            self._pending.append(sample)
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self.samples_ready.emit(self.port_key, batch)
+
+class TelemetryTableModel(QAbstractTableModel):
+    """TELEMETRI VERILERI tablosunun modeli; yalnızca değeri değişen satırlar için dataChanged yayar.
+
+    Min/Max/Hız sütunları isteğe bağlıdır ve yalnızca arayüz yenilemesinde, değişen satırlar için hesaplanır.
+    Hız, satırın kaynağından son rate_window_s saniyede alınan örnek sayısıdır (geçmiş halka tamponundan).
+    """
+    FieldRole = Qt.UserRole + 1
+    ValueRole = Qt.UserRole + 2
+    MinRole = Qt.UserRole + 3
+    MaxRole = Qt.UserRole + 4
+    RateRole = Qt.UserRole + 5
+
+    COLUMNS = ('Alan', 'Değer', 'Min', 'Max', 'Hız (Hz)')
+    # (alan adı, kaynak, sayısal örnek alanı) - min/max yalnızca sayısal alanlar için tutulur
+    ROWS = (
+        ('Takım ID', None, None),
+        ('Paket Sayacı', None, None),
+        ('Durum', None, None),
+        ('Açı', 'anakart', 'angle'),
+        ('İrtifa', 'anakart', 'altitude'),
+        ('Roket GPS İrtifa', 'anakart', 'gps_altitude'),
+        ('Roket Enlem', 'anakart', 'latitude'),
+        ('Roket Boylam', 'anakart', 'longitude'),
+        ('Görev Yükü GPS İrtifa', 'gorev_yuku', 'gps_altitude'),
+        ('Görev Yükü Enlem', 'gorev_yuku', 'latitude'),
+        ('Görev Yükü Boylam', 'gorev_yuku', 'longitude'),
+        ('Jiroskop X', 'anakart', 'gyro_x'),
+        ('Jiroskop Y', 'anakart', 'gyro_y'),
+        ('Jiroskop Z', 'anakart', 'gyro_z'),
+        ('Ana Sistem İvme X', 'anakart', 'acc_x'),
+        ('Ana Sistem İvme Y', 'anakart', 'acc_y'),
+        ('Ana Sistem İvme Z', 'anakart', 'acc_z'),
+        ('RMS Internal', 'gorev_yuku', 'rms_internal'),
+        ('RMS External', 'gorev_yuku', 'rms_external')
+    )
+
+    extraColumnsChanged = pyqtSignal()
+
+    def __init__(self, history=None, rate_window_s=2.0, parent=None):
+        super().__init__(parent)
+        count = len(self.ROWS)
+        self._values = ['-'] * count
+        self._min = [None] * count
+        self._max = [None] * count
+        self.history = history
+        self.rate_window_s = rate_window_s
+        self._extra_columns = False
+        self._roles = {
+            self.FieldRole: b'field',
+            self.ValueRole: b'value',
+            self.MinRole: b'min',
+            self.MaxRole: b'max',
+            self.RateRole: b'rate'
+        }
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.ROWS)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS) if self._extra_columns else 2
+
+    def roleNames(self):
+        return self._roles
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.COLUMNS):
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            # QML TableView rolleri, widget görünümleri sütunları kullanır
+            role = self.FieldRole + index.column()
+        if role == self.FieldRole:
+            return self.ROWS[row][0]
+        if role == self.ValueRole:
+            return self._values[row]
+        if role == self.MinRole:
+            return self._format_number(self._min[row])
+        if role == self.MaxRole:
+            return self._format_number(self._max[row])
+        if role == self.RateRole:
+            kaynak = self.ROWS[row][1]
+            if kaynak is None or self.history is None:
+                return '-'
+            rate = self.history.rate(kaynak, self.rate_window_s)
+            return '-' if rate is None else f"{rate:.1f}"
+        return None
+
+    @staticmethod
+    def _format_number(value):
+        return '-' if value is None else f"{value:.2f}"
+
+    @pyqtProperty(bool, notify=extraColumnsChanged)
+    def extraColumns(self):
+        return self._extra_columns
+
+    @extraColumns.setter
+    def extraColumns(self, enabled):
+        enabled = bool(enabled)
+        if enabled == self._extra_columns:
+            return
+        self.beginResetModel()
+        self._extra_columns = enabled
+        self.endResetModel()
+        self.extraColumnsChanged.emit()
+
+    def update_fields(self, fields, samples):
+        """Yeni alan değerlerini uygular; samples: kaynak -> son örnek (min/max için)"""
+        values = self._values
+        changed = []
+        for row, (name, kaynak, attr) in enumerate(self.ROWS):
+            value = fields.get(name)
+            if value is None or value == values[row]:
+                continue
+            values[row] = value
+            changed.append(row)
+            if self._extra_columns and attr is not None:
+                self._track_extras(row, getattr(samples.get(kaynak), attr, None))
+        if self._extra_columns:
+            # Hız, değer değişmese de (kaynak sustuğunda) her yenilemede güncellenir
+            rate_column = len(self.COLUMNS) - 1
+            self.dataChanged.emit(self.index(0, rate_column), self.index(len(self.ROWS) - 1, rate_column),
+                                  [self.RateRole, Qt.DisplayRole])
+        if not changed:
+            return changed
+        # Ardışık satırları tek dataChanged aralığında bildir
+        roles = [self.ValueRole, Qt.DisplayRole]
+        if self._extra_columns:
+            roles += [self.MinRole, self.MaxRole]
+        last_column = self.columnCount() - 1
+        start = prev = changed[0]
+        for row in changed[1:] + [None]:
+            if row is not None and row == prev + 1:
+                prev = row
+                continue
+            self.dataChanged.emit(self.index(start, 0), self.index(prev, last_column), roles)
+            if row is not None:
+                start = prev = row
+        return changed
+
+    def _track_extras(self, row, number):
+        if not isinstance(number, (int, float)) or number != number:
+            return  # 'ovf' veya NaN
+        if self._min[row] is None or number < self._min[row]:
+            self._min[row] = number
+        if self._max[row] is None or number > self._max[row]:
+            self._max[row] = number
+
+class MinMaxDecimator:
+    """Bir kanalın piksel sütunu başına (min, max) özeti; yeni örnekler son sütuna artımlı katlanır.
+
+    window_s > 0 ise son window_s saniye kayan pencerede gösterilir; 0 ise tüm uçuş sığdırılır ve sütun
+    sayısı aşıldıkça sütun süresi ikiye katlanıp komşu sütunlar birleştirilir. Her iki durumda da sütun
+    sayısı piksel genişliğiyle sınırlıdır.
+    """
+
+    def __init__(self, columns, window_s):
+        self.columns = max(1, int(columns))
+        self.window_s = window_s
+        self.buckets = collections.deque()  # [sütun no, min, max]
+        self.bucket_dt = window_s / self.columns if window_s > 0 else 0.05
+        self.t0 = None
+
+    def add(self, t, value):
+        if value != value:
+            return  # NaN (ör. 'ovf')
+        if self.t0 is None:
+            self.t0 = 0.0 if self.window_s > 0 else t
+        index = int((t - self.t0) / self.bucket_dt)
+        buckets = self.buckets
+        if buckets and buckets[-1][0] == index:
+            bucket = buckets[-1]
+            if value < bucket[1]:
+                bucket[1] = value
+            elif value > bucket[2]:
+                bucket[2] = value
+        else:
+            buckets.append([index, value, value])
+
+    def trim(self, now):
+        buckets = self.buckets
+        if self.window_s > 0:
+            first = int((now - self.window_s) / self.bucket_dt)
+            while buckets and buckets[0][0] < first:
+                buckets.popleft()
+        else:
+            while self.buckets and self.buckets[-1][0] - self.buckets[0][0] >= self.columns:
+                self._coarsen()
+
+    def _coarsen(self):
+        self.bucket_dt *= 2.0
+        merged = collections.deque()
+        for index, low, high in self.buckets:
+            index //= 2
+            if merged and merged[-1][0] == index:
+                bucket = merged[-1]
+                bucket[1] = min(bucket[1], low)
+                bucket[2] = max(bucket[2], high)
+            else:
+                merged.append([index, low, high])
+        self.buckets = merged
+
+    def first_index(self, now):
+        """Görünür aralığın ilk sütun numarası (x ekseninin başlangıcı)"""
+        if self.window_s > 0:
+            return int((now - self.window_s) / self.bucket_dt)
+        return self.buckets[0][0] if self.buckets else 0
+
+class TelemetryPlot(QQuickPaintedItem):
+    """Telemetri geçmişinden canlı çizgi grafik (QML: TelemetryPlot).
+
+    Her tikte yalnızca halka tampona yeni eklenen örnekler okunup MinMaxDecimator'lara katlanır; çizilen
+    nokta sayısı piksel genişliğinin iki katını geçmez, yani çizim maliyeti uçuş süresine bağlı değildir.
+    Genişlik, pencere, kaynak veya kanallar değişince özetler tampondan yeniden kurulur.
+    """
+    PALETTE = ('#e53935', '#43a047', '#1e88e5', '#fdd835')
+
+    managerChanged = pyqtSignal()
+    sourceChanged = pyqtSignal()
+    channelsChanged = pyqtSignal()
+    titleChanged = pyqtSignal()
+    windowSecondsChanged = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._manager = None
+        self._source = 'anakart'
+        self._channels = ['altitude']
+        self._title = ''
+        self._window_s = 60.0
+        self._decimators = []
+        self._cursor = 0  # Halka tamponda okunan toplam örnek sayısı
+        self._generation = 0  # Okunan halkanın clear() sayısı
+        self._now = 0.0
+        self._dirty = True  # Özetler yeniden kurulmalı
+        self.paints = 0
+
+    @pyqtProperty(QObject, notify=managerChanged)
+    def manager(self):
+        return self._manager
+
+    @manager.setter
+    def manager(self, manager):
+        if manager is self._manager:
+            return
+        if self._manager is not None:
+            try:
+                self._manager.telemetry_data_changed.disconnect(self.refresh)
+            except (RuntimeError, TypeError):
+                pass  # Yönetici kapanışta önce silinmiş olabilir
+        self._manager = manager
+        if manager is not None:
+            # Arayüz yenileme saatinin tikiyle güncellenir
+            manager.telemetry_data_changed.connect(self.refresh)
+        self._invalidate()
+        self.managerChanged.emit()
+
+    @pyqtProperty(str, notify=sourceChanged)
+    def source(self):
+        return self._source
+
+    @source.setter
+    def source(self, source):
+        if source != self._source:
+            self._source = source
+            self._invalidate()
+            self.sourceChanged.emit()
+
+    @pyqtProperty(str, notify=channelsChanged)
+    def channels(self):
+        return ','.join(self._channels)
+
+    @channels.setter
+    def channels(self, channels):
+        channels = [name.strip() for name in channels.split(',') if name.strip()]
+        if channels != self._channels:
+            self._channels = channels
+            self._invalidate()
+            self.channelsChanged.emit()
+
+    @pyqtProperty(str, notify=titleChanged)
+    def title(self):
+        return self._title
+
+    @title.setter
+    def title(self, title):
+        if title != self._title:
+            self._title = title
+            self.update()
+            self.titleChanged.emit()
+
+    @pyqtProperty(float, notify=windowSecondsChanged)
+    def windowSeconds(self):
+        return self._window_s
+
+    @windowSeconds.setter
+    def windowSeconds(self, window_s):
+        if window_s != self._window_s:
+            self._window_s = max(0.0, window_s)
+            self._invalidate()
+            self.windowSecondsChanged.emit()
+
+    def geometryChanged(self, new_geometry, old_geometry):
+        super().geometryChanged(new_geometry, old_geometry)
+        if int(new_geometry.width()) != int(old_geometry.width()):
+            self._invalidate()
+
+    def _invalidate(self):
+        self._dirty = True
+        self.refresh()
+
+    def _ring(self):
+        history = getattr(self._manager, 'history', None)
+        try:
+            return history[self._source] if history is not None else None
+        except KeyError:
+            return None
+
+    @pyqtSlot()
+    def refresh(self):
+        """Yeni örnekleri özetlere katlar; değişiklik varsa yeniden çizim ister"""
+        ring = self._ring()
+        if ring is None or self.width() < 2:
+            return
+        fresh = ring.total - self._cursor
+        if self._dirty or fresh > ring.count or ring.generation != self._generation:
+            # Yeniden kurulum: pencere içindeki (veya tüm) örnekler baştan katlanır
+            self._decimators = [MinMaxDecimator(self.width(), self._window_s) for _ in self._channels]
+            latest = ring.latest('t')
+            fresh = ring.count if self._window_s <= 0 or latest is None else ring.count_since(latest - self._window_s)
+            self._dirty = False
+            self._generation = ring.generation
+        self._cursor = ring.total
+        if fresh <= 0:
+            return
+        try:
+            columns = [ring.values(name, fresh) for name in self._channels]
+        except KeyError:
+            log_ui.warning('⚠️ Grafik kanalı bulunamadı: %s/%s', self._source, ','.join(self._channels))
+            return
+        times = ring.values('t', fresh)
+        for decimator, values in zip(self._decimators, columns):
+            add = decimator.add
+            for t, value in zip(times, values):
+                add(t, value)
+        self._now = times[-1]
+        for decimator in self._decimators:
+            decimator.trim(self._now)
+        self.update()
+
+    def paint(self, painter):
+        self.paints += 1
+        width, height = self.width(), self.height()
+        painter.fillRect(0, 0, int(width), int(height), QColor('#000000'))
+        painter.setPen(QColor('#FFFFFF'))
+        painter.drawText(6, 14, self._title or ', '.join(self._channels))
+        lows = [bucket[1] for decimator in self._decimators for bucket in decimator.buckets]
+        if not lows:
+            return
+        low = min(lows)
+        high = max(bucket[2] for decimator in self._decimators for bucket in decimator.buckets)
+        if high - low < 1e-9:
+            low, high = low - 1.0, high + 1.0
+        painter.drawText(int(width) - 80, 14, f'{high:.2f}')
+        painter.drawText(int(width) - 80, int(height) - 4, f'{low:.2f}')
+        top, span = 18.0, height - 24.0
+        scale_y = span / (high - low)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        for number, decimator in enumerate(self._decimators):
+            first = decimator.first_index(self._now)
+            scale_x = width / decimator.columns
+            points = []
+            for index, bucket_low, bucket_high in decimator.buckets:
+                x = (index - first) * scale_x
+                # Sütun başına min ve max: aradaki tüm örnekler dikey çizgiyle kapsanır
+                points.append(QPointF(x, top + (high - bucket_low) * scale_y))
+                points.append(QPointF(x, top + (high - bucket_high) * scale_y))
+            pen = QPen(QColor(self.PALETTE[number % len(self.PALETTE)]))
+            pen.setWidth(1)
+            painter.setPen(pen)
+            painter.drawPolyline(QPolygonF(points))
+
+qmlRegisterType(TelemetryPlot, 'Telemetri', 1, 0, 'TelemetryPlot')
+
+class UiRefreshClock(QObject):
+    """Paket hızından bağımsız arayüz yenileme saati; iki tik arasındaki tüm örnekler tek güncellemede birleşir.
+
+    Uyarlamalı modda olay döngüsü gecikmesi (tik gecikmesi + yenileme süresi) aralığın yarısını
+    aşarsa hız bir kademe düşürülür, gecikme düzelince hedef hıza geri çıkılır.
+    """
+    RATE_STEPS = (60, 30, 20, 15, 10, 5, 2)
+
+    def __init__(self, callback, rate_hz=10, adaptive=False, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+        self.target_hz = rate_hz
+        self.current_hz = rate_hz
+        self.adaptive = adaptive
+        self.refreshes = 0
+        self.coalesced_samples = 0
+        self.lag_ms = 0.0  # Üstel ortalama
+        self._pending = 0
+        self._last_tick = None
+        self._healthy_ticks = 0
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_tick)
+
+    def start(self):
+        self._last_tick = time.monotonic()
+        self._timer.start(max(1, round(1000 / self.current_hz)))
+
+    def stop(self):
+        self._timer.stop()
+
+    def mark_dirty(self, count=1):
+        """Yeni örnek geldiğini bildirir; arayüz bir sonraki tikte güncellenir"""
+        self._pending += count
+
+    def set_rate(self, rate_hz):
+        self.target_hz = rate_hz
+        self._apply_rate(rate_hz)
+
+    def _apply_rate(self, rate_hz):
+        self.current_hz = rate_hz
+        self._healthy_ticks = 0
+        if self._timer.isActive():
+            self._timer.setInterval(max(1, round(1000 / rate_hz)))
+
+    def _on_tick(self):
+        now = time.monotonic()
+        interval = 1.0 / self.current_hz
+        lateness = max(0.0, (now - self._last_tick) - interval) if self._last_tick is not None else 0.0
+        self._last_tick = now
+        work = 0.0
+        if self._pending:
+            self.coalesced_samples += self._pending
+            self._pending = 0
+            self.refreshes += 1
+            self._callback()
+            work = time.monotonic() - now
+        self.lag_ms = self.lag_ms * 0.8 + (lateness + work) * 1000.0 * 0.2
+        if self.adaptive:
+            self._adapt(interval)
+
+    def _adapt(self, interval):
+        lag = self.lag_ms / 1000.0
+        if lag > interval * 0.5:
+            slower = [hz for hz in self.RATE_STEPS if hz < self.current_hz]
+            if slower:
+                self._apply_rate(slower[0])
+                log_ui.info('Arayüz gecikmesi %.1f ms, yenileme hızı %s Hz\'e düşürüldü', self.lag_ms, self.current_hz)
+        elif self.current_hz < self.target_hz and lag < interval * 0.2:
+            self._healthy_ticks += 1
+            # Yaklaşık 2 saniye sorunsuz çalışınca bir kademe yüksel
+            if self._healthy_ticks >= self.current_hz * 2:
+                faster = [hz for hz in reversed(self.RATE_STEPS) if self.current_hz < hz <= self.target_hz]
+                self._apply_rate(faster[0] if faster else self.target_hz)
+
+    def stats(self):
+        return {
+            'target_hz': self.target_hz,
+            'current_hz': self.current_hz,
+            'adaptive': self.adaptive,
+            'lag_ms': round(self.lag_ms, 2),
+            'refreshes': self.refreshes,
+            'coalesced_samples': self.coalesced_samples
+        }
+
+class _PoolTask(QRunnable):
+    """QThreadPool'da func() çalıştırıp sonucu callback'e veren iş"""
+
+    def __init__(self, func, callback):
+        super().__init__()
+        self.func = func
+        self.callback = callback
+
+    def run(self):
+        self.callback(self.func())
+
+class PortDiscovery(QObject):
+    """Seri port keşfi: adaylar QThreadPool'da paralel denenir, sonuçlar geldikçe yayınlanır.
+
+    Sonuçlar cihaz kimliğine göre (yol, aygıt numarası/oluşturma zamanı, seri no, VID/PID) önbelleğe alınır;
+    yalnızca yeni veya kimliği değişen cihazlar yeniden denenir, kaybolan cihazlar için portRemoved yayılır.
+    busy_paths() uygulamanın açık tuttuğu yolları döndürür; bunlar zorla taramada bile denenmez.
+    """
+    portAdded = pyqtSignal('QVariantMap')  # {'name', 'path'}
+    portRemoved = pyqtSignal(str)  # path
+    scanStarted = pyqtSignal()
+    scanFinished = pyqtSignal(list)
+    _listed = pyqtSignal(int, bool, object)  # tarama no, zorla, aday listesi (havuz thread'inden, kuyruklu)
+    _probed = pyqtSignal(int, object, object)  # tarama no, kimlik, sonuç (havuz thread'inden, kuyruklu)
+
+    PROBE_BAUD = 19200
+    POSIX_PREFIXES = ('ttyUSB', 'ttyACM', 'cu.usbserial', 'cu.usbmodem')
+
+    def __init__(self, max_workers=8, busy_paths=None, parent=None):
+        super().__init__(parent)
+        # Sahibin metoduna zayıf referans: döngü olursa sahip, havuz thread'leri çalışırken çöp toplayıcıda
+        # silinebilir ve QThreadPool yıkıcısı GIL'i bekleyen thread'leri beklerken kilitlenir
+        self._busy_paths = weakref.WeakMethod(busy_paths) if busy_paths is not None else None
+        # QSerialPort soket bildiricileri yalnızca QThread'lerde çalışır; Python thread havuzu kullanılmaz
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_workers)
+        self._cache = {}  # path -> (kimlik, giriş veya None)
+        self._generation = 0
+        self._pending = 0
+        self.scanning = False
+        self.probes = 0
+        self._listed.connect(self._on_listed)
+        self._probed.connect(self._on_probed)
+
+    def candidates(self):
+        """(path, görünen ad, kimlik) aday listesi"""
+        result = []
+        if sys.platform.startswith('darwin') or sys.platform.startswith('linux'):
+            try:
+                names = os.listdir('/dev')
+            except OSError:
+                names = []
+            for dev in sorted(names):
+                if dev.startswith(self.POSIX_PREFIXES):
+                    path = '/dev/' + dev
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    info = QSerialPortInfo(path)
+                    # Adaptör yeniden takılınca aygıt düğümü yeniden oluşturulur (ctime değişir)
+                    identity = (path, st.st_rdev, st.st_ctime_ns, info.serialNumber(),
+                                info.vendorIdentifier(), info.productIdentifier())
+                    result.append((path, dev, identity))
+        else:
+            for info in QSerialPortInfo.availablePorts():
+                port_name = info.portName()
+                if port_name.startswith('COM'):
+                    display_name = f"{port_name} - {info.description()}" if info.description() else f"COM Port ({port_name})"
+                    identity = (port_name, info.serialNumber(), info.vendorIdentifier(),
+                                info.productIdentifier(), info.description())
+                    result.append((port_name, display_name, identity))
+        return result
+
+    @classmethod
+    def probe(cls, path, display_name):
+        """Portu kısa süreliğine açmayı dener; listelenecekse giriş, değilse None döner (havuz thread'i)"""
+        try:
+            ser = QSerialPort(path)
+            ser.setBaudRate(cls.PROBE_BAUD)
+            if ser.open(QSerialPort.ReadWrite):
+                ser.close()
+                return {'name': display_name, 'path': path}
+        except Exception:
+            if not (sys.platform.startswith('darwin') or sys.platform.startswith('linux')):
+                # Port kullanımda olabilir, yine de listeye ekle
+                return {'name': f"{path} (Kullanımda)", 'path': path}
+        return None
+
+    def _plan(self, candidates, force):
+        """Kaybolan cihazları önbellekten çıkarır, denenmesi gereken adayları döndürür.
+
+        Zorla taramada kimliği aynı kalan portlar listeden düşürülmeden yeniden denenir. Açık tutulan
+        portlar hiç denenmez (açma denemesi başarısız olur); önbellekte yoksa denenmeden listeye eklenir.
+        """
+        present = {path for path, _, _ in candidates}
+        for path in [p for p in self._cache if p not in present]:
+            identity, entry = self._cache.pop(path)
+            if entry is not None:
+                self.portRemoved.emit(path)
+        busy_paths = self._busy_paths() if self._busy_paths is not None else None
+        busy = busy_paths() if busy_paths is not None else ()
+        to_probe = []
+        for path, display_name, identity in candidates:
+            cached = self._cache.get(path)
+            if path in busy:
+                if cached is None:
+                    self._store(identity, {'name': display_name, 'path': path})
+            elif cached is None or cached[0] != identity:
+                if cached is not None:
+                    self._cache.pop(path)
+                    if cached[1] is not None:
+                        self.portRemoved.emit(path)
+                to_probe.append((path, display_name, identity))
+            elif force:
+                to_probe.append((path, display_name, identity))
+        return to_probe
+
+    def ports(self):
+        return [entry for _, (_, entry) in sorted(self._cache.items()) if entry is not None]
+
+    def device_key(self, path):
+        """Yoldaki cihazın (seri no, VID, PID) kimliği; seri numarası yoksa None.
+
+        Seri numarası olmayan iki özdeş adaptör ayırt edilemediğinden bunlar yalnızca yoldan eşleştirilir.
+        """
+        cached = self._cache.get(path)
+        if cached is not None:
+            identity = cached[0]
+            key = identity[3:6] if path.startswith('/dev/') else identity[1:4]
+        elif '://' in path:
+            return None
+        else:
+            info = QSerialPortInfo(path)
+            key = (info.serialNumber(), info.vendorIdentifier(), info.productIdentifier())
+        return key if key[0] else None
+
+    def scan_async(self, force=False):
+        """Değişen cihazları arka planda dener; sonuçlar portAdded ile akar, sonunda scanFinished yayılır"""
+        self._generation += 1
+        generation = self._generation
+        self.scanning = True
+        self.scanStarted.emit()
+        # Aday listesi (cihaz bilgisi sorguları dahil) de havuzda hazırlanır
+        self._pool.start(_PoolTask(self.candidates, lambda c: self._listed.emit(generation, force, c)))
+
+    def _on_listed(self, generation, force, candidates):
+        if generation != self._generation:
+            return
+        to_probe = self._plan(candidates, force)
+        self._pending = len(to_probe)
+        if not to_probe:
+            self._finish()
+            return
+        for path, display_name, identity in to_probe:
+            self._pool.start(_PoolTask(lambda p=path, n=display_name: self.probe(p, n),
+                                       lambda e, i=identity: self._probed.emit(generation, i, e)))
+
+    def _store(self, identity, entry):
+        path = identity[0]
+        cached = self._cache.get(path)
+        listed = cached is not None and cached[1] is not None
+        self._cache[path] = (identity, entry)
+        if entry is not None and not listed:
+            self.portAdded.emit(entry)
+        elif entry is None and listed:
+            self.portRemoved.emit(path)
+
+    def _on_probed(self, generation, identity, entry):
+        if generation != self._generation:
+            return  # Eski taramanın sonucu
+        self.probes += 1
+        self._store(identity, entry)
+        self._pending -= 1
+        if self._pending <= 0:
+            self._finish()
+
+    def _finish(self):
+        self.scanning = False
+        ports = self.ports()
+        log_ports.info('✅ Toplam %s seri port bulundu (%s deneme)', len(ports), self.probes)
+        self.scanFinished.emit(ports)
+
+    def shutdown(self):
+        self._pool.clear()
+        self._pool.waitForDone()
+
+class PortWatcher(QObject):
+    """Cihaz takma/çıkarma olaylarını izler ve kısa bir sakinleşme süresinden sonra changed yayar.
+
+    Linux'ta /dev dizini QFileSystemWatcher (inotify) ile izlenir; diğer platformlarda
+    QSerialPortInfo.availablePorts() listesi periyodik olarak karşılaştırılır.
+    """
+    changed = pyqtSignal()
+
+    def __init__(self, poll_interval_ms=1000, debounce_ms=300, parent=None):
+        super().__init__(parent)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(self.changed)
+        self._fs_watcher = None
+        self._poll_timer = None
+        self._last = None
+        if sys.platform.startswith('linux') and os.path.isdir('/dev'):
+            self._fs_watcher = QFileSystemWatcher(['/dev'], self)
+            self._fs_watcher.directoryChanged.connect(self._schedule)
+        else:
+            self._last = self._snapshot()
+            self._poll_timer = QTimer(self)
+            self._poll_timer.timeout.connect(self._poll)
+            self._poll_timer.start(poll_interval_ms)
+
+    @staticmethod
+    def _snapshot():
+        return frozenset((info.portName(), info.serialNumber()) for info in QSerialPortInfo.availablePorts())
+
+    def _poll(self):
+        snapshot = self._snapshot()
+        if snapshot != self._last:
+            self._last = snapshot
+            self._schedule()
+
+    def _schedule(self, *args):
+        # Bir adaptör birden çok düğüm oluşturabilir; olaylar tek taramada birleştirilir
+        self._debounce.start()
+
+    def stop(self):
+        self._debounce.stop()
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
+        if self._fs_watcher is not None:
+            self._fs_watcher.removePaths(self._fs_watcher.directories())
+
+class BaudDetector(QObject):
+    """Telemetri akışını aday hızlarda kısa süre dinleyip geçerli satır/çerçeve üreten hızı bulur.
+
+    Her aday hız havuz thread'inde ayrı açılışla dinlenir; yeterli geçerli paket görülen ilk hızda durulur,
+    görülmezse en çok geçerli paket üreten hız seçilir. Hiç geçerli paket yoksa 0 döner.
+    """
+    detected = pyqtSignal(str, str, int, object)  # port anahtarı, port adı, hız (0: bulunamadı), skorlar
+    _done = pyqtSignal(str, str, object)  # havuz thread'inden, kuyruklu
+
+    CANDIDATES = (115200, 57600, 19200, 9600, 38400, 230400, 460800, 921600)
+
+    def __init__(self, dwell_s=0.4, min_frames=3, parent=None):
+        super().__init__(parent)
+        self.dwell_s = dwell_s
+        self.min_frames = min_frames
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(2)
+        self._busy = set()
+        self._done.connect(self._on_done)
+
+    def is_detecting(self, port_key):
+        return port_key in self._busy
+
+    def detect_async(self, port_key, port_name, candidates=None):
+        if port_key in self._busy:
+            return False
+        self._busy.add(port_key)
+        candidates = tuple(candidates or self.CANDIDATES)
+        self._pool.start(_PoolTask(lambda: self.detect(port_name, candidates),
+                                   lambda result: self._done.emit(port_key, port_name, result)))
+        return True
+
+    def detect(self, port_name, candidates=None):
+        """(hız, {hız: geçerli paket}) döndürür; çağıran thread'i engeller"""
+        scores = {}
+        for baud_rate in candidates or self.CANDIDATES:
+            scores[baud_rate] = self.score(port_name, baud_rate)
+            if scores[baud_rate] >= self.min_frames:
+                return baud_rate, scores
+        best = max(scores, key=scores.get, default=0)
+        return (best if scores.get(best) else 0), scores
+
+    def score(self, port_name, baud_rate):
+        """Portu bu hızda dinler ve çözülebilen satır/çerçeve sayısını döndürür"""
+        port = QSerialPort(port_name)
+        configure_serial_port(port, baud_rate)
+        if not port.open(QSerialPort.ReadOnly):
+            return 0
+        framer = AutoFramer()
+        decoder = AutoDecoder()
+        valid = 0
+        try:
+            # Hız değişiminden önce tamponda kalan baytlar yanlış hızda alınmıştır
+            port.clear(QSerialPort.Input)
+            deadline = time.monotonic() + self.dwell_s
+            while valid < self.min_frames:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not port.waitForReadyRead(max(1, int(remaining * 1000))):
+                    break
+                for item in framer.feed(bytes(port.readAll())):
+                    try:
+                        decoder.decode(item)
+                        valid += 1
+                    except Exception:
+                        pass
+        finally:
+            port.close()
+        return valid
+
+    def _on_done(self, port_key, port_name, result):
+        self._busy.discard(port_key)
+        baud_rate, scores = result
+        if baud_rate:
+            log_ports.info('🔎 %s için baud rate bulundu: %s (%s)', port_name, baud_rate, scores)
+        else:
+            log_ports.warning('⚠️ %s için geçerli veri üreten baud rate bulunamadı (%s)', port_name, scores)
+        self.detected.emit(port_key, port_name, baud_rate, scores)
+
+    def shutdown(self):
+        self._pool.clear()
+        self._pool.waitForDone()
+
+class ConnectionSupervisor(QObject):
+    """Port hata sinyallerini izler, kopan bağlantıyı üstel geri çekilmeyle yeniden açar ve kesintileri kaydeder.
+
+    Kopan port kapatılırken yapılandırması, çerçeveleyicideki yarım satır ve sayaçlar korunur;
+    yeniden bağlanma aynı bağlantı yolunu kullanır. Kullanıcı bağlantıyı keserse denemeler durur.
+    """
+    FATAL_ERRORS = (QSerialPort.ResourceError, QSerialPort.DeviceNotFoundError, QSerialPort.PermissionError,
+                    QSerialPort.ReadError, QSerialPort.WriteError)
+
+    def __init__(self, release, reconnect, initial_delay=0.25, max_delay=10.0, history=50, parent=None):
+        super().__init__(parent)
+        self._release = release  # port anahtarı -> portu kapatır, yapılandırmayı korur
+        self._reconnect = reconnect  # port anahtarı -> bool
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.enabled = True
+        self.outages = collections.deque(maxlen=history)
+        self.totals = {}
+        self._recovering = {}
+
+    def is_recovering(self, port_key):
+        return port_key in self._recovering
+
+    def port_error(self, port_key, error):
+        """QSerialPort.errorOccurred; yalnızca bağlantıyı koparan hatalar kurtarma başlatır"""
+        if error in self.FATAL_ERRORS:
+            # Port, hata sinyali içinden değil olay döngüsüne dönünce kapatılır
+            QTimer.singleShot(0, lambda: self.link_lost(port_key, f'hata kodu {int(error)}'))
+        elif error != QSerialPort.NoError:
+            log_ports.warning('⚠️ %s portu hatası: %s', port_key, int(error))
+
+    def link_lost(self, port_key, reason):
+        if port_key in self._recovering:
+            return
+        log_ports.warning('⚠️ %s bağlantısı koptu (%s), yeniden bağlanılacak', port_key, reason)
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.timeout.connect(lambda: self._attempt(port_key))
+        self._recovering[port_key] = {
+            'since': time.monotonic(), 'started_at': time.time(), 'reason': reason,
+            'attempts': 0, 'delay': self.initial_delay, 'timer': timer
+        }
+        self._release(port_key)
+        if self.enabled:
+            timer.start(int(self.initial_delay * 1000))
+
+    def _attempt(self, port_key):
+        state = self._recovering.get(port_key)
+        if state is None or not self.enabled:
+            return
+        state['attempts'] += 1
+        if self._reconnect(port_key):
+            return  # Başarılı bağlantı connected() ile kesintiyi kapatır
+        state['delay'] = min(state['delay'] * 2, self.max_delay)
+        log_ports.info('%s yeniden bağlanma denemesi %s başarısız, %.2f s sonra tekrar', port_key,
+                       state['attempts'], state['delay'])
+        state['timer'].start(int(state['delay'] * 1000))
+
+    def connected(self, port_key):
+        """Port (yeniden) bağlandı; sürmekte olan kesinti kaydedilir"""
+        self._end(port_key, True)
+
+    def cancel(self, port_key):
+        """Kullanıcı bağlantıyı kesti; yeniden bağlanma denemeleri durdurulur"""
+        self._end(port_key, False)
+
+    def _end(self, port_key, recovered):
+        state = self._recovering.pop(port_key, None)
+        if state is None:
+            return
+        state['timer'].stop()
+        state['timer'].deleteLater()
+        duration = time.monotonic() - state['since']
+        self.outages.append({
+            'port': port_key, 'started_at': state['started_at'], 'duration_s': round(duration, 3),
+            'reason': state['reason'], 'attempts': state['attempts'], 'recovered': recovered
+        })
+        totals = self.totals.setdefault(port_key, {'outages': 0, 'total_outage_s': 0.0})
+        totals['outages'] += 1
+        totals['total_outage_s'] = round(totals['total_outage_s'] + duration, 3)
+        if recovered:
+            log_ports.info('✅ %s yeniden bağlandı, kesinti %.2f s (%s deneme)', port_key, duration, state['attempts'])
+
+    def stats(self):
+        now = time.monotonic()
+        return {
+            'recovering': {port_key: {'outage_s': round(now - state['since'], 3), 'attempts': state['attempts'],
+                                      'next_delay_s': state['delay'], 'reason': state['reason']}
+                           for port_key, state in self._recovering.items()},
+            'totals': self.totals,
+            'outages': list(self.outages)
+        }
+
+class SerialManager(QObject):
+    # Signals
+    telemetry_data_changed = pyqtSignal()
+    telemetry_ports_changed = pyqtSignal()
+    telemetryConnectedChanged = pyqtSignal()
+    telemetry2ConnectedChanged = pyqtSignal()
+    judgeConnectedChanged = pyqtSignal()
+    telemetry_status_changed = pyqtSignal()
+    telemetry2_status_changed = pyqtSignal()
+    judge_status_changed = pyqtSignal()
+    portsChanged = pyqtSignal(list)  # QML için portsChanged sinyali
+    portAdded = pyqtSignal('QVariantMap')  # Keşifte bulunan port (artımlı)
+    portRemoved = pyqtSignal(str)  # Kaybolan portun yolu
+    portScanFinished = pyqtSignal(list)
+    baudDetected = pyqtSignal(str, int)  # port anahtarı, bulunan hız (0: bulunamadı)
+    mainPositionChanged = pyqtSignal(float, float)  # Ana sistem enlem, boylam
+    payloadPositionChanged = pyqtSignal(float, float)  # Görev yükü enlem, boylam
+    
+    def __init__(self, config=None):
+        super().__init__()
+        # Komut satırı seçenekleri main'de bir kez çözülür; verilmezse varsayılanlar kullanılır
+        self.config = config = parse_command_line([]) if config is None else config
+        self.telemetry_port = None  # Ana sistem
+        self.telemetry2_port = None  # Görev yükü
+        self.judge_port = None  # Hakem
+        self._telemetry_connected = False
+        self._telemetry2_connected = False
+        self._judge_connected = False
+        self._telemetry_port_name = ""
+        self._telemetry2_port_name = ""
+        self._judge_port_name = ""
+        self.team_id = 1
+        self.angle = 0.0
+        self._map_html_path = ""
+        # Harita döşemeleri: MBTiles deposu + yerel sunucu, harita ilk gerektiğinde başlatılır (--tile-store=, --offline)
+        self.tile_store_path = config.tile_store
+        self.map_offline = config.offline
+        self.tile_url = config.tile_url
+        self.tile_server = None
+        # Araç başına yer izi ve gömülü harita: konumlar/iz QWebChannel ile sabit hızda toplu gönderilir (--map-hz=)
+        self.tracks = {'anakart': TrackStore(), 'gorev_yuku': TrackStore()}
+        self.map_bridge = MapBridge(config.map_hz, tracks=self.tracks, parent=self)
+        self.packet_counter = 0
+        
+        # Veri birleştirme sistemi için değişkenler
+        # Kaynak başına son örnek: tablo, harita ve hakem paketi bunlardan türetilir
+        self.ana_sistem_sample = None  # Ana sistem
+        self.gorev_yuku_sample = None  # Görev yükü
+        self._display_fields = None  # Son örneklerden üretilen tablo değerleri (ilk okumada)
+        # Hakem paketi için kaynak tazeliği (--stale-policy=hold|dead_reckon|flag, --stale-after=1.0)
+        self.freshness = FreshnessMerger(config.stale_policy, config.stale_after)
+        # Tüm kanalların geçmişi: grafikler, analiz ve dışa aktarım buradan okur (--history-capacity=65536)
+        self.history = TelemetryHistory(config.history_capacity)
+        self.table_model = TelemetryTableModel(self.history, parent=self)  # QML telemetri tablosu
+        self._shown_positions = {'anakart': None, 'gorev_yuku': None}
+
+        # Arayüz yenileme saati: örnekler tik başına tek güncellemede birleşir (--ui-hz, --ui-adaptive)
+        self.ui_clock = UiRefreshClock(self._refresh_ui, config.ui_hz, config.ui_adaptive, self)
+        self.ui_clock.start()
+        self.judge_scheduler = None  # Hakem gönderme zamanlayıcısı (kendi thread'inde)
+        self._judge_thread = None
+        self.judge_send_frequency = 5  # Hz (saniyede 5 kere)
+        self.judge_send_interval = 200  # ms
+        self._hyi_encoders = threading.local()  # Thread başına HYİ kodlayıcı (tampon thread'ler arasında paylaşılmaz)
+
+        # Port bazlı satır çerçeveleyiciler (yarım satır tamponu ve sayaçlar)
+        self._framers = {
+            'telemetry': AutoFramer(),
+            'telemetry2': AutoFramer()
+        }
+
+        # Port bazlı şema çözücüleri (telemetri: ana sistem, telemetri2: görev yükü)
+        self._decoders = {
+            'telemetry': create_telemetry_decoder('anakart'),
+            'telemetry2': create_telemetry_decoder('gorev_yuku')
+        }
+        for port_key, schema in config.schema.items():
+            self.set_port_schema(port_key, schema)
+
+        # İşçi thread modu: her telemetri portu kendi QThread'inde okunur ve çözülür
+        self.ingest_worker_mode = config.ingest_worker
+        self._ingest_workers = {}  # port anahtarı -> (QThread, IngestWorker)
+
+        # Paralel, önbellekli port keşfi
+        self.port_discovery = PortDiscovery(busy_paths=self._open_port_paths, parent=self)
+        self.port_discovery.portAdded.connect(self.portAdded)
+        self.port_discovery.portRemoved.connect(self.portRemoved)
+        self.port_discovery.scanFinished.connect(self._on_port_scan_finished)
+        self._ports_requested = False  # scan_ports() çağrıldı, tarama bitince portsChanged yayılacak
+
+        # Takma/çıkarma izleme ve yapılandırılmış portlara otomatik yeniden bağlanma (--no-auto-reconnect)
+        # port anahtarı -> (port adı, baud, cihaz kimliği) - kullanıcı bağlantıyı kesene kadar tutulur
+        self._port_configs = {}
+        self.auto_reconnect = not config.no_auto_reconnect
+        self.port_discovery.portAdded.connect(self._on_port_added)
+        self.port_discovery.portRemoved.connect(self._on_port_removed)
+        self.baud_detector = BaudDetector(parent=self)
+        self.baud_detector.detected.connect(self._on_baud_detected)
+        # Port hatalarında üstel geri çekilmeyle yeniden bağlanma ve kesinti kaydı
+        self.supervisor = ConnectionSupervisor(self._release_port, self._reconnect_port, parent=self)
+        self.supervisor.enabled = self.auto_reconnect
+        # --fast-start: port izleme ve ilk tarama ilk kare çizildikten (veya ilk tarama isteğinden) sonra başlar
+        self.fast_start = config.fast_start
+        self.port_watcher = None
+        if not self.fast_start:
+            QTimer.singleShot(0, self.start_port_monitoring)
+
+        # Uçuş kaydedici: ham satırlar ve hakem paketleri (--record-dir=, --no-record)
+        self.recorder = FlightRecorder(config.record_dir)
+        if not config.no_record:
+            self.start_recording()
+        
+        # Hakem gönderme timer'ını başlat
+        self._start_judge_timer()
+    
+    def _start_judge_timer(self):
+        """Hakem gönderme zamanlayıcısını kendi thread'inde başlatır"""
+        if self.judge_scheduler is None:
+            self._judge_thread = QThread()
+            self.judge_scheduler = JudgeScheduler(self._send_combined_data_to_judge, self.judge_send_frequency)
+            self.judge_scheduler.moveToThread(self._judge_thread)
+            self.judge_scheduler.port_error.connect(self._on_port_error)
+            self._judge_thread.start()
+            QMetaObject.invokeMethod(self.judge_scheduler, 'start', Qt.QueuedConnection)
+            log_judge.info('✅ Hakem gönderme zamanlayıcısı başlatıldı (%sms = %sHz)', self.judge_send_interval, self.judge_send_frequency)
+
+    def _stop_judge_timer(self):
+        if self.judge_scheduler is not None:
+            QMetaObject.invokeMethod(self.judge_scheduler, 'stop', Qt.BlockingQueuedConnection)
+            self._judge_thread.quit()
+            self._judge_thread.wait()
+            self.judge_scheduler = None
+            self._judge_thread = None
+    
+    @pyqtSlot(int)
+    def set_judge_send_frequency(self, frequency_hz):
+        """Hakem gönderme frekansını ayarlar (Hz cinsinden)"""
+        if frequency_hz < 1 or frequency_hz > 10:  # 1-10 Hz arası sınırla
+            log_judge.error('❌ Geçersiz frekans: %sHz (1-10 Hz arası olmalı)', frequency_hz)
+            return
+        
+        self.judge_send_frequency = frequency_hz
+        self.judge_send_interval = 1000 // frequency_hz  # Hz'i ms'e çevir (yalnızca gösterim)
+        if self.judge_scheduler is not None:
+            QMetaObject.invokeMethod(self.judge_scheduler, 'set_frequency', Qt.QueuedConnection,
+                                     Q_ARG(float, float(frequency_hz)))
+            log_judge.info('✅ Hakem gönderme frekansı güncellendi: %sHz (%sms)', frequency_hz, self.judge_send_interval)
+        else:
+            log_judge.warning('⚠️ Zamanlayıcı aktif değil, frekans ayarlandı: %sHz', frequency_hz)
+    
+    @pyqtSlot(result=int)
+    def get_judge_send_frequency(self):
+        """Mevcut hakem gönderme frekansını döndürür (Hz cinsinden)"""
+        return self.judge_send_frequency
+
+    @pyqtSlot(result='QVariantMap')
+    def get_judge_timing_stats(self):
+        """Gerçek gönderim aralıklarının p50/p99 değerleri ve kaçırılan gönderim sayısı"""
+        return self.judge_scheduler.stats() if self.judge_scheduler is not None else {}
+    
+    def _hyi_encoder(self):
+        """Çağıran thread'in kodlayıcısı: hakem thread'i ve GUI'deki create_hyi_packet ayrı tamponlara yazar"""
+        encoder = getattr(self._hyi_encoders, 'encoder', None)
+        if encoder is None:
+            encoder = self._hyi_encoders.encoder = HyiEncoder()
+        return encoder
+
+    def _send_combined_data_to_judge(self):
+        """Birleştirilmiş verileri hakeme gönderir (zamanlayıcı thread'inde çağrılır); gönderildiyse True döner"""
+        try:
+            if not self.judge_port or not self.judge_port.isOpen():
+                return False
+                
+            # Paket sayacını artır
+            self.packet_counter = (self.packet_counter + 1) % 256
             
-            # Görev yükü verilerini al (varsayılan değerler)
-            gorev_altitude = self.gorev_yuku_data.get('altitude', 0.0)
-            gorev_gps_altitude = self.gorev_yuku_data.get('gps_altitude', 0.0)
-            gorev_latitude = self.gorev_yuku_data.get('latitude', 0.0)
-            gorev_longitude = self.gorev_yuku_data.get('longitude', 0.0)
+            # Kaynakların son örnekleri tazelik politikasına göre (veri yoksa sıfır değerler)
+            now = time.monotonic()
+            ana = self.freshness.resolve('anakart', now)
+            gorev = self.freshness.resolve('gorev_yuku', now)
             
             # Kademe verileri için 0 değerleri (kademe yok)
             stage_gps_altitude = 0.0
             stage_latitude = 0.0
             stage_longitude = 0.0
             
-            # HYI paketi oluştur - Birleştirilmiş veriler
-            packet = self.create_hyi_packet(
-                self.packet_counter,
-                ana_altitude,  # Ana paket irtifa (ana sistem)
-                ana_gps_altitude,  # Roket GPS İrtifa (ana sistem)
-                ana_latitude,  # Roket Enlem (ana sistem)
-                ana_longitude,  # Roket Boylam (ana sistem)
-                gorev_gps_altitude,  # Görev Yükü GPS İrtifa (görev yükü)
-                gorev_latitude,  # Görev Yükü Enlem (görev yükü)
-                gorev_longitude,  # Görev Yükü Boylam (görev yükü)
+            # HYI paketi oluştur - Birleştirilmiş veriler (yeniden kullanılan tampon, kopya yok)
+            packet = self._hyi_encoder().encode(self.team_id, self.packet_counter, (
+                ana.altitude,  # Ana paket irtifa (ana sistem)
+                ana.gps_altitude,  # Roket GPS İrtifa (ana sistem)
+                ana.latitude,  # Roket Enlem (ana sistem)
+                ana.longitude,  # Roket Boylam (ana sistem)
+                gorev.gps_altitude,  # Görev Yükü GPS İrtifa (görev yükü)
+                gorev.latitude,  # Görev Yükü Enlem (görev yükü)
+                gorev.longitude,  # Görev Yükü Boylam (görev yükü)
                 stage_gps_altitude,  # Kademe GPS İrtifa (0)
                 stage_latitude,  # Kademe Enlem (0)
                 stage_longitude,  # Kademe Boylam (0)
-                ana_gyro_x,  # Jiroskop X (ana sistem)
-                ana_gyro_y,  # Jiroskop Y (ana sistem)
-                ana_gyro_z,  # Jiroskop Z (ana sistem)
-                ana_acc_x,  # İvme X (ana sistem)
-                ana_acc_y,  # İvme Y (ana sistem)
-                ana_acc_z,  # İvme Z (ana sistem)
-                ana_angle,  # Açı (ana sistem)
-                ana_status  # Durum (ana sistem)
-            )
+                ana.gyro_x,  # Jiroskop X (ana sistem)
+                ana.gyro_y,  # Jiroskop Y (ana sistem)
+                ana.gyro_z,  # Jiroskop Z (ana sistem)
+                ana.acc_x,  # İvme X (ana sistem)
+                ana.acc_y,  # İvme Y (ana sistem)
+                ana.acc_z,  # İvme Z (ana sistem)
+                ana.angle  # Açı (ana sistem)
+            ), ana.status)  # Durum (ana sistem)
             
             # Paketi hakem portuna gönder
             self.judge_port.write(packet)
-            print(f"[PYTHON] Hakem yer istasyonuna birleştirilmiş veri gönderildi (Paket: {self.packet_counter})")
-            print(f"[PYTHON] Ana Sistem: Alt={ana_altitude}, GPS={ana_gps_altitude}, Lat={ana_latitude}, Lng={ana_longitude}")
-            print(f"[PYTHON] Görev Yükü: Alt={gorev_altitude}, GPS={gorev_gps_altitude}, Lat={gorev_latitude}, Lng={gorev_longitude}")
+            stale = self.freshness.is_stale('anakart') or self.freshness.is_stale('gorev_yuku')
+            self.recorder.record(RECORD_JUDGE_STALE if stale else RECORD_JUDGE, 'judge', packet)
+            log_judge.debug('Hakem yer istasyonuna birleştirilmiş veri gönderildi (Paket: %s)', self.packet_counter)
+            log_judge.debug('Ana Sistem: Alt=%s, GPS=%s, Lat=%s, Lng=%s', ana.altitude, ana.gps_altitude, ana.latitude, ana.longitude)
+            log_judge.debug('Görev Yükü: Alt=%s, GPS=%s, Lat=%s, Lng=%s', gorev.altitude, gorev.gps_altitude, gorev.latitude, gorev.longitude)
+            return True
             
         except Exception as e:
-            print(f"[PYTHON] Hakem birleştirilmiş veri gönderme hatası: {e}")
+            log_judge.error('Hakem birleştirilmiş veri gönderme hatası: %s', e)
+            return False
 
     @pyqtProperty(bool, notify=telemetryConnectedChanged)
     def telemetry_connected(self):
@@ -1097,7 +4737,8 @@ class SerialManager(QObject):
     @pyqtSlot(int)
     def set_team_id(self, team_id):
         self.team_id = team_id
-        print(f"[PYTHON] Takım ID ayarlandı: {team_id}")
+        self._display_fields = None
+        log_ui.info('Takım ID ayarlandı: %s', team_id)
 
     @pyqtSlot(result=int)
     def get_team_id(self):
@@ -1105,651 +4746,826 @@ class SerialManager(QObject):
 
     @pyqtSlot(result=list)
     def scan_ports(self):
-        print("[PYTHON] 🔍 Port tarama başlatıldı...")
-        filtered_ports = []
-        
-        if sys.platform.startswith('darwin') or sys.platform.startswith('linux'):
-            # macOS ve Linux için
-            try:
-                for dev in os.listdir('/dev'):
-                    if (dev.startswith('ttyUSB') or dev.startswith('ttyACM') or 
-                        dev.startswith('cu.usbserial') or dev.startswith('cu.usbmodem')):
-                        path = '/dev/' + dev
-                        try:
-                            ser = QSerialPort(path)
-                            ser.setBaudRate(19200)
-                            if ser.open(QSerialPort.ReadWrite):
-                                filtered_ports.append({'name': dev, 'path': path})
-                                ser.close()
-                        except Exception as e:
-                            pass
-            except Exception as e:
-                pass
-        else:
-            # Windows için
+        """Önbellekteki port listesini hemen döndürür ve arka planda tarama başlatır.
+
+        GUI thread'i port açma denemelerini beklemez; tarama bitince güncel liste portsChanged ile gelir.
+        """
+        self._ports_requested = True
+        self.scan_ports_async(False)
+        return self.port_discovery.ports()
+
+    @pyqtSlot(bool)
+    def scan_ports_async(self, force):
+        """Arayüzü bloklamadan tarar; sonuçlar portAdded/portRemoved ile gelir, sonunda portScanFinished yayılır"""
+        if self.port_watcher is None:
+            self.start_port_monitoring()
+        if self.port_discovery.scanning and not force:
+            return
+        log_ports.info('🔍 Port tarama başlatıldı (arka planda)...')
+        self.port_discovery.scan_async(force)
+
+    @pyqtSlot()
+    def start_port_monitoring(self):
+        """Takma/çıkarma izlemesini başlatır ve ilk taramayı yapar (bir kez)"""
+        if self.port_watcher is not None:
+            return
+        self.port_watcher = PortWatcher(parent=self)
+        self.port_watcher.changed.connect(lambda: self.port_discovery.scan_async(False))
+        self.port_discovery.scan_async(False)
+
+    def _ensure_tile_server(self):
+        """Döşeme deposunu ve yerel sunucuyu ilk çağrıda açar; açılamazsa None döner"""
+        if self.tile_server is None:
             try:
-                ports = QSerialPortInfo.availablePorts()
-                for port_info in ports:
-                    port_name = port_info.portName()
-                    # Windows'ta COM portları
-                    if port_name.startswith('COM'):
-                        try:
-                            ser = QSerialPort(port_name)
-                            ser.setBaudRate(19200)
-                            if ser.open(QSerialPort.ReadWrite):
-                                # Windows'ta port adını daha açıklayıcı yap
-                                display_name = f"COM Port ({port_name})"
-                                if port_info.description():
-                                    display_name = f"{port_name} - {port_info.description()}"
-                                filtered_ports.append({'name': display_name, 'path': port_name})
-                                ser.close()
-                        except Exception as e:
-                            # Port kullanımda olabilir, yine de listeye ekle
-                            display_name = f"{port_name} (Kullanımda)"
-                            filtered_ports.append({'name': display_name, 'path': port_name})
-            except Exception as e:
-                print(f"[PYTHON] Windows port tarama hatası: {e}")
-        
-        print(f"[PYTHON] ✅ Toplam {len(filtered_ports)} seri port bulundu")
-        self.ports = filtered_ports
-        self.telemetry_ports_changed.emit()
-        self.portsChanged.emit(filtered_ports)  # QML için sinyal gönder
-        return filtered_ports
+                cache = TileCache(TileStore(self.tile_store_path), upstream=self.tile_url, offline=self.map_offline)
+                server = TileServer(cache)
+                server.start()
+                self.tile_server = server
+            except (OSError, sqlite3.Error) as e:
+                log_ui.error('❌ Döşeme sunucusu başlatılamadı: %s', e)
+                return None
+        return self.tile_server
 
-    def float_to_bytes(self, f):
-        """FLOAT32 değerini 4 byte'lık bir bayt dizisine dönüştürür."""
-        return struct.pack('<f', f)
+    @pyqtProperty(str, constant=True)
+    def map_html_path(self):
+        """Harita HTML dosyası ilk istendiğinde, yerel döşeme sunucusunu kullanacak şekilde yazılır"""
+        if not self._map_html_path:
+            server = self._ensure_tile_server()
+            if server is not None:
+                leaflet_base = server.url + '/leaflet/' if server.has_local_leaflet() else LEAFLET_CDN
+                self._map_html_path = create_map_html(leaflet_base, server.url + '/tiles/{z}/{x}/{y}.png')
+            else:
+                self._map_html_path = create_map_html(tile_url=self.tile_url)
+        return self._map_html_path
 
-    def create_hyi_packet(self, packet_counter, altitude, rocket_gps_altitude,
-                          rocket_latitude, rocket_longitude, payload_gps_altitude,
-                          payload_latitude, payload_longitude, stage_gps_altitude,
-                          stage_latitude, stage_longitude, gyroscope_x, gyroscope_y,
-                          gyroscope_z, acceleration_x, acceleration_y, acceleration_z,
-                          angle, status):
-        """HYİ haberleşme protokolüne uygun 78 byte'lık bir paket oluşturur."""
-        packet = bytearray(78)
+    @pyqtProperty(str, constant=True)
+    def map_url(self):
+        """Yerel sunucudaki harita sayfası; sunucu yoksa harita dosyasının adresi"""
+        server = self._ensure_tile_server()
+        if server is not None:
+            return server.url + '/map.html'
+        return QUrl.fromLocalFile(self.map_html_path).toString()
+
+    @pyqtProperty(str, constant=True)
+    def map_file_url(self):
+        """Gömülü görünümün açtığı harita dosyası (qrc:// kanal betiği dosya sayfasından yüklenebilir)"""
+        return QUrl.fromLocalFile(self.map_html_path).toString()
 
-        # Sabit başlık ve kuyruk değerleri
-        packet[0] = 0xFF
-        packet[1] = 0xFF
-        packet[2] = 0x54
-        packet[3] = 0x52
+    @pyqtSlot(result=str)
+    def map_view_qml(self):
+        """Canlı harita penceresinin QML adresi; web motoru ancak bu bileşen yüklenince açılır"""
+        path = cached_qml_file(MAP_VIEW_QML, 'map_view')
+        return QUrl.fromLocalFile(path).toString() if path else ''
 
-        # Takım ID (UINT8) - self.team_id kullan
-        packet[4] = self.team_id & 0xFF
+    @pyqtSlot(result='QVariantMap')
+    def get_map_stats(self):
+        """Harita köprüsü: gelen konum güncellemeleri, sayfaya yapılan toplu gönderimler ve iz boyutları"""
+        stats = self.map_bridge.stats()
+        stats['tracks'] = {kaynak: track.stats() for kaynak, track in self.tracks.items()}
+        return stats
 
-        # Paket Sayacı (UINT8)
-        packet[5] = packet_counter & 0xFF
+    @pyqtSlot(float, float, result=str)
+    def map_view_url(self, lat, lng):
+        """Konumu işaretleyen harita sayfası (harita butonları için)"""
+        if self._ensure_tile_server() is None:
+            return f"https://www.openstreetmap.org/?mlat={lat}&mlon={lng}&zoom=13&layers=M"
+        return f"{self.map_url}?lat={lat}&lng={lng}&zoom=15"
 
-        # FLOAT32 değerleri için byte dönüşümü ve atama
-        # İrtifa
-        _bytes = self.float_to_bytes(altitude)
-        packet[6:10] = _bytes
+    @pyqtSlot(result='QVariantMap')
+    def get_tile_stats(self):
+        """Döşeme önbelleği: bellek isabetleri, depo isabetleri, indirilen ve bulunamayan döşemeler"""
+        if self.tile_server is None:
+            return {}
+        stats = self.tile_server.stats()
+        stats['stored_tiles'] = self.tile_server.cache.store.count()
+        return stats
 
-        # Roket GPS İrtifa
-        _bytes = self.float_to_bytes(rocket_gps_altitude)
-        packet[10:14] = _bytes
+    @pyqtSlot(result='QVariantMap')
+    def get_startup_timing(self):
+        """Başlangıç aşamalarının süreleri (ms): imports, app, manager, qml, first_frame"""
+        return startup_profile.report()
 
-        # Roket Enlem
-        _bytes = self.float_to_bytes(rocket_latitude)
-        packet[14:18] = _bytes
+    def _connect_port(self, port_key, port_name, baud_rate):
+        connect = {'telemetry': self.connect_telemetry, 'telemetry2': self.connect_telemetry2,
+                   'judge': self.connect_judge}[port_key]
+        return connect(port_name, baud_rate)
 
-        # Roket Boylam
-        _bytes = self.float_to_bytes(rocket_longitude)
-        packet[18:22] = _bytes
+    def _disconnect_port(self, port_key):
+        disconnect = {'telemetry': self.disconnect_telemetry, 'telemetry2': self.disconnect_telemetry2,
+                      'judge': self.disconnect_judge}[port_key]
+        disconnect()
 
-        # Görev Yükü GPS İrtifa
-        _bytes = self.float_to_bytes(payload_gps_altitude)
-        packet[22:26] = _bytes
+    def _is_port_connected(self, port_key):
+        return getattr(self, f'_{port_key}_connected')
 
-        # Görev Yükü Enlem
-        _bytes = self.float_to_bytes(payload_latitude)
-        packet[26:30] = _bytes
+    def _open_port_paths(self):
+        """Bağlı portların yolları; taramada denenmezler"""
+        return {config[0] for port_key, config in self._port_configs.items() if self._is_port_connected(port_key)}
 
-        # Görev Yükü Boylam
-        _bytes = self.float_to_bytes(payload_longitude)
-        packet[30:34] = _bytes
+    def _remember_port(self, port_key, port_name, baud_rate):
+        """Bağlanılan portu, yeniden numaralanınca bulunabilmesi için cihaz kimliğiyle birlikte saklar"""
+        self._port_configs[port_key] = (port_name, baud_rate, self.port_discovery.device_key(port_name))
 
-        # Kademe GPS İrtifa
-        _bytes = self.float_to_bytes(stage_gps_altitude)
-        packet[34:38] = _bytes
+    def _on_port_removed(self, path):
+        """Bağlı portun adaptörü çıkarıldıysa bağlantı gözetmene kopmuş olarak bildirilir"""
+        for port_key, (port_name, baud_rate, device) in list(self._port_configs.items()):
+            if port_name == path and self._is_port_connected(port_key):
+                self.supervisor.link_lost(port_key, 'cihaz kayboldu')
 
-        # Kademe Enlem
-        _bytes = self.float_to_bytes(stage_latitude)
-        packet[38:42] = _bytes
+    def _detect_baud(self, port_key, port_name):
+        """Hızı arka planda tespit eder, bulununca porta bu hızla bağlanır; sonuç baudDetected ile bildirilir"""
+        if '://' in port_name:
+            # Sanal portlar hızdan bağımsızdır
+            return self._connect_port(port_key, port_name, 115200)
+        if self._is_port_connected(port_key):
+            self._disconnect_port(port_key)
+        log_ports.info('🔎 %s için baud rate aranıyor...', port_name)
+        return self.baud_detector.detect_async(port_key, port_name)
 
-        # Kademe Boylam
-        _bytes = self.float_to_bytes(stage_longitude)
-        packet[42:46] = _bytes
+    def _on_baud_detected(self, port_key, port_name, baud_rate, scores):
+        if baud_rate:
+            self._connect_port(port_key, port_name, baud_rate)
+        self.baudDetected.emit(port_key, baud_rate)
 
-        # Jiroskop X
-        _bytes = self.float_to_bytes(gyroscope_x)
-        packet[46:50] = _bytes
+    def _watch_port_errors(self, port_key, port):
+        if hasattr(port, 'errorOccurred'):
+            port.errorOccurred.connect(lambda error: self._on_port_error(port_key, int(error)))
 
-        # Jiroskop Y
-        _bytes = self.float_to_bytes(gyroscope_y)
-        packet[50:54] = _bytes
+    @pyqtSlot(str, int)
+    def _on_port_error(self, port_key, error):
+        if self._is_port_connected(port_key):
+            self.supervisor.port_error(port_key, error)
 
-        # Jiroskop Z
-        _bytes = self.float_to_bytes(gyroscope_z)
-        packet[54:58] = _bytes
+    def _release_port(self, port_key):
+        """Kopan portu kapatır; yapılandırma, çerçeveleyici tamponu ve sayaçlar korunur"""
+        try:
+            if port_key == 'judge':
+                if self.judge_scheduler is not None:
+                    QMetaObject.invokeMethod(self.judge_scheduler, 'close_port', Qt.BlockingQueuedConnection)
+            elif not self._stop_ingest_worker(port_key):
+                port = getattr(self, f'{port_key}_port')
+                if port is not None and port.isOpen():
+                    port.close()
+        except Exception as e:
+            log_ports.error('❌ %s portu kapatılamadı: %s', port_key, e)
+        setattr(self, f'_{port_key}_connected', False)
+        getattr(self, f'{port_key}ConnectedChanged').emit()
+        getattr(self, f'{port_key}_status_changed').emit()
 
-        # İvme X
-        _bytes = self.float_to_bytes(acceleration_x)
-        packet[58:62] = _bytes
+    def _reconnect_port(self, port_key):
+        config = self._port_configs.get(port_key)
+        return config is not None and self._connect_port(port_key, *config[:2])
 
-        # İvme Y
-        _bytes = self.float_to_bytes(acceleration_y)
-        packet[62:66] = _bytes
+    def _on_port_added(self, entry):
+        """Yapılandırılmış portun adaptörü yeniden göründüğünde otomatik bağlanır.
 
-        # İvme Z
-        _bytes = self.float_to_bytes(acceleration_z)
-        packet[66:70] = _bytes
+        Seri numaralı cihazlar kimlikten eşleştirilir: ttyUSB0 iken ttyUSB1 olarak dönen cihazın yeni yolu
+        saklanır, eski yolda beliren başka bir cihaza bağlanılmaz. Seri numarasızlar yoldan eşleştirilir.
+        """
+        if not self.auto_reconnect:
+            return
+        path = entry['path']
+        found = self.port_discovery.device_key(path)
+        for port_key, (port_name, baud_rate, device) in list(self._port_configs.items()):
+            if self._is_port_connected(port_key):
+                continue
+            if (device != found) if device is not None else (port_name != path):
+                continue
+            if port_name != path:
+                log_ports.info('🔀 %s cihazı %s yolunda yeniden göründü', port_name, path)
+                self._port_configs[port_key] = (path, baud_rate, device)
+            log_ports.info('🔌 %s cihazı yeniden göründü, %s portuna otomatik bağlanılıyor', path, port_key)
+            self._connect_port(port_key, path, baud_rate)
 
-        # Açı
-        _bytes = self.float_to_bytes(angle)
-        packet[70:74] = _bytes
+    @pyqtSlot(bool)
+    def set_auto_reconnect(self, enabled):
+        """Yeniden takılan adaptöre ve hata sonrası otomatik bağlanmayı açar/kapatır"""
+        self.auto_reconnect = bool(enabled)
+        self.supervisor.enabled = self.auto_reconnect
 
-        # Durum (UINT8)
-        packet[74] = status & 0xFF
+    @pyqtSlot(result='QVariantMap')
+    def get_connection_stats(self):
+        """Süren kurtarmalar, port bazında toplam kesinti süreleri ve son kesintiler"""
+        return self.supervisor.stats()
 
-        # Checksum Hesaplama
-        checksum = sum(packet[4:75]) % 256
-        packet[75] = checksum
+    def _on_port_scan_finished(self, ports):
+        self.ports = ports
+        self.telemetry_ports_changed.emit()
+        if self._ports_requested:
+            # scan_ports() çağıranlar tam listeyi bekler; otomatik taramalar yalnızca portAdded/portRemoved yayar
+            self._ports_requested = False
+            self.portsChanged.emit(ports)  # QML için sinyal gönder
+        self.portScanFinished.emit(ports)
 
-        # Sabit kuyruk değerleri
-        packet[76] = 0x0D
-        packet[77] = 0x0A
+    def float_to_bytes(self, f):
+        """FLOAT32 değerini 4 byte'lık bir bayt dizisine dönüştürür."""
+        return struct.pack('<f', f)
 
-        return packet
+    def create_hyi_packet(self, packet_counter, altitude, rocket_gps_altitude,
+                          rocket_latitude, rocket_longitude, payload_gps_altitude,
+                          payload_latitude, payload_longitude, stage_gps_altitude,
+                          stage_latitude, stage_longitude, gyroscope_x, gyroscope_y,
+                          gyroscope_z, acceleration_x, acceleration_y, acceleration_z,
+                          angle, status):
+        """HYİ haberleşme protokolüne uygun 78 byte'lık bir paket oluşturur."""
+        values = (altitude, rocket_gps_altitude, rocket_latitude, rocket_longitude,
+                  payload_gps_altitude, payload_latitude, payload_longitude,
+                  stage_gps_altitude, stage_latitude, stage_longitude,
+                  gyroscope_x, gyroscope_y, gyroscope_z,
+                  acceleration_x, acceleration_y, acceleration_z, angle)
+        # Kodlayıcı tamponu yeniden kullanır, çağırana kopya döndürülür
+        return bytearray(self._hyi_encoder().encode(self.team_id, packet_counter, values, status))
 
     def parse_telemetry_packet(self, packet_data):
         """JSON formatında gelen telemetri verisini parse eder"""
         try:
-            import json
-            data = json.loads(packet_data)
-            
-            # Ana sistem formatı kontrolü (alt, accX, accY, accZ alanları varsa)
-            if 'header' in data and data.get('header') == 82 and 'rms_internal' in data and 'rms_external' in data:
-                kaynak = 'gorev_yuku'
-            elif 'alt' in data or 'accX' in data or 'accY' in data or 'accZ' in data:
-                kaynak = 'anakart'
-            else:
-                kaynak = 'gorev_yuku'
-            
-            # Gelen JSON verilerini al (ana sistem formatı)
-            if kaynak == 'anakart':
-                irtifa = data.get('alt', 0.0)
-                gps_irtifa = data.get('gpsAlt', irtifa)
-                enlem = data.get('lat', 0.0)
-                boylam = data.get('lng', 0.0)
-                gyro_x = data.get('eulX', 0.0)
-                gyro_y = data.get('eulY', 0.0)
-                gyro_z = data.get('eulZ', 0.0)
-                pitch = data.get('pitch', 0.0)
-                ivme_x = data.get('accX', 0.0)
-                ivme_y = data.get('accY', 0.0)
-                ivme_z = data.get('accZ', 0.0)
-                durum = data.get('state', 1)
-            else:
-                # Görev yükü formatı - yeni format: {"header":82,"lat":0.000000,"lng":0.000000,"alt":0.0,"rms_internal":0.0020,"rms_external":0.0000}
-                irtifa = data.get('alt', 0.0)  # İrtifa - 'alt' alanı
-                gps_irtifa = data.get('alt', irtifa)  # GPS irtifa - 'alt' alanı (aynı)
-                enlem = data.get('lat', 0.0)  # Enlem - 'lat' alanı
-                boylam = data.get('lng', 0.0)  # Boylam - 'lng' alanı
-                gyro_x = data.get('gyroX', 0.0)
-                gyro_y = data.get('gyroY', 0.0)
-                gyro_z = data.get('gyroZ', 0.0)
-                pitch = data.get('pitch', 0.0)
-                # İvmeler kaldırıldı - 0 değerleri kullanılıyor
-                ivme_x = 0.0
-                ivme_y = 0.0
-                ivme_z = 0.0
-                # RMS alanları eklendi
-                rms_internal = data.get('rms_internal', 'ovf')
-                rms_external = data.get('rms_external', 0.00)
-                durum = data.get('durum', 1)
-            
-            # Mevcut verileri al (eğer yoksa boş dict oluştur)
-            current_data = self.telemetry_data.get('fields', {})
-            
-            # Kaynak bazlı veri işleme
-            if kaynak == "anakart":
-                # Anakart verilerini ana roket verileri olarak kullan
-                current_data.update({
-                    'Takım ID': str(self.team_id),
-                    'Paket Sayacı': str(self.packet_counter if hasattr(self, 'packet_counter') else 0),
-                    'Durum': str(durum),
-                    'Açı': f"{pitch:.1f}°",
-                    'İrtifa': f"{irtifa:.1f} m",
-                    'Roket GPS İrtifa': f"{gps_irtifa:.1f} m",
-                    'Roket Enlem': f"{enlem:.6f}°",
-                    'Roket Boylam': f"{boylam:.6f}°",
-                    'Jiroskop X': f"{gyro_x:.2f}",
-                    'Jiroskop Y': f"{gyro_y:.2f}",
-                    'Jiroskop Z': f"{gyro_z:.2f}",
-                    'Ana Sistem İvme X': f"{ivme_x:.2f}",
-                    'Ana Sistem İvme Y': f"{ivme_y:.2f}",
-                    'Ana Sistem İvme Z': f"{ivme_z:.2f}"
-                })
-                
-            else:  # gorev_yuku veya bilinmeyen
-                # Görev yükü verilerini güncelle - ana sistem verilerini koru
-                current_data.update({
-                    'Takım ID': str(self.team_id),
-                    'Paket Sayacı': str(self.packet_counter if hasattr(self, 'packet_counter') else 0),
-                    'Durum': str(durum),
-                    'Görev Yükü GPS İrtifa': f"{gps_irtifa:.1f} m",  # Görev yükü GPS irtifa (alt)
-                    'Görev Yükü Enlem': f"{enlem:.6f}°",  # Görev yükü enlem (lat)
-                    'Görev Yükü Boylam': f"{boylam:.6f}°",  # Görev yükü boylam (lng)
-                    'RMS Internal': str(rms_internal),
-                    'RMS External': f"{rms_external:.2f}"
-                })
-                # Ana sistem verilerini koru (eğer varsa)
-                if 'Roket GPS İrtifa' not in current_data:
-                    current_data.update({
-                        'Roket GPS İrtifa': "0.0 m",
-                        'Roket Enlem': "0.000000°",
-                        'Roket Boylam': "0.000000°",
-                        'Jiroskop X': "0.00",
-                        'Jiroskop Y': "0.00",
-                        'Jiroskop Z': "0.00",
-                        'Ana Sistem İvme X': "0.00",
-                        'Ana Sistem İvme Y': "0.00",
-                        'Ana Sistem İvme Z': "0.00"
-                    })
-            
-            # Telemetri verilerini güncelle
-            self.telemetry_data = {'fields': current_data}
-            
-
-            
-            # Telemetri verisi değişikliğini sinyal et
-            self.telemetry_data_changed.emit()
-            
-            # Verileri sakla (hakem gönderimi timer ile yapılacak)
-            if kaynak == 'anakart':
-                self.ana_sistem_data = {
-                    'altitude': irtifa,
-                    'gps_altitude': gps_irtifa,
-                    'latitude': enlem,
-                    'longitude': boylam,
-                    'gyro_x': gyro_x,
-                    'gyro_y': gyro_y,
-                    'gyro_z': gyro_z,
-                    'acc_x': ivme_x,
-                    'acc_y': ivme_y,
-                    'acc_z': ivme_z,
-                    'angle': pitch,
-                    'status': durum
-                }
-            else:  # gorev_yuku
-                self.gorev_yuku_data = {
-                    'altitude': irtifa,
-                    'gps_altitude': gps_irtifa,
-                    'latitude': enlem,
-                    'longitude': boylam,
-                    'rms_internal': rms_internal,
-                    'rms_external': rms_external
-                }
-            
-            if kaynak == 'gorev_yuku':
-                print(f"[PYTHON] {kaynak} kaynaklı JSON telemetri verisi işlendi: İrtifa: {irtifa}, GPS: {gps_irtifa}, RMS: ({rms_internal}, {rms_external:.2f})")
-            else:
-                print(f"[PYTHON] {kaynak} kaynaklı JSON telemetri verisi işlendi: İrtifa: {irtifa}, İvme: ({ivme_x:.2f}, {ivme_y:.2f}, {ivme_z:.2f})")
-            
-        except json.JSONDecodeError as e:
-            print(f"[PYTHON] JSON parse hatası: {e}")
+            sample = decode_telemetry_packet(packet_data)
+            self.freshness.update(sample)
+            self.apply_telemetry_sample(sample)
+        except ValueError as e:
+            log_ingest.warning('JSON parse hatası: %s', e)
         except Exception as e:
-            print(f"[PYTHON] Telemetri parse hatası: {e}")
+            log_ingest.warning('Telemetri parse hatası: %s', e)
 
-    def _send_telemetry_to_judge(self, telemetry_data, kaynak):
-        """Telemetri verilerini hakem yer istasyonuna gönder"""
-        try:
-            if not self.judge_port or not self.judge_port.isOpen():
-                return
-                
-            # Paket sayacını artır
-            self.packet_counter = (self.packet_counter + 1) % 256
-            
-            # Telemetri verilerinden değerleri al
-            if kaynak == 'anakart':
-                # Ana sistem verileri - doğrudan eşleştirme
-                altitude = telemetry_data.get('alt', 0.0)  # Ana paket irtifa
-                rocket_gps_altitude = telemetry_data.get('gpsAlt', 0.0)  # Roket GPS İrtifa
-                rocket_latitude = telemetry_data.get('lat', 0.0)  # Roket Enlem
-                rocket_longitude = telemetry_data.get('lng', 0.0)  # Roket Boylam
-                gyroscope_x = telemetry_data.get('eulX', 0.0)  # Jiroskop X
-                gyroscope_y = telemetry_data.get('eulY', 0.0)  # Jiroskop Y
-                gyroscope_z = telemetry_data.get('eulZ', 0.0)  # Jiroskop Z
-                acceleration_x = telemetry_data.get('accX', 0.0)  # İvme X
-                acceleration_y = telemetry_data.get('accY', 0.0)  # İvme Y
-                acceleration_z = telemetry_data.get('accZ', 0.0)  # İvme Z
-                angle = telemetry_data.get('pitch', 0.0)  # Açı
-                status = telemetry_data.get('state', 0)  # Durum
-                
-                # Görev yükü verileri için varsayılan değerler (0)
-                payload_gps_altitude = 0.0
-                payload_latitude = 0.0
-                payload_longitude = 0.0
-                
-            else:
-                # Görev yükü verileri - yeni format: {"header":82,"lat":0.000000,"lng":0.000000,"alt":0.0,"rms_internal":0.0020,"rms_external":0.0000}
-                altitude = telemetry_data.get('alt', 0.0)  # Ana paket irtifa
-                payload_gps_altitude = telemetry_data.get('alt', 0.0)  # Görev Yükü GPS İrtifa
-                payload_latitude = telemetry_data.get('lat', 0.0)  # Görev Yükü Enlem
-                payload_longitude = telemetry_data.get('lng', 0.0)  # Görev Yükü Boylam
-                gyroscope_x = telemetry_data.get('gyroX', 0.0)  # Jiroskop X
-                gyroscope_y = telemetry_data.get('gyroY', 0.0)  # Jiroskop Y
-                gyroscope_z = telemetry_data.get('gyroZ', 0.0)  # Jiroskop Z
-                angle = telemetry_data.get('pitch', 0.0)  # Açı
-                status = telemetry_data.get('durum', 0)  # Durum
-                
-                # RMS alanları eklendi
-                rms_internal = telemetry_data.get('rms_internal', 'ovf')  # RMS Internal
-                rms_external = telemetry_data.get('rms_external', 0.00)  # RMS External
-                
-                # İvmeler kaldırıldı - 0 değerleri kullanılıyor
-                acceleration_x = 0.0  # İvme X (kaldırıldı)
-                acceleration_y = 0.0  # İvme Y (kaldırıldı)
-                acceleration_z = 0.0  # İvme Z (kaldırıldı)
-                
-                # Ana sistem verileri için varsayılan değerler (0)
-                rocket_gps_altitude = 0.0
-                rocket_latitude = 0.0
-                rocket_longitude = 0.0
-            
-            # Kademe verileri için 0 değerleri (kademe yok)
-            stage_gps_altitude = 0.0
-            stage_latitude = 0.0
-            stage_longitude = 0.0
-            
-            # HYI paketi oluştur - Ana sistem ve görev yükü ayrı veriler
-            packet = self.create_hyi_packet(
-                self.packet_counter,
-                altitude,  # Ana paket irtifa
-                rocket_gps_altitude,  # Roket GPS İrtifa (ana sistem)
-                rocket_latitude,  # Roket Enlem (ana sistem)
-                rocket_longitude,  # Roket Boylam (ana sistem)
-                payload_gps_altitude,  # Görev Yükü GPS İrtifa (ayrı)
-                payload_latitude,  # Görev Yükü Enlem (ayrı)
-                payload_longitude,  # Görev Yükü Boylam (ayrı)
-                stage_gps_altitude,  # Kademe GPS İrtifa (0)
-                stage_latitude,  # Kademe Enlem (0)
-                stage_longitude,  # Kademe Boylam (0)
-                gyroscope_x,  # Jiroskop X
-                gyroscope_y,  # Jiroskop Y
-                gyroscope_z,  # Jiroskop Z
-                acceleration_x,  # İvme X
-                acceleration_y,  # İvme Y
-                acceleration_z,  # İvme Z
-                angle,  # Açı
-                status  # Durum
-            )
-            
-            # Paketi hakem portuna gönder
-            self.judge_port.write(packet)
-            print(f"[PYTHON] Hakem yer istasyonuna telemetri verisi gönderildi (Paket: {self.packet_counter}, Kaynak: {kaynak})")
-            if kaynak == 'gorev_yuku':
-                print(f"[PYTHON] Görev Yükü Verisi: Alt={altitude}, GPS={payload_gps_altitude}, Lat={payload_latitude}, Lng={payload_longitude}")
-            else:
-                print(f"[PYTHON] Ana Sistem Verisi: Alt={altitude}, GPSAlt={rocket_gps_altitude}, Lat={rocket_latitude}, Lng={rocket_longitude}")
-            
-        except Exception as e:
-            print(f"[PYTHON] Hakem telemetri gönderme hatası: {e}")
+    def apply_telemetry_sample(self, sample, emit=True):
+        """Çözülmüş örneği kaynağının son örneği yapar; görüntü değerleri ilk okumada üretilir"""
+        if sample.kaynak == 'anakart':
+            self.ana_sistem_sample = sample
+            log_ingest.debug('%s kaynaklı telemetri verisi işlendi: İrtifa: %s, İvme: (%.2f, %.2f, %.2f)',
+                             sample.kaynak, sample.altitude, sample.acc_x, sample.acc_y, sample.acc_z)
+        else:  # gorev_yuku
+            self.gorev_yuku_sample = sample
+            log_ingest.debug('%s kaynaklı telemetri verisi işlendi: İrtifa: %s, GPS: %s, RMS: (%s, %.2f)',
+                             sample.kaynak, sample.altitude, sample.gps_altitude, sample.rms_internal, sample.rms_external)
+        self._display_fields = None
+        self.history.append(sample)
+        self.tracks[sample.kaynak].append(float(sample.latitude), float(sample.longitude),
+                                          float(sample.altitude), sample.received_at)
+
+        # Arayüz bir sonraki yenileme tikinde güncellenir
+        if emit:
+            self.ui_clock.mark_dirty()
+
+    def _build_display_fields(self):
+        """Tablo alanlarını son örneklerin (önbellekli) görüntü değerlerinden birleştirir"""
+        ana = self.ana_sistem_sample
+        gorev = self.gorev_yuku_sample
+        fields = {}
+        if ana is not None:
+            fields.update(ana.display_fields())
+        elif gorev is not None:
+            fields.update(MAIN_SYSTEM_PLACEHOLDER_FIELDS)
+        if gorev is not None:
+            fields.update(gorev.display_fields())
+        if ana is not None or gorev is not None:
+            # Durum en son gelen örnekten alınır
+            latest = max((x for x in (ana, gorev) if x is not None), key=lambda x: x.received_at)
+            fields['Durum'] = str(latest.status)
+            fields['Takım ID'] = str(self.team_id)
+            fields['Paket Sayacı'] = str(self.packet_counter)
+        return fields
+
+    @property
+    def telemetry_data(self):
+        if self._display_fields is None:
+            self._display_fields = self._build_display_fields()
+        return {'fields': self._display_fields}
+
+    @pyqtSlot(str, list)
+    def _on_ingest_samples(self, port_key, samples):
+        """İşçi thread'den gelen örnek grubunu işler; arayüz bir sonraki tikte bir kez güncellenir"""
+        if not samples:
+            return
+        for sample in samples:
+            try:
+                self.apply_telemetry_sample(sample, emit=False)
+            except Exception as e:
+                log_ingest.warning('Telemetri örnek işleme hatası (%s): %s', port_key, e)
+        self.ui_clock.mark_dirty(len(samples))
+
+    def _refresh_ui(self):
+        """Tablo modelini ve harita konumlarını son örneklerle günceller, telemetry_data_changed yayar"""
+        samples = {'anakart': self.ana_sistem_sample, 'gorev_yuku': self.gorev_yuku_sample}
+        self.table_model.update_fields(self.telemetry_data['fields'], samples)
+        for kaynak, signal in (('anakart', self.mainPositionChanged), ('gorev_yuku', self.payloadPositionChanged)):
+            sample = samples[kaynak]
+            if sample is None:
+                continue
+            position = (sample.latitude, sample.longitude)
+            if position != self._shown_positions[kaynak]:
+                self._shown_positions[kaynak] = position
+                signal.emit(float(sample.latitude), float(sample.longitude))
+                self.map_bridge.update(kaynak, sample.latitude, sample.longitude, sample.altitude)
+        self.telemetry_data_changed.emit()
+
+    @pyqtSlot(int, result=bool)
+    def set_ui_refresh_rate(self, rate_hz):
+        """Arayüz yenileme hızını ayarlar (1-60 Hz)"""
+        if rate_hz < 1 or rate_hz > 60:
+            log_ui.error('❌ Geçersiz arayüz yenileme hızı: %sHz (1-60 Hz arası olmalı)', rate_hz)
+            return False
+        self.ui_clock.set_rate(rate_hz)
+        log_ui.info('Arayüz yenileme hızı: %sHz', rate_hz)
+        return True
+
+    @pyqtSlot(bool)
+    def set_ui_adaptive_refresh(self, enabled):
+        """Olay döngüsü geciktiğinde yenileme hızının otomatik düşürülmesini açar/kapatır"""
+        self.ui_clock.adaptive = bool(enabled)
+        if not enabled:
+            self.ui_clock.set_rate(self.ui_clock.target_hz)
+
+    @pyqtSlot(result='QVariantMap')
+    def get_ui_refresh_stats(self):
+        return self.ui_clock.stats()
+
+    @pyqtSlot(bool)
+    def set_table_extra_columns(self, enabled):
+        """Telemetri tablosunda Min/Max/Hız sütunlarını açar/kapatır"""
+        self.table_model.extraColumns = enabled
 
     @pyqtSlot(str, int, result=bool)
     def connect_telemetry(self, port_name, baud_rate):
-        print(f"[PYTHON] connect_telemetry çağrıldı: {port_name}, {baud_rate}")
+        log_ports.info('connect_telemetry çağrıldı: %s, %s', port_name, baud_rate)
         
         # Port adı kontrolü
         if not port_name or port_name == "" or port_name == "Port bulunamadı":
-            print("[PYTHON] ❌ Geçersiz port adı!")
+            log_ports.error('❌ Geçersiz port adı!')
             return False
             
+        if baud_rate == AUTO_BAUD:
+            return self._detect_baud('telemetry', port_name)
+
         # Baud rate kontrolü
-        if baud_rate not in [9600, 19200, 38400, 57600, 115200]:
-            print(f"[PYTHON] ❌ Geçersiz baud rate: {baud_rate}")
+        if not is_valid_baud_rate(baud_rate):
+            log_ports.error('❌ Geçersiz baud rate: %s', baud_rate)
             return False
         
         try:
             # Mevcut bağlantıyı kapat
+            self._stop_ingest_worker('telemetry')
             if self.telemetry_port and self.telemetry_port.isOpen():
                 self.telemetry_port.close()
-                print(f"[PYTHON] Mevcut telemetri bağlantısı kapatıldı")
+                log_ports.info('Mevcut telemetri bağlantısı kapatıldı')
             
                 self.telemetry_port = None
-            
-            # Yeni port oluştur
-            self.telemetry_port = QSerialPort(port_name)
-            
-            # Port ayarları
-            self.telemetry_port.setBaudRate(baud_rate)
-            self.telemetry_port.setDataBits(QSerialPort.Data8)
-            self.telemetry_port.setParity(QSerialPort.NoParity)
-            self.telemetry_port.setStopBits(QSerialPort.OneStop)
-            self.telemetry_port.setFlowControl(QSerialPort.NoFlowControl)
-            self.telemetry_port.setReadBufferSize(1024)
-            
-            # Portu aç
-            connected = self.telemetry_port.open(QSerialPort.ReadWrite)
+            if not self.supervisor.is_recovering('telemetry'):
+                # Kopan bağlantı yeniden açılırken yarım satır ve sayaçlar korunur
+                self._framers['telemetry'].reset()
+
+            if self.ingest_worker_mode:
+                # Port kendi thread'inde açılır ve okunur
+                connected = self._start_ingest_worker('telemetry', port_name, baud_rate)
+            else:
+                # Yeni port oluştur (replay:// gibi sanal portlar dahil) ve ayarla
+                self.telemetry_port = open_serial_port(port_name, baud_rate)
+                
+                # Portu aç
+                connected = self.telemetry_port.open(QSerialPort.ReadWrite)
+                if connected:
+                    self.telemetry_port.readyRead.connect(self._read_telemetry_data)
+                    self._watch_port_errors('telemetry', self.telemetry_port)
             
             if connected:
-                print(f"[PYTHON] ✅ Telemetri portu başarıyla açıldı: {port_name} Baud: {baud_rate}")
+                log_ports.info('✅ Telemetri portu başarıyla açıldı: %s Baud: %s', port_name, baud_rate)
                 self._telemetry_connected = True
                 self._telemetry_port_name = port_name
-                self.telemetry_port.readyRead.connect(self._read_telemetry_data)
+                self._remember_port('telemetry', port_name, baud_rate)
+                self.supervisor.connected('telemetry')
                 self.telemetryConnectedChanged.emit()
                 self.telemetry_status_changed.emit()
                 return True
             else:
-                error = self.telemetry_port.error()
-                print(f"[PYTHON] ❌ Telemetri portu açılamadı: {port_name}")
-                print(f"[PYTHON] Hata kodu: {error}")
+                log_ports.error('❌ Telemetri portu açılamadı: %s', port_name)
+                if self.telemetry_port:
+                    log_ports.error('Hata kodu: %s', self.telemetry_port.error())
                 return False
                 
         except Exception as e:
-            print(f"[PYTHON] ❌ Telemetri bağlantı hatası: {e}")
+            log_ports.error('❌ Telemetri bağlantı hatası: %s', e)
             return False
 
     @pyqtSlot()
     def disconnect_telemetry(self):
-        print("[PYTHON] disconnect_telemetry çağrıldı")
+        log_ports.info('disconnect_telemetry çağrıldı')
         try:
-            if self.telemetry_port and self.telemetry_port.isOpen():
+            if self._stop_ingest_worker('telemetry'):
+                log_ports.info("✅ Telemetri işçi thread'i ve portu kapatıldı")
+            elif self.telemetry_port and self.telemetry_port.isOpen():
                 self.telemetry_port.close()
-                print("[PYTHON] ✅ Telemetri portu kapatıldı")
+                log_ports.info('✅ Telemetri portu kapatıldı')
             else:
-                print("[PYTHON] ⚠️ Telemetri portu zaten kapalı")
+                log_ports.warning('⚠️ Telemetri portu zaten kapalı')
             
             self._telemetry_connected = False
             self._telemetry_port_name = ""
+            self._port_configs.pop('telemetry', None)
+            self.supervisor.cancel('telemetry')
             self.telemetryConnectedChanged.emit()
             self.telemetry_status_changed.emit()
             
         except Exception as e:
-            print(f"[PYTHON] ❌ Telemetri bağlantı kesme hatası: {e}")
+            log_ports.error('❌ Telemetri bağlantı kesme hatası: %s', e)
 
     @pyqtSlot(str, int, result=bool)
     def connect_telemetry2(self, port_name, baud_rate):
-        print(f"[PYTHON] connect_telemetry2 çağrıldı: {port_name}, {baud_rate}")
+        log_ports.info('connect_telemetry2 çağrıldı: %s, %s', port_name, baud_rate)
         
         # Port adı kontrolü
         if not port_name or port_name == "" or port_name == "Port bulunamadı":
-            print("[PYTHON] ❌ Geçersiz port adı!")
+            log_ports.error('❌ Geçersiz port adı!')
             return False
             
+        if baud_rate == AUTO_BAUD:
+            return self._detect_baud('telemetry2', port_name)
+
         # Baud rate kontrolü
-        if baud_rate not in [9600, 19200, 38400, 57600, 115200]:
-            print(f"[PYTHON] ❌ Geçersiz baud rate: {baud_rate}")
+        if not is_valid_baud_rate(baud_rate):
+            log_ports.error('❌ Geçersiz baud rate: %s', baud_rate)
             return False
         
         try:
             # Mevcut bağlantıyı kapat
+            self._stop_ingest_worker('telemetry2')
             if self.telemetry2_port and self.telemetry2_port.isOpen():
                 self.telemetry2_port.close()
-                print(f"[PYTHON] Mevcut telemetri2 bağlantısı kapatıldı")
+                log_ports.info('Mevcut telemetri2 bağlantısı kapatıldı')
             
                 self.telemetry2_port = None
-            
-            # Yeni port oluştur
-            self.telemetry2_port = QSerialPort(port_name)
-            
-            # Port ayarları
-            self.telemetry2_port.setBaudRate(baud_rate)
-            self.telemetry2_port.setDataBits(QSerialPort.Data8)
-            self.telemetry2_port.setParity(QSerialPort.NoParity)
-            self.telemetry2_port.setStopBits(QSerialPort.OneStop)
-            self.telemetry2_port.setFlowControl(QSerialPort.NoFlowControl)
-            self.telemetry2_port.setReadBufferSize(1024)
-            
-            # Portu aç
-            connected = self.telemetry2_port.open(QSerialPort.ReadWrite)
+            if not self.supervisor.is_recovering('telemetry2'):
+                # Kopan bağlantı yeniden açılırken yarım satır ve sayaçlar korunur
+                self._framers['telemetry2'].reset()
+
+            if self.ingest_worker_mode:
+                # Port kendi thread'inde açılır ve okunur
+                connected = self._start_ingest_worker('telemetry2', port_name, baud_rate)
+            else:
+                # Yeni port oluştur (replay:// gibi sanal portlar dahil) ve ayarla
+                self.telemetry2_port = open_serial_port(port_name, baud_rate)
+                
+                # Portu aç
+                connected = self.telemetry2_port.open(QSerialPort.ReadWrite)
+                if connected:
+                    self.telemetry2_port.readyRead.connect(self._read_telemetry2_data)
+                    self._watch_port_errors('telemetry2', self.telemetry2_port)
             
             if connected:
-                print(f"[PYTHON] ✅ Telemetri2 portu başarıyla açıldı: {port_name} Baud: {baud_rate}")
+                log_ports.info('✅ Telemetri2 portu başarıyla açıldı: %s Baud: %s', port_name, baud_rate)
                 self._telemetry2_connected = True
                 self._telemetry2_port_name = port_name
-                self.telemetry2_port.readyRead.connect(self._read_telemetry2_data)
+                self._remember_port('telemetry2', port_name, baud_rate)
+                self.supervisor.connected('telemetry2')
                 self.telemetry2ConnectedChanged.emit()
                 self.telemetry2_status_changed.emit()
                 return True
             else:
-                error = self.telemetry2_port.error()
-                print(f"[PYTHON] ❌ Telemetri2 portu açılamadı: {port_name}")
-                print(f"[PYTHON] Hata kodu: {error}")
+                log_ports.error('❌ Telemetri2 portu açılamadı: %s', port_name)
+                if self.telemetry2_port:
+                    log_ports.error('Hata kodu: %s', self.telemetry2_port.error())
                 return False
                 
         except Exception as e:
-            print(f"[PYTHON] ❌ Telemetri2 bağlantı hatası: {e}")
+            log_ports.error('❌ Telemetri2 bağlantı hatası: %s', e)
             return False
 
     @pyqtSlot()
     def disconnect_telemetry2(self):
-        print("[PYTHON] disconnect_telemetry2 çağrıldı")
+        log_ports.info('disconnect_telemetry2 çağrıldı')
         try:
-            if self.telemetry2_port and self.telemetry2_port.isOpen():
+            if self._stop_ingest_worker('telemetry2'):
+                log_ports.info("✅ Telemetri2 işçi thread'i ve portu kapatıldı")
+            elif self.telemetry2_port and self.telemetry2_port.isOpen():
                 self.telemetry2_port.close()
-                print("[PYTHON] ✅ Telemetri2 portu kapatıldı")
+                log_ports.info('✅ Telemetri2 portu kapatıldı')
             else:
-                print("[PYTHON] ⚠️ Telemetri2 portu zaten kapalı")
+                log_ports.warning('⚠️ Telemetri2 portu zaten kapalı')
             
             self._telemetry2_connected = False
             self._telemetry2_port_name = ""
+            self._port_configs.pop('telemetry2', None)
+            self.supervisor.cancel('telemetry2')
             self.telemetry2ConnectedChanged.emit()
             self.telemetry2_status_changed.emit()
             
         except Exception as e:
-            print(f"[PYTHON] ❌ Telemetri2 bağlantı kesme hatası: {e}")
+            log_ports.error('❌ Telemetri2 bağlantı kesme hatası: %s', e)
+
+    @pyqtSlot(str, str, result=bool)
+    def set_port_schema(self, port_key, schema):
+        """Porta şema bağlar: 'anakart', 'gorev_yuku', 'auto' veya kayıtlı özel şema (sonraki bağlantıda geçerli)"""
+        if port_key not in self._decoders:
+            log_ports.error('❌ Bilinmeyen port: %s', port_key)
+            return False
+        try:
+            self._decoders[port_key] = create_telemetry_decoder(schema)
+        except ValueError as e:
+            log_ports.error('❌ %s', e)
+            return False
+        log_ports.info('%s portu şeması: %s', port_key, schema)
+        return True
+
+    @pyqtSlot(result='QVariantMap')
+    def get_decoder_stats(self):
+        """Port bazında şema, JSON çözücü ve kaynak başına ortalama çözme süresi"""
+        return {port_key: decoder.snapshot() for port_key, decoder in self._decoders.items()}
+
+    @pyqtSlot(bool)
+    def set_ingest_worker_mode(self, enabled):
+        """Telemetri portlarının ayrı thread'de okunmasını açar/kapatır (sonraki bağlantıda geçerli)"""
+        self.ingest_worker_mode = bool(enabled)
+        log_ports.info('İşçi thread modu: %s', 'açık' if self.ingest_worker_mode else 'kapalı')
+
+    @pyqtSlot(result=bool)
+    def get_ingest_worker_mode(self):
+        return self.ingest_worker_mode
+
+    def _start_ingest_worker(self, port_key, port_name, baud_rate):
+        """Port için işçi thread'ini başlatır ve portun açılmasını bekler"""
+        thread = QThread()
+        worker = IngestWorker(port_key, port_name, baud_rate, self._framers[port_key], self._decoders[port_key],
+                              recorder=self.recorder, freshness=self.freshness)
+        worker.moveToThread(thread)
+        worker.samples_ready.connect(self._on_ingest_samples)
+        worker.port_error.connect(self._on_port_error)
+        thread.start()
+        opened = QMetaObject.invokeMethod(worker, 'open_port', Qt.BlockingQueuedConnection,
+                                          Q_RETURN_ARG(bool))
+        if not opened:
+            thread.quit()
+            thread.wait()
+            return False
+        self._ingest_workers[port_key] = (thread, worker)
+        return True
+
+    def _stop_ingest_worker(self, port_key):
+        """İşçi thread'ini durdurur; işçi yoksa False döner"""
+        entry = self._ingest_workers.pop(port_key, None)
+        if entry is None:
+            return False
+        thread, worker = entry
+        QMetaObject.invokeMethod(worker, 'close_port', Qt.BlockingQueuedConnection)
+        thread.quit()
+        thread.wait()
+        return True
+
+    def _drain_port(self, port, framer, decoder, kaynak_adi, port_key):
+        """Porttaki tüm baytları okur ve tamamlanan her satırı porta bağlı şemayla çözüp işler"""
+        data = port.readAll().data()
+        if not data:
+            return
+        for line in framer.feed(data):
+            self.recorder.record(RECORD_INBOUND, port_key, line)
+            log_ingest.debug('Veri alındı (%s): %s', kaynak_adi, line)
+            try:
+                sample = decoder.decode(line)
+            except Exception as e:
+                # Bozuk JSON veya binary veri - atla
+                framer.decode_failed()
+                log_ingest.warning('Telemetri çözme hatası (%s): %s', kaynak_adi, e)
+                continue
+            self.freshness.update(sample)
+            self.apply_telemetry_sample(sample)
 
     def _read_telemetry_data(self):
         try:
             if self.telemetry_port and self.telemetry_port.isOpen():
-                if self.telemetry_port.canReadLine():
-                    json_data = self.telemetry_port.readLine().data().decode('utf-8').strip()
-                    if json_data:
-                        print(f"[PYTHON] JSON verisi alındı (ana sistem): {json_data}")
-                        self.parse_telemetry_packet(json_data)
-                    else:
-                        print("[PYTHON] Boş veri alındı (ana sistem)")
+                self._drain_port(self.telemetry_port, self._framers['telemetry'], self._decoders['telemetry'], 'ana sistem', 'telemetry')
         except Exception as e:
-            print(f"[PYTHON] Telemetri okuma hatası (ana sistem): {e}")
+            log_ingest.error('Telemetri okuma hatası (ana sistem): %s', e)
 
     def _read_telemetry2_data(self):
         try:
             if self.telemetry2_port and self.telemetry2_port.isOpen():
-                if self.telemetry2_port.canReadLine():
-                    try:
-                        # Önce UTF-8 olarak decode etmeye çalış
-                        json_data = self.telemetry2_port.readLine().data().decode('utf-8').strip()
-                        if json_data:
-                            print(f"[PYTHON] JSON verisi alındı (görev yükü): {json_data}")
-                            self.parse_telemetry_packet(json_data)
-                        else:
-                            print("[PYTHON] Boş veri alındı (görev yükü)")
-                    except UnicodeDecodeError:
-                        # UTF-8 decode hatası - binary veri olabilir, atla
-                        raw_data = self.telemetry2_port.readLine().data()
-                        print(f"[PYTHON] Binary veri alındı (görev yükü), atlanıyor: {raw_data.hex()}")
-                        return
+                self._drain_port(self.telemetry2_port, self._framers['telemetry2'], self._decoders['telemetry2'], 'görev yükü', 'telemetry2')
         except Exception as e:
-            print(f"[PYTHON] Telemetri2 okuma hatası (görev yükü): {e}")
+            log_ingest.error('Telemetri2 okuma hatası (görev yükü): %s', e)
+
+    @pyqtSlot(str, result='QVariantMap')
+    def get_port_stats(self, port_key):
+        """Port sayaçlarını döndürür ('telemetry' veya 'telemetry2')"""
+        framer = self._framers.get(port_key)
+        if framer is None:
+            return {}
+        return framer.stats()
+
+    @pyqtSlot(str, str, result=bool)
+    def start_replay(self, port_key, source):
+        """Kaydedilmiş oturumu veya satır günlüğünü telemetri portuna bağlar (ör. 'flight_logs?speed=max')"""
+        url = source if source.startswith('replay://') else 'replay://' + source
+        if 'port=' not in url:
+            url += ('&' if '?' in url else '?') + 'port=' + port_key
+        if port_key == 'telemetry':
+            return self.connect_telemetry(url, 115200)
+        if port_key == 'telemetry2':
+            return self.connect_telemetry2(url, 115200)
+        return False
+
+    def _virtual_port(self, port_key, port_type=ReplaySerialPort):
+        """Porta bağlı sanal port nesnesini döndürür (doğrudan veya işçi modunda); tür uymazsa None"""
+        entry = self._ingest_workers.get(port_key)
+        port = entry[1].port if entry else getattr(self, f'{port_key}_port', None)
+        return port if isinstance(port, port_type) else None
+
+    def _invoke_replay(self, port_key, method, *args):
+        port = self._virtual_port(port_key)
+        if port is None:
+            return False
+        # İşçi modunda replay nesnesi işçi thread'ine aittir; çağrı o thread'de çalışır
+        QMetaObject.invokeMethod(port, method, Qt.QueuedConnection, *args)
+        return True
+
+    @pyqtSlot(str, result=bool)
+    def replay_pause(self, port_key):
+        return self._invoke_replay(port_key, 'pause')
+
+    @pyqtSlot(str, result=bool)
+    def replay_resume(self, port_key):
+        return self._invoke_replay(port_key, 'resume')
+
+    @pyqtSlot(str, float, result=bool)
+    def replay_seek(self, port_key, seconds):
+        return self._invoke_replay(port_key, 'seek', Q_ARG(float, seconds))
+
+    @pyqtSlot(str, str, result=bool)
+    def replay_set_speed(self, port_key, speed):
+        """Replay hızı: '1' gerçek zamanlı, '4' dört kat, 'max' en yüksek hız"""
+        return self._invoke_replay(port_key, 'set_speed', Q_ARG(str, speed))
+
+    @pyqtSlot(str, result='QVariantMap')
+    def get_replay_stats(self, port_key):
+        """Replay konumu ve max modda uçtan uca kayıt/s hızı"""
+        port = self._virtual_port(port_key)
+        return port.stats() if port is not None else {}
+
+    @pyqtSlot(str, result=bool)
+    def start_simulation(self, options):
+        """Üç portu da süreç içi simülatöre bağlar (ör. 'rate=200&noise=1&corrupt=0.01&format=binary')"""
+        query = f'?{options}' if options else ''
+        connected = self.connect_telemetry(f'sim://anakart{query}', 115200)
+        connected = self.connect_telemetry2(f'sim://gorev_yuku{query}', 115200) and connected
+        return self.connect_judge('sim://judge', 115200) and connected
+
+    @pyqtSlot(result='QVariantMap')
+    def get_simulation_stats(self):
+        """Simülatör portlarının üretim ve hakem yakalama sayaçları"""
+        stats = {}
+        for port_key in ('telemetry', 'telemetry2', 'judge'):
+            port = self._virtual_port(port_key, SimulatedSerialPort)
+            if port is not None:
+                stats[port_key] = port.stats()
+        return stats
 
     @pyqtSlot(str, int, result=bool)
     def connect_judge(self, port_name, baud_rate):
-        print(f"[PYTHON] connect_judge çağrıldı: {port_name}, {baud_rate}")
+        log_ports.info('connect_judge çağrıldı: %s, %s', port_name, baud_rate)
         
         # Takım ID kontrolü - hakem bağlantısı için takım ID'nin ayarlanmış olması gerekir
         if self.team_id < 1 or self.team_id > 255:
-            print("[PYTHON] ❌ Takım ID ayarlanmamış! Hakem bağlantısı için takım ID 1-255 arasında olmalıdır.")
+            log_ports.error('❌ Takım ID ayarlanmamış! Hakem bağlantısı için takım ID 1-255 arasında olmalıdır.')
             return False
         
         # Port adı kontrolü
         if not port_name or port_name == "" or port_name == "Port bulunamadı":
-            print("[PYTHON] ❌ Geçersiz port adı!")
+            log_ports.error('❌ Geçersiz port adı!')
             return False
             
         # Baud rate kontrolü
-        if baud_rate not in [9600, 19200, 38400, 57600, 115200]:
-            print(f"[PYTHON] ❌ Geçersiz baud rate: {baud_rate}")
+        if not is_valid_baud_rate(baud_rate):
+            log_ports.error('❌ Geçersiz baud rate: %s', baud_rate)
             return False
         
         try:
-            # Mevcut bağlantıyı kapat
-            if self.judge_port and self.judge_port.isOpen():
-                self.judge_port.close()
-                print(f"[PYTHON] Mevcut hakem bağlantısı kapatıldı")
-            
-                self.judge_port = None
-            
-            # Yeni port oluştur
-            self.judge_port = QSerialPort(port_name)
-            
-            # Port ayarları
-            self.judge_port.setBaudRate(baud_rate)
-            self.judge_port.setDataBits(QSerialPort.Data8)
-            self.judge_port.setParity(QSerialPort.NoParity)
-            self.judge_port.setStopBits(QSerialPort.OneStop)
-            self.judge_port.setFlowControl(QSerialPort.NoFlowControl)
-            self.judge_port.setReadBufferSize(1024)
-            
-            # Portu aç
-            connected = self.judge_port.open(QSerialPort.ReadWrite)
+            # Port zamanlayıcı thread'inde oluşturulup açılır; mevcut bağlantı önce kapatılır
+            self._start_judge_timer()
+            self.judge_port = None
+            connected = QMetaObject.invokeMethod(self.judge_scheduler, 'open_port', Qt.BlockingQueuedConnection,
+                                                 Q_RETURN_ARG(bool), Q_ARG(str, port_name), Q_ARG(int, baud_rate))
+            self.judge_port = self.judge_scheduler.port
             
             if connected:
-                print(f"[PYTHON] ✅ Hakem portu başarıyla açıldı: {port_name} Baud: {baud_rate}")
+                log_ports.info('✅ Hakem portu başarıyla açıldı: %s Baud: %s', port_name, baud_rate)
                 self._judge_connected = True
                 self._judge_port_name = port_name
+                self._remember_port('judge', port_name, baud_rate)
+                self.supervisor.connected('judge')
                 self.judgeConnectedChanged.emit()
                 self.judge_status_changed.emit()
                 return True
             else:
                 error = self.judge_port.error()
-                print(f"[PYTHON] ❌ Hakem portu açılamadı: {port_name}")
-                print(f"[PYTHON] Hata kodu: {error}")
+                log_ports.error('❌ Hakem portu açılamadı: %s', port_name)
+                log_ports.error('Hata kodu: %s', error)
                 return False
                 
         except Exception as e:
-            print(f"[PYTHON] ❌ Hakem bağlantı hatası: {e}")
+            log_ports.error('❌ Hakem bağlantı hatası: %s', e)
             return False
 
     @pyqtSlot()
     def disconnect_judge(self):
-        print("[PYTHON] disconnect_judge çağrıldı")
+        log_ports.info('disconnect_judge çağrıldı')
         try:
             if self.judge_port and self.judge_port.isOpen():
-                self.judge_port.close()
-                print("[PYTHON] ✅ Hakem portu kapatıldı")
+                QMetaObject.invokeMethod(self.judge_scheduler, 'close_port', Qt.BlockingQueuedConnection)
+                log_ports.info('✅ Hakem portu kapatıldı')
             else:
-                print("[PYTHON] ⚠️ Hakem portu zaten kapalı")
+                log_ports.warning('⚠️ Hakem portu zaten kapalı')
             
             self._judge_connected = False
             self._judge_port_name = ""
+            self._port_configs.pop('judge', None)
+            self.supervisor.cancel('judge')
             self.judgeConnectedChanged.emit()
             self.judge_status_changed.emit()
             
         except Exception as e:
-            print(f"[PYTHON] ❌ Hakem bağlantı kesme hatası: {e}")
+            log_ports.error('❌ Hakem bağlantı kesme hatası: %s', e)
+
+    @pyqtSlot(str, result=bool)
+    def set_stale_policy(self, policy):
+        """Eski kaynak verisi politikası: 'hold', 'dead_reckon' veya 'flag'"""
+        if policy not in FreshnessMerger.POLICIES:
+            log_judge.error('❌ Geçersiz eski veri politikası: %s', policy)
+            return False
+        self.freshness.policy = policy
+        return True
+
+    @pyqtSlot(float)
+    def set_stale_timeout(self, seconds):
+        """Bir kaynağın eski sayılacağı veri yaşı (s)"""
+        self.freshness.stale_after = max(0.0, seconds)
+
+    @pyqtSlot(result='QVariantMap')
+    def get_source_freshness(self):
+        """Kaynak bazında son örnek yaşı, eski olup olmadığı ve eski veriyle gönderilen paket sayısı"""
+        return self.freshness.snapshot()
+
+    @pyqtSlot(str, str, float, result=list)
+    def get_history(self, kaynak, channel, seconds):
+        """Kanalın son seconds saniyelik değerleri (seconds <= 0: tamponun tümü)"""
+        try:
+            ring = self.history[kaynak]
+            if seconds > 0:
+                return ring.values(channel, ring.count_since(time.monotonic() - seconds))
+            return ring.values(channel)
+        except KeyError:
+            log_ui.warning('⚠️ Bilinmeyen geçmiş kanalı: %s/%s', kaynak, channel)
+            return []
+
+    @pyqtSlot(result='QVariantMap')
+    def get_history_stats(self):
+        """Kaynak başına tampondaki örnek sayısı, toplam eklenen, kapasite ve bellek"""
+        return self.history.stats()
+
+    @pyqtSlot()
+    def shutdown(self):
+        """Hakem zamanlayıcısını ve işçi thread'lerini durdurur, uçuş kaydını kapatır"""
+        self.ui_clock.stop()
+        for port_key in list(self._ingest_workers):
+            self._stop_ingest_worker(port_key)
+        self._stop_judge_timer()
+        self.judge_port = None
+        if self.port_watcher is not None:
+            self.port_watcher.stop()
+        self.port_discovery.shutdown()
+        self.baud_detector.shutdown()
+        if self.tile_server is not None:
+            self.tile_server.stop()
+            self.tile_server.cache.store.close()
+            self.tile_server = None
+        self.recorder.stop()
+
+    @pyqtSlot(str, str, result=bool)
+    def set_log_level(self, category, level):
+        """Günlük kategorisinin seviyesini ayarlar (ingest, judge, ports, ui)"""
+        return telemetry_logging.set_level(category, level)
+
+    @pyqtSlot(bool)
+    def set_quiet_flight_mode(self, quiet):
+        """Sessiz uçuş modu: konsol çıktısı kapanır, yalnızca sayaçlar tutulur"""
+        telemetry_logging.set_quiet(quiet)
+
+    @pyqtSlot(result='QVariantMap')
+    def get_log_counters(self):
+        return telemetry_logging.snapshot()
+
+    @pyqtSlot(result=bool)
+    def start_recording(self):
+        """Uçuş kaydını yeni bir oturum dosyasıyla başlatır"""
+        try:
+            self.recorder.start()
+        except OSError as e:
+            log_ingest.error('❌ Uçuş kaydı başlatılamadı: %s', e)
+            return False
+        return True
+
+    @pyqtSlot()
+    def stop_recording(self):
+        self.recorder.stop()
+
+    @pyqtSlot(result='QVariantMap')
+    def get_recorder_stats(self):
+        return self.recorder.stats()
 
     @pyqtProperty('QVariantMap', notify=telemetry_data_changed)
     def telemetry_data_property(self):
@@ -1759,7 +5575,181 @@ class SerialManager(QObject):
 
 
 
+def run_tile_prefetch(config):
+    """--prefetch-tiles=güney,batı,kuzey,doğu [--tile-zooms=10-16] [--tile-store=] ile döşemeleri ve Leaflet'i indirir"""
+    store_path = config.tile_store
+    store = TileStore(store_path)
+    try:
+        prefetch_leaflet('map_assets')
+        downloaded, skipped, failed = prefetch_tiles(
+            store, config.prefetch_tiles, config.tile_zooms, template=config.tile_url,
+            progress=lambda done, total: done % 200 == 0 and log_ui.info('  %s/%s döşeme', done, total))
+    except Exception as e:
+        log_ui.error('❌ Önceden indirme başarısız: %s', e)
+        return 1
+    finally:
+        store.close()
+    log_ui.info('✅ %s: %s döşeme indirildi, %s zaten vardı, %s hatalı', store_path, downloaded, skipped, failed)
+    return 0 if not failed else 1
+
+def _int_option(low, high):
+    def parse(text):
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'tam sayı olmalı: {text!r}') from None
+        if not low <= value <= high:
+            raise argparse.ArgumentTypeError(f'{low}-{high} aralığında olmalı: {value}')
+        return value
+    return parse
+
+def _positive_float_option(text):
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'sayı olmalı: {text!r}') from None
+    if not value > 0 or not math.isfinite(value):
+        raise argparse.ArgumentTypeError(f'pozitif olmalı: {text}')
+    return value
+
+def _mapping_option(keys, values=None):
+    """anahtar:değer,anahtar:değer biçimini çözer; anahtarlar (ve verilmişse değerler) doğrulanır"""
+    def parse(text):
+        mapping = {}
+        for item in text.split(','):
+            key, _, value = (part.strip() for part in item.partition(':'))
+            if not key or not value:
+                raise argparse.ArgumentTypeError(f'anahtar:değer biçiminde olmalı: {item!r}')
+            if key not in keys:
+                raise argparse.ArgumentTypeError(f"bilinmeyen anahtar {key!r} (geçerli: {', '.join(keys)})")
+            if values is not None and value not in values():
+                raise argparse.ArgumentTypeError(f"bilinmeyen değer {value!r} (geçerli: {', '.join(values())})")
+            mapping[key] = value
+        return mapping
+    return parse
+
+def _bbox_option(text):
+    try:
+        south, west, north, east = (float(v) for v in text.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError('güney,batı,kuzey,doğu biçiminde olmalı') from None
+    if not (-85.0 <= south < north <= 85.0 and -180.0 <= west < east <= 180.0):
+        raise argparse.ArgumentTypeError(f'geçersiz sınırlar: {text}')
+    return south, west, north, east
+
+def _tile_url_option(text):
+    parts = urllib.parse.urlsplit(text)
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        raise argparse.ArgumentTypeError(f'http(s) adresi olmalı: {text!r}')
+    if not all(field in text for field in ('{z}', '{x}', '{y}')):
+        raise argparse.ArgumentTypeError(f'{{z}}, {{x}} ve {{y}} alanlarını içermeli: {text!r}')
+    return text
+
+def _zoom_range_option(text):
+    low, _, high = text.partition('-')
+    parse_zoom = _int_option(0, 19)
+    low = parse_zoom(low)
+    high = parse_zoom(high) if high else low
+    if high < low:
+        raise argparse.ArgumentTypeError(f'alt yakınlaşma üstten büyük: {text}')
+    return range(low, high + 1)
+
+TELEMETRY_PORT_KEYS = ('telemetry', 'telemetry2')
+
+def build_argument_parser():
+    parser = argparse.ArgumentParser(prog='main.py', description='111 - Roket Telemetri', allow_abbrev=False)
+    log = parser.add_argument_group('günlük')
+    log.add_argument('--quiet', action='store_true', help='sessiz uçuş modu (yalnızca uyarı/hata sayaçları)')
+    log.add_argument('--log-level', default={}, metavar='KATEGORİ:SEVİYE,...',
+                     type=_mapping_option(LOG_CATEGORIES, lambda: ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')),
+                     help='kategori bazında seviye (ör. ingest:DEBUG,judge:WARNING)')
+    ports = parser.add_argument_group('telemetri')
+    ports.add_argument('--schema', default={}, metavar='PORT:ŞEMA,...',
+                       type=_mapping_option(TELEMETRY_PORT_KEYS, lambda: tuple(TELEMETRY_SCHEMAS)),
+                       help='port başına paket şeması (ör. telemetry:anakart,telemetry2:auto)')
+    ports.add_argument('--ingest-worker', action='store_true', help='telemetri portlarını ayrı thread\'de oku')
+    ports.add_argument('--no-auto-reconnect', action='store_true', help='kopan portlara yeniden bağlanma')
+    ports.add_argument('--fast-start', action='store_true', help='port izlemeyi ilk kareden sonra başlat')
+    ports.add_argument('--replay', default={}, metavar='PORT:KAYNAK,...', type=_mapping_option(TELEMETRY_PORT_KEYS),
+                       help='kayıtlı oturumu telemetri portuna oynat (ör. telemetry:flight_logs?speed=max)')
+    ports.add_argument('--simulate', nargs='?', const='', default=None, metavar='SEÇENEKLER',
+                       help='donanımsız uçuş simülasyonu (ör. rate=200&noise=1&corrupt=0.01&format=binary)')
+    judge = parser.add_argument_group('hakem')
+    judge.add_argument('--stale-policy', default='hold', choices=FreshnessMerger.POLICIES,
+                       help='sessiz kalan kaynak için hakem paketi politikası')
+    judge.add_argument('--stale-after', default=1.0, type=_positive_float_option, metavar='SANİYE',
+                       help='kaynağın eski sayıldığı süre')
+    ui = parser.add_argument_group('arayüz')
+    ui.add_argument('--ui-hz', default=10, type=_int_option(1, 60), metavar='HZ', help='arayüz yenileme hızı (1-60)')
+    ui.add_argument('--ui-adaptive', action='store_true', help='olay döngüsü geciktiğinde yenileme hızını düşür')
+    ui.add_argument('--history-capacity', default=65536, type=_int_option(64, 1 << 22), metavar='ADET',
+                    help='kaynak başına geçmişte tutulan örnek sayısı')
+    recorder = parser.add_argument_group('uçuş kaydedici')
+    recorder.add_argument('--record-dir', default='flight_logs', metavar='DİZİN', help='kayıt dizini')
+    recorder.add_argument('--no-record', action='store_true', help='kaydediciyi başlatma')
+    tiles = parser.add_argument_group('harita')
+    tiles.add_argument('--tile-store', default='map_tiles.mbtiles', metavar='DOSYA', help='MBTiles döşeme deposu')
+    tiles.add_argument('--offline', action='store_true', help='döşemeleri yalnızca depodan sun')
+    tiles.add_argument('--tile-url', default=TILE_URL_TEMPLATE, type=_tile_url_option, metavar='ŞABLON',
+                       help='döşeme sunucusu (ör. https://tiles.example.org/{z}/{x}/{y}.png); önceden indirme '
+                            've harita sunucusu kullanır')
+    tiles.add_argument('--map-hz', default=5, type=_int_option(1, 30), metavar='HZ',
+                       help='canlı harita güncelleme hızı (1-30)')
+    tiles.add_argument('--prefetch-tiles', type=_bbox_option, metavar='GÜNEY,BATI,KUZEY,DOĞU',
+                       help='döşemeleri ve Leaflet\'i indirip çık')
+    tiles.add_argument('--tile-zooms', default=range(10, 17), type=_zoom_range_option, metavar='ALT-ÜST',
+                       help='indirilecek yakınlaşma seviyeleri (ör. 10-16)')
+    return parser
+
+def parse_command_line(argv):
+    """Seçenekleri çözer ve doğrular; hatalı seçenekte kullanım bilgisini yazıp çıkar (kod 2).
+
+    Tek tireli argümanlar (ör. -platform offscreen) Qt'ye bırakılır.
+    """
+    parser = build_argument_parser()
+    config, rest = parser.parse_known_args(argv)
+    unknown = [arg for arg in rest if arg.startswith('--')]
+    if unknown:
+        parser.error(f"bilinmeyen seçenek: {' '.join(unknown)}")
+    return config
+
+def cached_qml_file(code, name='main'):
+    """QML kodunu içerik özetiyle adlandırılmış bir önbellek dosyasına yazar ve yolunu döndürür.
+
+    Dosyadan yüklenen bileşen Qt'nin derlenmiş QML önbelleğine (.qmlc) girer; kod değişmedikçe dosya
+    yeniden yazılmadığı için sonraki açılışlarda derleme atlanır. Yazılamazsa None döner.
+    """
+    cache_dir = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+    if not cache_dir:
+        return None
+    data = code.encode('utf-8')
+    path = os.path.join(cache_dir, 'qml', f'{name}-{hashlib.sha1(data).hexdigest()[:12]}.qml')
+    try:
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path + '.tmp', 'wb') as f:
+                f.write(data)
+            os.replace(path + '.tmp', path)
+    except OSError as e:
+        log_ui.warning('⚠️ QML önbellek dosyası yazılamadı: %s', e)
+        return None
+    return path
+
 if __name__ == "__main__":
+    # Seçenekler bir kez çözülür ve doğrulanır; hatalı seçenek başlangıçta kullanım mesajıyla bildirilir
+    config = parse_command_line(sys.argv[1:])
+
+    # Günlük sistemi: konsola yazma arka plan thread'inde, --quiet ile sessiz uçuş modu
+    telemetry_logging.start(levels=config.log_level, quiet=config.quiet)
+
+    # Sahaya çıkmadan önce harita döşemelerini indirip çıkar (arayüz açılmaz)
+    if config.prefetch_tiles is not None:
+        exit_code = run_tile_prefetch(config)
+        telemetry_logging.stop()
+        sys.exit(exit_code)
+
+    # Paylaşılan OpenGL bağlamı, web motorunun QApplication'dan sonra (ilk gerektiğinde) yüklenebilmesini sağlar
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     
     # Uygulama meta verilerini ayarla
@@ -1790,59 +5780,81 @@ if __name__ == "__main__":
         # Windows'ta title bar ve pencere kontrollerini etkinleştir
         app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    startup_profile.mark('app')
     
     # Ana uygulamayı doğrudan başlat
-    print("[PYTHON] Ana uygulama başlatılıyor...")
+    log_ui.info('Ana uygulama başlatılıyor...')
     engine = QQmlApplicationEngine()
 
-    serial_manager = SerialManager()
+    serial_manager = SerialManager(config)
     
     # Varsayılan takım ID ayarla
     serial_manager.team_id = 1
-    print(f"[PYTHON] Varsayılan takım ID ayarlandı: {serial_manager.team_id}")
+    log_ui.info('Varsayılan takım ID ayarlandı: %s', serial_manager.team_id)
     
-    # Otomatik port bağlantısı devre dışı
-    print("[PYTHON] Otomatik port bağlantısı devre dışı bırakıldı")
+    # Otomatik port bağlantısı devre dışı (yalnızca --replay ile kayıt oynatılır)
+    log_ui.info('Otomatik port bağlantısı devre dışı bırakıldı')
+    for port_key, source in config.replay.items():
+        serial_manager.start_replay(port_key, source)
+    if config.simulate is not None:
+        serial_manager.start_simulation(config.simulate)
     
     engine.rootContext().setContextProperty("serialManager", serial_manager)
+    engine.rootContext().setContextProperty("telemetryTableModel", serial_manager.table_model)
+    engine.rootContext().setContextProperty("mapBridge", serial_manager.map_bridge)
+    startup_profile.mark('manager')
 
-    # QML kodunu string olarak yükle
-    print("[PYTHON] QML engine başlatılıyor...")
+    # QML kodu önbellek dosyasından yüklenir (derlenmiş bileşen önbelleği için); olmazsa string olarak
+    log_ui.info('QML engine başlatılıyor...')
     try:
-        engine.loadData(QML_CODE.encode('utf-8'))
-        print("[PYTHON] QML data yüklendi")
+        qml_path = cached_qml_file(QML_CODE)
+        if qml_path:
+            engine.load(QUrl.fromLocalFile(qml_path))
+        else:
+            engine.loadData(QML_CODE.encode('utf-8'))
+        log_ui.info('QML data yüklendi')
     except Exception as e:
-        print(f"[PYTHON] ❌ QML data yükleme hatası: {e}")
+        log_ui.error('❌ QML data yükleme hatası: %s', e)
         sys.exit(-1)
     
     if not engine.rootObjects():
-        print("[PYTHON] ❌ QML engine başarısız oldu!")
-        print("[PYTHON] Root objects:", engine.rootObjects())
+        log_ui.error('❌ QML engine başarısız oldu!')
+        log_ui.info('Root objects: %s', engine.rootObjects())
         sys.exit(-1)
     
-    print("[PYTHON] ✅ QML engine başarıyla başlatıldı")
-    print("[PYTHON] Root objects sayısı:", len(engine.rootObjects()))
+    log_ui.info('✅ QML engine başarıyla başlatıldı')
+    startup_profile.mark('qml')
+    log_ui.info('Root objects sayısı: %s', len(engine.rootObjects()))
     
     # Root object'ı al ve window'u göster
     root_objects = engine.rootObjects()
     if root_objects:
         main_window = root_objects[0]
-        print("[PYTHON] Ana pencere bulundu, gösteriliyor...")
+        log_ui.info('Ana pencere bulundu, gösteriliyor...')
         try:
             main_window.show()
             main_window.raise_()
             main_window.requestActivate()
-            print("[PYTHON] Ana pencere gösterildi")
+            log_ui.info('Ana pencere gösterildi')
+
+            # İlk kare çizilince başlangıç süresi raporlanır; --fast-start'ta ertelenen işler başlar
+            def on_first_frame():
+                main_window.frameSwapped.disconnect(on_first_frame)
+                startup_profile.mark('first_frame')
+                log_ui.info('⏱️ Başlangıç: %s', startup_profile.summary())
+                if serial_manager.fast_start:
+                    QTimer.singleShot(0, serial_manager.start_port_monitoring)
+            main_window.frameSwapped.connect(on_first_frame)
         except Exception as e:
-            print(f"[PYTHON] ❌ Pencere gösterme hatası: {e}")
+            log_ui.error('❌ Pencere gösterme hatası: %s', e)
     else:
-        print("[PYTHON] ❌ Root object bulunamadı!")
+        log_ui.error('❌ Root object bulunamadı!')
     
-    print("[PYTHON] Ana uygulama döngüsü başlatılıyor...")
+    log_ui.info('Ana uygulama döngüsü başlatılıyor...')
     
     # Windows'ta daha stabil çalışması için
     if sys.platform.startswith('win'):
-        print("[PYTHON] Windows platformu tespit edildi, özel ayarlar uygulanıyor...")
+        log_ui.info('Windows platformu tespit edildi, özel ayarlar uygulanıyor...')
         # Windows'ta QML engine'i daha stabil hale getir
         try:
             # Windows'ta ek güvenlik önlemleri
@@ -1855,11 +5867,14 @@ if __name__ == "__main__":
         except:
             pass
     
+    # Çıkışta hakem ve işçi thread'leri durdurulur, uçuş kaydı diske yazılır
+    app.aboutToQuit.connect(serial_manager.shutdown)
+
     try:
         exit_code = app.exec_()
-        print(f"[PYTHON] Uygulama döngüsü bitti, exit code: {exit_code}")
+        log_ui.info('Uygulama döngüsü bitti, exit code: %s', exit_code)
         sys.exit(exit_code)
     except Exception as e:
-        print(f"[PYTHON] ❌ Uygulama döngüsü hatası: {e}")
+        log_ui.error('❌ Uygulama döngüsü hatası: %s', e)
         sys.exit(-1)
  
\ No newline at end of file
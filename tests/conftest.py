@@ -0,0 +1,26 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    from PyQt5.QtCore import QCoreApplication
+    app = QCoreApplication.instance() or QCoreApplication(['test'])
+    yield app
+
+
+@pytest.fixture
+def manager(qapp, monkeypatch, tmp_path):
+    import main
+    from PyQt5 import sip
+    monkeypatch.chdir(tmp_path)
+    serial_manager = main.SerialManager(main.parse_command_line(['--no-record']))
+    yield serial_manager
+    serial_manager.shutdown()
+    # Qt nesneleri burada, ana thread'de silinir; çöp toplayıcıya kalırsa havuz thread'i çalışırken silinebilir
+    sip.delete(serial_manager)
@@ -0,0 +1,285 @@
+import pytest
+
+import main
+
+MALFORMED_PAYLOAD = b'{"header":82,"lat":39.1,"lng":32.5,"alt":120.0,"rms_internal":0.002,"rms_external":"ovf"}'
+
+
+def test_decoder_rejects_non_numeric_field():
+    decoder = main.AutoDecoder()
+    with pytest.raises(ValueError):
+        decoder.decode(MALFORMED_PAYLOAD)
+    assert decoder.errors == 1
+
+
+def test_decoder_accepts_ovf_rms_internal():
+    sample = main.AutoDecoder().decode(
+        b'{"header":82,"lat":39.1,"lng":32.5,"alt":120,"rms_internal":"ovf","rms_external":0.5}')
+    assert sample.rms_internal == 'ovf'
+    assert sample.altitude == 120.0 and isinstance(sample.altitude, float)
+
+
+def test_format_is_exception_safe():
+    sample = main.PayloadSample(1.0, 1.0, 39.0, 32.0, 'ovf', 'ovf', 1)
+    assert sample.display_fields()['RMS External'] == 'ovf'
+
+
+def test_malformed_packet_does_not_reach_ui(manager):
+    manager.parse_telemetry_packet(MALFORMED_PAYLOAD)
+    assert manager.gorev_yuku_sample is None
+    manager._refresh_ui()
+
+
+def test_history_rate_uses_receive_times():
+    history = main.TelemetryHistory(capacity=256)
+    for i in range(50):
+        history.append(main.MainSystemSample(*[0.0] * 11, 1, received_at=100.0 + i * 0.1))
+    assert history.rate('anakart', 2.0, now=104.95) == pytest.approx(10.0, rel=0.05)
+    # Kaynak sustuğunda hız pencereyle birlikte düşer
+    assert history.rate('anakart', 2.0, now=110.0) == 0.0
+    assert history.rate('gorev_yuku', 2.0, now=104.95) is None
+
+
+def test_table_rate_column_is_per_source(qapp):
+    history = main.TelemetryHistory(capacity=256)
+    model = main.TelemetryTableModel(history)
+    now = main.time.monotonic()
+    for i in range(20):
+        history.append(main.MainSystemSample(*[0.0] * 11, 1, received_at=now - 1.0 + i * 0.05))
+    rates = {kaynak: model.data(model.index(row, 0), model.RateRole)
+             for row, (_, kaynak, _) in enumerate(model.ROWS)}
+    assert float(rates['anakart']) == pytest.approx(20.0, rel=0.1)
+    assert rates['gorev_yuku'] == '-'
+    assert rates[None] == '-'
+
+
+def test_recorder_restart_does_not_accumulate_atexit(tmp_path):
+    recorder = main.FlightRecorder(str(tmp_path))
+    before = main.atexit._ncallbacks()
+    for _ in range(3):
+        recorder.start()
+        recorder.stop()
+    assert main.atexit._ncallbacks() == before + 1
+
+
+def test_recorder_queue_is_bounded(tmp_path, monkeypatch):
+    recorder = main.FlightRecorder(str(tmp_path), max_queue=8)
+    release = main.threading.Event()
+    encode = recorder._encode
+    monkeypatch.setattr(recorder, '_encode', lambda *item: release.wait() and encode(*item))
+    recorder.start()
+    for _ in range(100):
+        recorder.record(main.RECORD_INBOUND, 'telemetry', b'{"alt":1}')
+    assert recorder.stats()['queue_depth'] <= 8
+    assert recorder.dropped >= 100 - 8 - 1
+    release.set()
+    recorder.stop()
+    assert recorder.records + recorder.dropped == 100
+
+
+def test_hyi_encoder_is_per_thread(manager):
+    encoders = []
+    thread = main.threading.Thread(target=lambda: encoders.append(manager._hyi_encoder()))
+    thread.start()
+    thread.join()
+    assert manager._hyi_encoder() is manager._hyi_encoder()
+    assert encoders[0] is not manager._hyi_encoder()
+
+
+def test_flag_policy_judge_frame_contents():
+    merger = main.FreshnessMerger('flag', stale_after=0.5)
+    merger.update(main.MainSystemSample(100.0, 101.0, 39.0, 32.0, *[1.0] * 7, 3, received_at=10.0))
+    merger.update(main.PayloadSample(50.0, 50.0, 39.1, 32.1, 0.1, 0.2, 1, received_at=10.9))
+    ana = merger.resolve('anakart', 11.0)
+    gorev = merger.resolve('gorev_yuku', 11.0)
+    # Eski ana sistem: tüm alanlar ve durum sıfır; güncel görev yükü olduğu gibi
+    assert ana is main.EMPTY_MAIN_SYSTEM_SAMPLE and ana.status == 0
+    assert merger.is_stale('anakart') and not merger.is_stale('gorev_yuku')
+    assert merger.stale_frames == {'anakart': 1, 'gorev_yuku': 0}
+    frame = main.HyiEncoder().encode(1, 1, (
+        ana.altitude, ana.gps_altitude, ana.latitude, ana.longitude,
+        gorev.gps_altitude, gorev.latitude, gorev.longitude, 0.0, 0.0, 0.0,
+        ana.gyro_x, ana.gyro_y, ana.gyro_z, ana.acc_x, ana.acc_y, ana.acc_z, ana.angle), ana.status)
+    values = main.struct.unpack_from('<17f', frame, 6)
+    assert values[:4] == (0.0, 0.0, 0.0, 0.0)
+    assert values[4:7] == pytest.approx((50.0, 39.1, 32.1))
+    assert values[10:] == (0.0,) * 7
+    assert frame[74] == 0
+
+
+def test_parse_updates_freshness_on_ingest_path(manager):
+    manager.parse_telemetry_packet(
+        b'{"alt":10,"gpsAlt":11,"lat":39,"lng":32,"eulX":0,"eulY":0,"eulZ":0,"pitch":0,'
+        b'"accX":0,"accY":0,"accZ":0,"state":2}')
+    assert manager.freshness.latest('anakart').altitude == 10.0
+
+
+def test_scan_ports_returns_cached_list_and_emits_when_done(manager, qapp):
+    from PyQt5.QtCore import QEventLoop, QTimer
+    received = []
+    manager.portsChanged.connect(received.append)
+    assert manager.scan_ports() == manager.port_discovery.ports()
+    loop = QEventLoop()
+    manager.portsChanged.connect(lambda ports: loop.quit())
+    QTimer.singleShot(5000, loop.quit)
+    if not received:
+        loop.exec_()
+    assert len(received) == 1
+
+
+def test_tile_server_rejects_paths_outside_leaflet_dir(tmp_path):
+    leaflet = tmp_path / 'assets' / 'leaflet'
+    leaflet.mkdir(parents=True)
+    (leaflet / 'leaflet.js').write_bytes(b'L')
+    (tmp_path / 'secret.txt').write_bytes(b'secret')
+    (leaflet / 'link.txt').symlink_to(tmp_path / 'secret.txt')
+    server = main.TileServer(None, assets_dir=str(tmp_path / 'assets'))
+    assert server.resolve('/leaflet/leaflet.js') == (b'L', True)
+    for path in ('/leaflet/../../secret.txt', '/leaflet/../leaflet/../../secret.txt', '/leaflet/link.txt',
+                 '/leaflet/' + str(tmp_path / 'secret.txt'), '/leaflet/', '/leaflet/..'):
+        assert server.resolve(path) == (None, False), path
+
+
+def test_map_html_is_not_written_to_working_directory(qapp, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    path = main.create_map_html()
+    assert not (tmp_path / 'map.html').exists()
+    assert path.startswith(str(tmp_path / 'cache'))
+    assert '<!DOCTYPE html>' in open(path, encoding='utf-8').read()
+
+
+def test_ring_clear_resets_total():
+    ring = main.RingColumns(('alt',), capacity=4)
+    for i in range(6):
+        ring.append(float(i), (float(i),))
+    assert (ring.count, ring.total) == (4, 6)
+    ring.clear()
+    assert (len(ring), ring.total, ring.latest('alt'), ring.oldest_time()) == (0, 0, None, None)
+    assert ring.generation == 1
+    ring.append(10.0, (1.5,))
+    assert ring.total == 1 and ring.values('alt') == [1.5] and ring.count_since(0.0) == 1
+
+
+PAYLOAD_JSON = b'{"header":82,"lat":39.1,"lng":32.5,"alt":120.0,"rms_internal":0.002,"rms_external":0.1}'
+
+
+def test_bound_schema_rejects_other_source_packet():
+    decoder = main.MainBoardDecoder()
+    with pytest.raises(ValueError):
+        decoder.decode(PAYLOAD_JSON)
+    assert decoder.errors == 1
+    # Yalnızca gpsAlt ve state isteğe bağlıdır
+    sample = decoder.decode(b'{"alt":5,"lat":1,"lng":2,"eulX":0,"eulY":0,"eulZ":0,"pitch":0,'
+                            b'"accX":0,"accY":0,"accZ":9.8}')
+    assert (sample.gps_altitude, sample.status) == (5.0, 1)
+
+
+def test_binary_frames_follow_port_schema_and_value_checks():
+    payload = main.PayloadSample(10.0, 10.0, 39.0, 32.0, 'ovf', 0.5, 2)
+    frame = main.BINARY_SCHEMAS[0x52].encode(payload)
+    with pytest.raises(ValueError):
+        main.MainBoardDecoder().decode(frame)
+    decoded = main.PayloadDecoder().decode(frame)
+    assert decoded.rms_internal == 'ovf' and decoded.status == 2
+    assert main.AutoDecoder().decode(frame).kaynak == 'gorev_yuku'
+    bad = main.MainSystemSample(1.0, 1.0, float('nan'), 32.0, *[0.0] * 7, 1)
+    with pytest.raises(ValueError):
+        main.MainBoardDecoder().decode(main.BINARY_SCHEMAS[0x01].encode(bad))
+
+
+class _FakeJudgePort:
+    def __init__(self):
+        self.frames = []
+
+    def isOpen(self):
+        return True
+
+    def write(self, data):
+        self.frames.append(bytes(data))
+
+
+def test_judge_frame_before_any_telemetry_is_recorded_stale(manager, monkeypatch):
+    records = []
+    monkeypatch.setattr(manager, 'judge_port', _FakeJudgePort())
+    monkeypatch.setattr(manager.recorder, 'record', lambda *args: records.append(args))
+    assert manager._send_combined_data_to_judge()
+    assert records[-1][0] == main.RECORD_JUDGE_STALE
+    assert manager.freshness.stale_frames == {'anakart': 1, 'gorev_yuku': 1}
+    assert main.struct.unpack_from('<17f', manager.judge_port.frames[-1], 6) == (0.0,) * 17
+
+
+def test_freshness_drops_out_of_order_samples():
+    merger = main.FreshnessMerger('dead_reckon')
+    newer = main.MainSystemSample(*[2.0] * 11, 1, received_at=2.0)
+    older = main.MainSystemSample(*[1.0] * 11, 1, received_at=1.0)
+    merger.update(newer)
+    merger.update(older)
+    assert merger.latest('anakart') is newer and merger.out_of_order == 1
+
+
+def test_auto_reconnect_follows_device_to_new_node(manager, monkeypatch):
+    calls = []
+    monkeypatch.setattr(manager, '_connect_port', lambda *args: calls.append(args))
+    manager._port_configs['telemetry'] = ('/dev/ttyUSB0', 115200, ('A1', 0x0403, 0x6001))
+    discovery = manager.port_discovery
+    discovery._store(('/dev/ttyUSB0', 1, 1, 'B2', 0x0403, 0x6001), {'name': 'ttyUSB0', 'path': '/dev/ttyUSB0'})
+    assert calls == []
+    discovery._store(('/dev/ttyUSB1', 2, 2, 'A1', 0x0403, 0x6001), {'name': 'ttyUSB1', 'path': '/dev/ttyUSB1'})
+    assert calls == [('telemetry', '/dev/ttyUSB1', 115200)]
+    assert manager._port_configs['telemetry'][0] == '/dev/ttyUSB1'
+
+
+def test_forced_scan_keeps_open_ports_listed(manager, monkeypatch):
+    discovery = manager.port_discovery
+    removed = []
+    discovery.portRemoved.connect(removed.append)
+    usb0 = ('/dev/ttyUSB0', 1, 1, 'A1', 0x0403, 0x6001)
+    usb1 = ('/dev/ttyUSB1', 2, 2, 'B2', 0x0403, 0x6001)
+    discovery._store(usb0, {'name': 'ttyUSB0', 'path': '/dev/ttyUSB0'})
+    discovery._store(usb1, {'name': 'ttyUSB1', 'path': '/dev/ttyUSB1'})
+    manager._port_configs['telemetry'] = ('/dev/ttyUSB0', 115200, ('A1', 0x0403, 0x6001))
+    monkeypatch.setattr(manager, '_telemetry_connected', True)
+    to_probe = discovery._plan([('/dev/ttyUSB0', 'ttyUSB0', usb0), ('/dev/ttyUSB1', 'ttyUSB1', usb1)], True)
+    assert [path for path, _, _ in to_probe] == ['/dev/ttyUSB1']
+    assert removed == []
+    assert [entry['path'] for entry in discovery.ports()] == ['/dev/ttyUSB0', '/dev/ttyUSB1']
+    discovery._store(usb1, None)
+    assert removed == ['/dev/ttyUSB1']
+
+
+def test_tile_cache_backs_off_failed_fetches(monkeypatch):
+    calls = []
+
+    def unreachable(url):
+        calls.append(url)
+        raise OSError('ağ yok')
+
+    monkeypatch.setattr(main, 'fetch_url', unreachable)
+    cache = main.TileCache(None)
+    assert cache.get(1, 0, 0) is None and cache.get(1, 0, 0) is None
+    assert len(calls) == 1
+    cache.get(1, 1, 0)
+    cache.get(1, 0, 1)
+    cache.get(1, 1, 1)
+    assert len(calls) == main.TileCache.FAIL_LIMIT
+    assert cache.stats()['upstream_backoff_s'] == main.TileCache.BACKOFF_MIN_S
+
+
+def test_prefetch_limits_osm_default_and_honours_tile_url(tmp_path, monkeypatch):
+    fetched = []
+    monkeypatch.setattr(main, 'fetch_url', lambda url: fetched.append(url) or b'png')
+    store = main.TileStore(str(tmp_path / 'tiles.mbtiles'))
+    try:
+        bbox, zooms = (39.0, 32.0, 40.0, 33.0), range(10, 15)
+        with pytest.raises(ValueError, match='--tile-url'):
+            main.prefetch_tiles(store, bbox, zooms)
+        assert fetched == []
+        config = main.parse_command_line(['--tile-url=https://tiles.example.org/{z}/{x}/{y}.png'])
+        downloaded, _, failed = main.prefetch_tiles(store, bbox, zooms, template=config.tile_url)
+        assert downloaded == len(fetched) > main.OSM_PREFETCH_MAX_TILES and failed == 0
+        assert fetched[0].startswith('https://tiles.example.org/')
+    finally:
+        store.close()
+    with pytest.raises(SystemExit):
+        main.parse_command_line(['--tile-url=https://tiles.example.org/tile.png'])